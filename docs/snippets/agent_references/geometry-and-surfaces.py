@@ -71,6 +71,14 @@ calculate_surface_tilt(surface)  # 90 for a vertical wall, 0 for a roof
 # --8<-- [end:surface-calculations]
 
 
+# --8<-- [start:surface-azimuths]
+from idfkit import calculate_surface_azimuths
+
+azimuths = calculate_surface_azimuths(doc)  # {"South Wall": 180.0, ...}
+window_azimuths = calculate_surface_azimuths(doc, "FenestrationSurface:Detailed")
+# --8<-- [end:surface-azimuths]
+
+
 # --8<-- [start:surface-coords]
 from idfkit.geometry import get_surface_coords, set_surface_coords
 
@@ -92,6 +100,12 @@ calculate_zone_floor_area(doc, zone_name)
 calculate_zone_ceiling_area(doc, zone_name)
 calculate_zone_height(doc, zone_name)
 calculate_zone_volume(doc, zone_name)
+
+# Many zones: scan the surfaces once and reuse the grouping
+from idfkit.geometry import group_surfaces_by_zone
+
+by_zone = group_surfaces_by_zone(doc)
+floor_areas = {z.name: calculate_zone_floor_area(doc, z.name, surfaces_by_zone=by_zone) for z in doc["Zone"]}
 # --8<-- [end:zone-calculations]
 
 
@@ -104,6 +118,14 @@ rotate_building(doc, angle_deg=15.0, anchor=Vector3D(50, 50, 0))
 # --8<-- [end:transforms]
 
 
+# --8<-- [start:custom-transform]
+from idfkit.geometry import transform_surface_vertices
+
+# Mirror across the XZ plane; reversing the order keeps normals pointing outward.
+transform_surface_vertices(doc, lambda pts: [(x, -y, z) for x, y, z in reversed(pts)])
+# --8<-- [end:custom-transform]
+
+
 # --8<-- [start:wwr]
 from idfkit import set_wwr
 
@@ -72,6 +72,20 @@ sub_hourly = values(sched, year=2024, timestep=4)  # 35,040 quarter-hourly value
 # --8<-- [end:annual-values]
 
 
+# --8<-- [start:year-sweep]
+from datetime import date
+from idfkit.schedules.week import get_day_schedule
+from idfkit.schedules.year import get_year_values
+
+year_sched = doc["Schedule:Year"]["Office Heating"]
+july = get_year_values(year_sched, date(2024, 7, 1), date(2024, 7, 31), doc, timestep=4)  # 31 * 96 values
+
+# The day schedule a week schedule applies on a date (None means 0.0 all day)
+week_sched = doc["Schedule:Week:Daily"]["Office Week"]
+day_sched = get_day_schedule(week_sched, date(2024, 7, 15), doc)
+# --8<-- [end:year-sweep]
+
+
 # --8<-- [start:to-series]
 from idfkit.schedules import to_series
 
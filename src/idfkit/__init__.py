@@ -70,6 +70,7 @@ from .geometry import (
     Vector3D,
     calculate_surface_area,
     calculate_surface_azimuth,
+    calculate_surface_azimuths,
     calculate_surface_tilt,
     calculate_zone_ceiling_area,
     calculate_zone_floor_area,
@@ -445,6 +446,7 @@ __all__ = [
     "bounding_box",
     "calculate_surface_area",
     "calculate_surface_azimuth",
+    "calculate_surface_azimuths",
     "calculate_surface_tilt",
     "calculate_zone_ceiling_area",
     "calculate_zone_floor_area",
@@ -0,0 +1,25 @@
+"""Per-user cache directory locations."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+
+def user_cache_dir(name: str) -> Path:
+    """Return the platform-appropriate idfkit cache directory called *name*.
+
+    Uses ``%LOCALAPPDATA%\\idfkit\\cache\\<name>`` on Windows,
+    ``~/Library/Caches/idfkit/<name>`` on macOS, and
+    ``$XDG_CACHE_HOME/idfkit/<name>`` (default ``~/.cache``) elsewhere.
+    """
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+        return base / "idfkit" / "cache" / name
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "idfkit" / name
+    # Linux / other POSIX
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "idfkit" / name
@@ -30,7 +30,7 @@ from ._checker import check_compatibility, resolve_version
 from ._diff import SchemaDiff, SchemaIndex, build_schema_index, diff_schemas
 from ._extract import extract_literals
 from ._models import DIAGNOSTIC_CODES, CompatSeverity, Diagnostic, ExtractedLiteral, LiteralKind
-from ._sarif import format_sarif
+from ._sarif import format_sarif, write_sarif
 
 __all__ = [
     "DIAGNOSTIC_CODES",
@@ -46,4 +46,5 @@ __all__ = [
     "extract_literals",
     "format_sarif",
     "resolve_version",
+    "write_sarif",
 ]
@@ -0,0 +1,185 @@
+"""Content-addressed cache of extracted literals.
+
+Extraction results depend only on the source text and the extractor itself,
+so they are keyed by the SHA-256 of the source plus the idfkit version and
+kept at two levels: a bounded in-process LRU (L1) and, once enabled with
+:func:`set_disk_cache_dir`, zlib-compressed JSON files on disk (L2).
+Re-linting unchanged files then costs a hash and a small JSON decode instead
+of ``ast.parse`` plus a full visitor walk.
+
+The disk cache is off by default so that library callers of
+``extract_literals`` never write to the filesystem; the ``idfkit check`` CLI
+turns it on (unless ``--no-cache`` is given) and trims it to a size budget
+with :func:`prune_disk_cache`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .._cache_dirs import user_cache_dir
+from ._models import ExtractedLiteral, LiteralKind
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever extraction rules or the on-disk record layout change.
+_CACHE_FORMAT = 2
+
+# Most recently used extraction results, oldest first.
+_MEMORY_MAX_ENTRIES = 512
+_memory: OrderedDict[str, list[ExtractedLiteral]] = OrderedDict()
+_memory_lock = threading.Lock()
+
+# Directory of the on-disk cache, or ``None`` while it is disabled.
+_disk_cache_dir: Path | None = None
+
+# Size budget for the on-disk cache; the least recently used entries go first.
+_DISK_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _idfkit_version() -> str:
+    from .. import __version__
+
+    return __version__
+
+
+def default_literal_cache_dir() -> Path:
+    """Return the platform-appropriate cache directory for extracted literals."""
+    return user_cache_dir("literals")
+
+
+def set_disk_cache_dir(cache_dir: Path | None) -> None:
+    """Enable the on-disk cache under *cache_dir*, or disable it with ``None``."""
+    global _disk_cache_dir
+    _disk_cache_dir = cache_dir
+
+
+def get_disk_cache_dir() -> Path | None:
+    """Return the on-disk cache directory, or ``None`` while the disk cache is disabled."""
+    return _disk_cache_dir
+
+
+def prune_disk_cache(max_bytes: int | None = None) -> None:
+    """Delete the least recently used disk entries until the cache fits in *max_bytes*.
+
+    Recency is the file modification time, which :func:`load` refreshes on
+    every disk hit. *max_bytes* defaults to :data:`_DISK_MAX_BYTES`. Does
+    nothing while the disk cache is disabled; failures are logged and ignored.
+    """
+    cache_dir = _disk_cache_dir
+    if cache_dir is None:
+        return
+    budget = _DISK_MAX_BYTES if max_bytes is None else max_bytes
+    entries: list[tuple[float, int, str]] = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json.z"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        logger.debug("Could not scan literal cache %s", cache_dir, exc_info=True)
+        return
+    total = sum(size for _, size, _ in entries)
+    entries.sort()
+    for _, size, path in entries:
+        if total <= budget:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            logger.debug("Could not remove literal cache entry %s", path, exc_info=True)
+            continue
+        total -= size
+
+
+def source_key(source: str) -> str:
+    """Return the cache key for *source*."""
+    h = hashlib.sha256(source.encode("utf-8", "surrogatepass"))
+    h.update(f"\0{_idfkit_version()}\0{_CACHE_FORMAT}".encode())
+    return h.hexdigest()
+
+
+def _encode(literals: list[ExtractedLiteral]) -> bytes:
+    records = [
+        [lit.value, lit.kind.value, lit.line, lit.col, lit.end_col, lit.obj_type, lit.field_name] for lit in literals
+    ]
+    return zlib.compress(json.dumps(records, separators=(",", ":")).encode("utf-8"))
+
+
+def _decode(data: bytes) -> list[ExtractedLiteral]:
+    records: list[list[Any]] = json.loads(zlib.decompress(data))
+    intern = sys.intern
+    return [
+        ExtractedLiteral(
+            value=intern(value),
+            kind=LiteralKind(kind),
+            line=line,
+            col=col,
+            end_col=end_col,
+            obj_type=None if obj_type is None else intern(obj_type),
+            field_name=None if field_name is None else intern(field_name),
+        )
+        for value, kind, line, col, end_col, obj_type, field_name in records
+    ]
+
+
+def _remember(key: str, literals: list[ExtractedLiteral]) -> None:
+    """Add *literals* to the in-process cache, evicting the least recently used entry when full."""
+    with _memory_lock:
+        _memory[key] = literals
+        _memory.move_to_end(key)
+        if len(_memory) > _MEMORY_MAX_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def load(key: str) -> list[ExtractedLiteral] | None:
+    """Return the cached literals for *key*, or ``None`` on a miss."""
+    with _memory_lock:
+        cached = _memory.get(key)
+        if cached is not None:
+            _memory.move_to_end(key)
+    if cached is not None:
+        return list(cached)
+    cache_dir = _disk_cache_dir
+    if cache_dir is None:
+        return None
+    path = cache_dir / f"{key}.json.z"
+    try:
+        literals = _decode(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError, zlib.error):
+        logger.debug("Ignoring unreadable literal cache entry %s", path, exc_info=True)
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    _remember(key, literals)
+    return list(literals)
+
+
+def store(key: str, literals: list[ExtractedLiteral]) -> None:
+    """Cache *literals* under *key* in memory and, when enabled, best-effort on disk."""
+    _remember(key, list(literals))
+    cache_dir = _disk_cache_dir
+    if cache_dir is None:
+        return
+    path = cache_dir / f"{key}.json.z"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False, suffix=".tmp") as tmp:
+            tmp.write(_encode(literals))
+        os.replace(tmp.name, path)
+    except OSError:
+        logger.debug("Could not write literal cache entry %s", path, exc_info=True)
@@ -6,22 +6,199 @@ for cross-version EnergyPlus compatibility issues.
 
 from __future__ import annotations
 
-from ..schema import EpJSONSchema, get_schema
-from ..versions import find_closest_version, version_string
-from ._diff import SchemaIndex, build_schema_index
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from .._cache_dirs import user_cache_dir
+from ..schema import EpJSONSchema, get_schema, get_schema_manager
+from ..versions import find_closest_version, version_dirname, version_string
+from ._diff import SchemaIndex, build_schema_index, intern_index_values
 from ._extract import extract_literals
 from ._models import CompatSeverity, Diagnostic, ExtractedLiteral, LiteralKind
 
+logger = logging.getLogger(__name__)
+
 # Cache of schema indices, keyed by version tuple.
 _index_cache: dict[tuple[int, int, int], SchemaIndex] = {}
 
+# Per-version build locks so concurrent cache misses build each index only once.
+_index_locks: dict[tuple[int, int, int], threading.Lock] = {}
+_index_locks_guard = threading.Lock()
+
+# Bump whenever the on-disk layout of SchemaIndex changes so stale files are ignored.
+_INDEX_CACHE_FORMAT = 5
+
+# Directory of the on-disk index cache, or ``None`` while it is disabled.
+_index_cache_dir: Path | None = None
+
+_SCHEMA_FILENAMES = ("Energy+.schema.epJSON.gz", "Energy+.schema.epJSON")
+
+
+def default_index_cache_dir() -> Path:
+    """Return the platform-appropriate cache directory for serialized schema indices."""
+    return user_cache_dir("compat")
+
+
+def set_index_cache_dir(cache_dir: Path | None) -> None:
+    """Enable the on-disk index cache under *cache_dir*, or disable it with ``None``.
+
+    The cache is off by default so that library callers never write to the
+    filesystem; the ``idfkit check`` CLI turns it on.
+    """
+    global _index_cache_dir
+    _index_cache_dir = cache_dir
+
+
+def get_index_cache_dir() -> Path | None:
+    """Return the on-disk index cache directory, or ``None`` while it is disabled."""
+    return _index_cache_dir
+
+
+def _index_cache_path(version: tuple[int, int, int]) -> Path | None:
+    """Return the on-disk cache path for *version*.
+
+    Returns ``None`` while the disk cache is disabled or if the schema is not
+    bundled. The file name embeds a hash of the bundled schema file so an
+    index built from an older schema is never reused.
+    """
+    cache_dir = _index_cache_dir
+    if cache_dir is None:
+        return None
+    schema_dir = get_schema_manager().bundled_dir / version_dirname(version)
+    for name in _SCHEMA_FILENAMES:
+        schema_path = schema_dir / name
+        if schema_path.is_file():
+            digest = hashlib.sha256(schema_path.read_bytes()).hexdigest()[:16]
+            major, minor, patch = version
+            filename = f"index-v{_INDEX_CACHE_FORMAT}-{major}-{minor}-{patch}-{digest}.json.z"
+            return cache_dir / filename
+    return None
+
+
+def _encode_index(index: SchemaIndex) -> bytes:
+    """Serialize the constructor fields of *index* as zlib-compressed JSON."""
+    record = {
+        "version": list(index.version),
+        "object_types": sorted(index.object_types),
+        "choices": [[obj_type, field_name, sorted(values)] for (obj_type, field_name), values in index.choices.items()],
+        "groups": index.groups,
+    }
+    return zlib.compress(json.dumps(record, separators=(",", ":")).encode("utf-8"))
+
+
+def _decode_index(data: bytes) -> SchemaIndex:
+    """Rebuild a :class:`SchemaIndex` from :func:`_encode_index` output."""
+    record: dict[str, Any] = json.loads(zlib.decompress(data))
+    major, minor, patch = (int(part) for part in record["version"])
+    intern = sys.intern
+    groups: dict[str, str] = record["groups"]
+    index = SchemaIndex(
+        version=(major, minor, patch),
+        object_types=frozenset(intern(t) for t in record["object_types"]),
+        choices={
+            (intern(obj_type), intern(field_name)): frozenset(intern(v) for v in values)
+            for obj_type, field_name, values in record["choices"]
+        },
+        groups={intern(t): intern(g) for t, g in groups.items()},
+    )
+    return intern_index_values(index)
+
+
+def _load_index_from_disk(path: Path) -> SchemaIndex | None:
+    """Load a cached :class:`SchemaIndex`, returning ``None`` on any failure."""
+    try:
+        return _decode_index(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError, KeyError, AttributeError, zlib.error):
+        logger.debug("Ignoring unreadable schema index cache %s", path, exc_info=True)
+        return None
+
+
+def _save_index_to_disk(path: Path, index: SchemaIndex) -> None:
+    """Atomically write *index* to *path*; failures are logged and ignored.
+
+    Files left behind for the same version by an older cache format or
+    schema are removed, so each version keeps a single cache file.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False, suffix=".tmp") as tmp:
+            tmp.write(_encode_index(index))
+        os.replace(tmp.name, path)
+    except OSError:
+        logger.debug("Could not write schema index cache %s", path, exc_info=True)
+        return
+    major, minor, patch = index.version
+    for stale in path.parent.glob(f"index-v*-{major}-{minor}-{patch}-*.json.z"):
+        if stale != path:
+            try:
+                stale.unlink()
+            except OSError:
+                logger.debug("Could not remove stale schema index cache %s", stale, exc_info=True)
+
 
 def _get_index(version: tuple[int, int, int]) -> SchemaIndex:
-    """Load and cache a :class:`SchemaIndex` for *version*."""
-    if version not in _index_cache:
-        schema: EpJSONSchema = get_schema(version)
-        _index_cache[version] = build_schema_index(schema)
-    return _index_cache[version]
+    """Load and cache a :class:`SchemaIndex` for *version*.
+
+    Indices are memoized in-process and, once enabled with
+    :func:`set_index_cache_dir`, persisted as compressed JSON on disk, so
+    repeated CLI runs skip the schema load and index build entirely.
+    """
+    index = _index_cache.get(version)
+    if index is not None:
+        return index
+
+    with _index_locks_guard:
+        lock = _index_locks.setdefault(version, threading.Lock())
+    with lock:
+        index = _index_cache.get(version)
+        if index is not None:
+            return index
+
+        cache_path = _index_cache_path(version)
+        if cache_path is not None:
+            index = _load_index_from_disk(cache_path)
+        if index is None:
+            schema: EpJSONSchema = get_schema(version)
+            index = build_schema_index(schema)
+            if cache_path is not None:
+                _save_index_to_disk(cache_path, index)
+
+        _index_cache[version] = index
+        return index
+
+
+def _get_indices(targets: list[tuple[int, int, int]]) -> dict[tuple[int, int, int], SchemaIndex]:
+    """Load the indices for all *targets*, building cache misses concurrently.
+
+    Each version's schema load (gzip + JSON decode) and index build is
+    independent, so misses are dispatched to a thread pool.
+    """
+    missing = [v for v in targets if v not in _index_cache]
+    if len(missing) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(missing), os.cpu_count() or 2)) as executor:
+            list(executor.map(_get_index, missing))
+    return {v: _get_index(v) for v in targets}
+
+
+def preload_indices(targets: list[tuple[int, int, int]]) -> None:
+    """Load the indices for *targets* into the process-wide and, when enabled, on-disk caches.
+
+    Called by ``idfkit check`` before it starts worker processes, so the
+    indices are built once rather than once per worker.
+    """
+    _get_indices(targets)
 
 
 def resolve_version(version: tuple[int, int, int]) -> tuple[int, int, int]:
@@ -38,25 +215,30 @@ def resolve_version(version: tuple[int, int, int]) -> tuple[int, int, int]:
     return closest
 
 
+@lru_cache(maxsize=32)
 def _build_allowed_types(
-    indices: dict[tuple[int, int, int], SchemaIndex],
-    include_groups: set[str] | None,
-    exclude_groups: set[str] | None,
-) -> set[str] | None:
-    """Build the set of object types that pass group filters, or ``None`` if no filter is active."""
+    targets: tuple[tuple[int, int, int], ...],
+    include_groups: frozenset[str] | None,
+    exclude_groups: frozenset[str] | None,
+) -> frozenset[str] | None:
+    """Build the case-folded set of object types that pass group filters, or ``None`` if no filter is active.
+
+    Memoized per ``(targets, include_groups, exclude_groups)`` so linting many
+    files with the same options merges the group maps only once.
+    """
     if include_groups is None and exclude_groups is None:
         return None
     merged_groups: dict[str, str] = {}
-    for index in indices.values():
-        merged_groups.update(index.groups)
+    for version in targets:
+        merged_groups.update(_get_index(version).groups)
     allowed: set[str] = set()
     for obj_type, group in merged_groups.items():
         if include_groups is not None and group not in include_groups:
             continue
         if exclude_groups is not None and group in exclude_groups:
             continue
-        allowed.add(obj_type)
-    return allowed
+        allowed.add(obj_type.casefold())
+    return frozenset(allowed)
 
 
 def _literal_obj_type(literal: ExtractedLiteral) -> str | None:
@@ -66,12 +248,6 @@ def _literal_obj_type(literal: ExtractedLiteral) -> str | None:
     return literal.obj_type
 
 
-def _contains_object_type_case_insensitive(object_type: str, available_types: set[str] | frozenset[str]) -> bool:
-    """Return whether *object_type* exists in *available_types* using case-insensitive matching."""
-    needle = object_type.casefold()
-    return any(candidate.casefold() == needle for candidate in available_types)
-
-
 def check_compatibility(
     source: str,
     filename: str,
@@ -107,49 +283,92 @@ def check_compatibility(
     if not literals:
         return []
 
-    indices: dict[tuple[int, int, int], SchemaIndex] = {v: _get_index(v) for v in targets}
-    allowed_types = _build_allowed_types(indices, include_groups, exclude_groups)
+    indices = _get_indices(targets)
+    allowed_types = _build_allowed_types(
+        tuple(targets),
+        frozenset(include_groups) if include_groups is not None else None,
+        frozenset(exclude_groups) if exclude_groups is not None else None,
+    )
 
+    partial_types = _partial_object_types(indices)
     diagnostics: list[Diagnostic] = []
+    # Per-field choice sets are shared by every literal setting that field.
+    choice_sets: dict[tuple[str, str], list[tuple[tuple[int, int, int], frozenset[str]]]] = {}
     for literal in literals:
         if allowed_types is not None:
             ot = _literal_obj_type(literal)
-            if ot is not None and not _contains_object_type_case_insensitive(ot, allowed_types):
+            if ot is not None and ot.casefold() not in allowed_types:
                 continue
 
         if literal.kind == LiteralKind.OBJECT_TYPE:
-            _check_object_type(literal, indices, filename, diagnostics)
+            _check_object_type(literal, partial_types, filename, diagnostics)
         elif literal.kind == LiteralKind.CHOICE_VALUE:
-            _check_choice_value(literal, indices, filename, diagnostics)
+            _check_choice_value(literal, indices, filename, diagnostics, choice_sets)
 
     diagnostics.sort(key=lambda d: (d.line, d.col))
     return diagnostics
 
 
+# (target indices, table) per target tuple; see _partial_object_types. Bounded
+# like _build_allowed_types, oldest target tuple evicted first.
+_PARTIAL_TYPES_MAX_ENTRIES = 32
+_partial_types_cache: dict[
+    tuple[tuple[int, int, int], ...],
+    tuple[tuple[SchemaIndex, ...], dict[str, tuple[tuple[int, int, int], tuple[tuple[int, int, int], ...]]]],
+] = {}
+
+
+def _partial_object_types(
+    indices: dict[tuple[int, int, int], SchemaIndex],
+) -> dict[str, tuple[tuple[int, int, int], tuple[tuple[int, int, int], ...]]]:
+    """Map case-folded object types found in some but not all *indices* to ``(ref_version, missing_versions)``.
+
+    Built once per set of target indices (and looked up once per
+    :func:`check_compatibility` call) so that each object-type literal
+    costs a single dict lookup rather than one set probe per version. Types
+    present everywhere or nowhere are omitted -- neither yields a diagnostic.
+    """
+    versions = tuple(sorted(indices))
+    index_objs = tuple(indices[v] for v in versions)
+    cached = _partial_types_cache.get(versions)
+    if cached is not None and all(a is b for a, b in zip(cached[0], index_objs, strict=True)):
+        return cached[1]
+
+    present: dict[str, list[tuple[int, int, int]]] = {}
+    for version, index in zip(versions, index_objs, strict=True):
+        for type_cf in index.object_types_cf:
+            present.setdefault(type_cf, []).append(version)
+    table: dict[str, tuple[tuple[int, int, int], tuple[tuple[int, int, int], ...]]] = {}
+    for type_cf, present_in in present.items():
+        if len(present_in) < len(versions):
+            # present_in follows the sorted version order, so [0] is the oldest.
+            table[type_cf] = (present_in[0], tuple(v for v in versions if v not in present_in))
+    _partial_types_cache.pop(versions, None)
+    if len(_partial_types_cache) >= _PARTIAL_TYPES_MAX_ENTRIES:
+        del _partial_types_cache[next(iter(_partial_types_cache))]
+    _partial_types_cache[versions] = (index_objs, table)
+    return table
+
+
 def _check_object_type(
     literal: ExtractedLiteral,
-    indices: dict[tuple[int, int, int], SchemaIndex],
+    partial_types: dict[str, tuple[tuple[int, int, int], tuple[tuple[int, int, int], ...]]],
     filename: str,
     out: list[Diagnostic],
 ) -> None:
-    """Emit diagnostics for an object-type literal missing in some target versions."""
-    present_in: list[tuple[int, int, int]] = []
-    absent_in: list[tuple[int, int, int]] = []
-
-    for version, index in indices.items():
-        if _contains_object_type_case_insensitive(literal.value, index.object_types):
-            present_in.append(version)
-        else:
-            absent_in.append(version)
+    """Emit diagnostics for an object-type literal missing in some target versions.
 
-    if not absent_in or not present_in:
+    *partial_types* is the :func:`_partial_object_types` table for the targets.
+    """
+    entry = partial_types.get(literal.value.casefold())
+    if entry is None:
         # Exists everywhere or nowhere -- nothing to report.
         return
 
-    # Use the first present version as the reference.
-    ref_version = sorted(present_in)[0]
+    # The first present version is the reference.
+    ref_version, absent_in = entry
 
-    for missing_version in sorted(absent_in):
+    for missing_version in absent_in:
         out.append(
             Diagnostic(
                 code="C001",
@@ -169,48 +388,67 @@ def _check_object_type(
         )
 
 
+def _resolve_choice_sets(
+    key_cf: tuple[str, str],
+    indices: dict[tuple[int, int, int], SchemaIndex],
+) -> list[tuple[tuple[int, int, int], frozenset[str]]]:
+    """Return ``(version, case-folded choices)`` for every version where *key_cf* is an enum field.
+
+    Versions where the field has no enum are omitted -- the check is not
+    applicable there.
+    """
+    resolved: list[tuple[tuple[int, int, int], frozenset[str]]] = []
+    for version, index in indices.items():
+        choices_cf = index.choices_cf.get(key_cf)
+        if choices_cf is not None:
+            resolved.append((version, choices_cf))
+    return resolved
+
+
 def _check_choice_value(
     literal: ExtractedLiteral,
     indices: dict[tuple[int, int, int], SchemaIndex],
     filename: str,
     out: list[Diagnostic],
+    choice_sets: dict[tuple[str, str], list[tuple[tuple[int, int, int], frozenset[str]]]] | None = None,
 ) -> None:
-    """Emit diagnostics for a choice value that is absent in some target versions."""
+    """Emit diagnostics for a choice value that is absent in some target versions.
+
+    *choice_sets* memoizes :func:`_resolve_choice_sets` by field key so that
+    literals sharing an ``(object_type, field_name)`` resolve it only once.
+    """
     obj_type = literal.obj_type
     field_name = literal.field_name
     if obj_type is None or field_name is None:
         return
 
+    # Matching is case-insensitive on object type, field name, and value.
+    value_cf = literal.value.casefold()
+    key_cf = (obj_type.casefold(), field_name.casefold())
+
+    if choice_sets is None:
+        resolved = _resolve_choice_sets(key_cf, indices)
+    else:
+        resolved = choice_sets.get(key_cf)
+        if resolved is None:
+            resolved = choice_sets[key_cf] = _resolve_choice_sets(key_cf, indices)
+
     # Collect which versions have this field as an enum and include/exclude the value.
     present_in: list[tuple[int, int, int]] = []
     absent_in: list[tuple[int, int, int]] = []
 
-    for version, index in indices.items():
-        choices = index.choices.get((obj_type, field_name))
-        if choices is None:
-            canonical_obj_type = next(
-                (candidate for candidate in index.object_types if candidate.casefold() == obj_type.casefold()),
-                None,
-            )
-            if canonical_obj_type is not None:
-                choices = index.choices.get((canonical_obj_type, field_name))
-        if choices is None:
-            # Field has no enum in this version -- not applicable; skip.
-            continue
-        if literal.value in choices:
+    for version, choices_cf in resolved:
+        if value_cf in choices_cf:
             present_in.append(version)
         else:
-            # Case-insensitive fallback
-            choices_lower = {c.lower() for c in choices}
-            if literal.value.lower() in choices_lower:
-                present_in.append(version)
-            else:
-                absent_in.append(version)
+            absent_in.append(version)
 
     if not absent_in or not present_in:
         return
 
     ref_version = sorted(present_in)[0]
+    # Report the schema's spelling of the object type, not the literal's casing.
+    display_obj_type = indices[ref_version].object_type_by_cf.get(key_cf[0], obj_type)
 
     for missing_version in sorted(absent_in):
         out.append(
@@ -218,7 +456,7 @@ def _check_choice_value(
                 code="C002",
                 message=(
                     f"Choice value '{literal.value}' for "
-                    f"{obj_type}.{field_name} not found in "
+                    f"{display_obj_type}.{field_name} not found in "
                     f"{version_string(missing_version)} "
                     f"(exists in {version_string(ref_version)})"
                 ),
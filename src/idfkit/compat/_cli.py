@@ -26,20 +26,28 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict
+from itertools import repeat
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
 
 from ..exceptions import EnergyPlusNotFoundError, MigrationError, UnsupportedVersionError
 from ..migration import MigrationProgress, MigrationReport, migrate
 from ..versions import ENERGYPLUS_VERSIONS, LATEST_VERSION, version_string
 from ..weather._cli import add_subparser as _add_tmy_subparser
 from ..weather._cli import run_tmy as _run_tmy
-from ._checker import check_compatibility, resolve_version
+from . import (
+    _ast_cache,
+    _checker,  # pyright: ignore[reportPrivateUsage]
+)
+from ._checker import check_compatibility, preload_indices, resolve_version
+from ._extract import may_contain_literals
 from ._models import DIAGNOSTIC_CODES, CompatSeverity, Diagnostic
-from ._sarif import format_sarif
+from ._sarif import write_sarif
 
 if TYPE_CHECKING:
     from ..document import IDFDocument
@@ -107,13 +115,11 @@ def _build_parser() -> argparse.ArgumentParser:
     version_group.add_argument(
         "--from",
         dest="from_version",
-        type=_parse_version_spec,
         help="Source EnergyPlus version (e.g. 24.2)",
     )
     check.add_argument(
         "--to",
         dest="to_version",
-        type=_parse_version_spec,
         help="Target EnergyPlus version (required with --from)",
     )
     version_group.add_argument(
@@ -184,6 +190,15 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Minimum severity level to report (warning or error). Default: report all.",
     )
 
+    # ---- caching ----
+    check.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        default=False,
+        help="Do not read or write the on-disk literal and schema index caches.",
+    )
+
     migrate_cmd = sub.add_parser(
         "migrate",
         help="Forward-migrate an IDF model to a newer EnergyPlus version",
@@ -259,44 +274,38 @@ def _build_parser() -> argparse.ArgumentParser:
 
 
 def _resolve_targets(args: argparse.Namespace) -> list[tuple[int, int, int]]:
-    """Resolve the user-specified versions to actual bundled schema versions."""
-    raw_versions: list[tuple[int, int, int]] = []
+    """Resolve the user-specified versions to actual bundled schema versions.
 
+    Each spec is parsed, resolved and deduplicated in a single pass; every
+    invalid or unsupported spec is reported together before exiting.
+    """
     if args.targets is not None:
-        for part in args.targets.split(","):
-            try:
-                raw_versions.append(_parse_version_spec(part))
-            except argparse.ArgumentTypeError as exc:
-                print(f"error: {exc}", file=sys.stderr)
-                sys.exit(2)
+        specs: list[str] = args.targets.split(",")
     else:
         if args.from_version is None or args.to_version is None:
             print("error: --from and --to must both be specified", file=sys.stderr)
             sys.exit(2)
-        raw_versions.append(args.from_version)
-        raw_versions.append(args.to_version)
+        specs = [args.from_version, args.to_version]
 
-    resolved: list[tuple[int, int, int]] = []
-    for v in raw_versions:
+    seen: set[tuple[int, int, int]] = set()
+    errors: list[str] = []
+    for spec in specs:
         try:
-            resolved.append(resolve_version(v))
-        except ValueError as exc:
-            print(f"error: {exc}", file=sys.stderr)
-            sys.exit(2)
+            version = resolve_version(_parse_version_spec(spec))
+        except (argparse.ArgumentTypeError, ValueError) as exc:
+            errors.append(str(exc))
+            continue
+        seen.add(version)
 
-    # Deduplicate while preserving order
-    seen: set[tuple[int, int, int]] = set()
-    unique: list[tuple[int, int, int]] = []
-    for v in resolved:
-        if v not in seen:
-            seen.add(v)
-            unique.append(v)
+    if errors:
+        print(f"error: {'; '.join(errors)}", file=sys.stderr)
+        sys.exit(2)
 
-    if len(unique) < 2:
+    if len(seen) < 2:
         print("error: at least two distinct target versions are required", file=sys.stderr)
         sys.exit(2)
 
-    return sorted(unique)
+    return sorted(seen)
 
 
 def _parse_code_list(spec: str) -> set[str]:
@@ -339,20 +348,45 @@ def _format_text(diagnostics: list[Diagnostic]) -> str:
     return "\n".join(lines)
 
 
-def _format_json(diagnostics: list[Diagnostic], targets: list[tuple[int, int, int]]) -> str:
-    """Format diagnostics as a JSON string."""
-    error_count = sum(1 for d in diagnostics if d.severity == CompatSeverity.ERROR)
-    warning_count = sum(1 for d in diagnostics if d.severity == CompatSeverity.WARNING)
+_DIAGNOSTICS_PLACEHOLDER = "\0diagnostics\0"
+
+
+def _write_json(diagnostics: list[Diagnostic], targets: list[tuple[int, int, int]], stream: TextIO) -> None:
+    """Write diagnostics to *stream* as JSON, one diagnostic at a time.
+
+    The envelope is dumped around a placeholder and each ``Diagnostic.to_dict()``
+    is dumped into the ``diagnostics`` array as it is written, so the whole
+    document is never held in memory. The output matches
+    ``json.dumps(payload, indent=2)``.
+    """
+    error_count = 0
+    warning_count = 0
+    for d in diagnostics:
+        if d.severity is CompatSeverity.ERROR:
+            error_count += 1
+        elif d.severity is CompatSeverity.WARNING:
+            warning_count += 1
     payload = {
         "targets": [version_string(v) for v in targets],
-        "diagnostics": [d.to_dict() for d in diagnostics],
+        "diagnostics": [_DIAGNOSTICS_PLACEHOLDER] if diagnostics else [],
         "summary": {
             "total": len(diagnostics),
             "errors": error_count,
             "warnings": warning_count,
         },
     }
-    return json.dumps(payload, indent=2)
+    envelope = json.dumps(payload, indent=2)
+    if not diagnostics:
+        stream.write(envelope)
+        return
+    head, tail = envelope.split(json.dumps(_DIAGNOSTICS_PLACEHOLDER), 1)
+    stream.write(head)
+    for i, d in enumerate(diagnostics):
+        if i:
+            stream.write(",\n    ")
+        # Re-indent to the array's depth; JSON escapes newlines inside strings.
+        stream.write(json.dumps(d.to_dict(), indent=2).replace("\n", "\n    "))
+    stream.write(tail)
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -372,6 +406,77 @@ def main(argv: list[str] | None = None) -> None:
         sys.exit(_run_tmy(args))
 
 
+# Below this many files a process pool costs more to start than it saves.
+_PARALLEL_MIN_FILES = 4
+
+
+def _check_file(
+    filepath_str: str,
+    targets: list[tuple[int, int, int]],
+    include_groups: set[str] | None,
+    exclude_groups: set[str] | None,
+) -> list[Diagnostic]:
+    """Read and lint one file; runs in a worker process for multi-file checks."""
+    filepath = Path(filepath_str)
+    raw = filepath.read_bytes()
+    if not may_contain_literals(raw):
+        return []
+    return check_compatibility(
+        raw.decode("utf-8"),
+        str(filepath),
+        targets,
+        include_groups=include_groups,
+        exclude_groups=exclude_groups,
+    )
+
+
+def _init_check_worker(
+    literal_cache_dir: Path | None, index_cache_dir: Path | None, targets: list[tuple[int, int, int]]
+) -> None:
+    """Give a worker process the parent's disk-cache settings and the target schema indices.
+
+    Forked workers inherit the indices the parent warmed; spawned ones read
+    them back from the on-disk index cache the parent just populated.
+    """
+    _ast_cache.set_disk_cache_dir(literal_cache_dir)
+    _checker.set_index_cache_dir(index_cache_dir)
+    preload_indices(targets)
+
+
+def _check_files(
+    files: list[str],
+    targets: list[tuple[int, int, int]],
+    include_groups: set[str] | None,
+    exclude_groups: set[str] | None,
+) -> Iterator[list[Diagnostic]]:
+    """Yield per-file diagnostics in input order, using a process pool for larger batches."""
+    workers = min(len(files), os.cpu_count() or 1)
+    if len(files) < _PARALLEL_MIN_FILES or workers < 2:
+        for filepath_str in files:
+            yield _check_file(filepath_str, targets, include_groups, exclude_groups)
+        return
+    preload_indices(targets)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_check_worker,
+        initargs=(_ast_cache.get_disk_cache_dir(), _checker.get_index_cache_dir(), targets),
+    ) as pool:
+        yield from pool.map(_check_file, files, repeat(targets), repeat(include_groups), repeat(exclude_groups))
+
+
+def _configure_disk_caches(*, enabled: bool) -> None:
+    """Persist extraction results and schema indices between CLI runs unless disabled.
+
+    Re-linting unchanged files is common from the CLI, so it opts in to the
+    disk caches that library callers leave off, trimming stale literals first.
+    """
+    if not enabled:
+        return
+    _ast_cache.set_disk_cache_dir(_ast_cache.default_literal_cache_dir())
+    _ast_cache.prune_disk_cache()
+    _checker.set_index_cache_dir(_checker.default_index_cache_dir())
+
+
 def _run_check(args: argparse.Namespace) -> None:
     """Execute the ``check`` subcommand."""
     targets = _resolve_targets(args)
@@ -395,27 +500,22 @@ def _run_check(args: argparse.Namespace) -> None:
                 )
                 sys.exit(2)
 
-    all_diagnostics: list[Diagnostic] = []
-
     for filepath_str in args.files:
         filepath = Path(filepath_str)
         if not filepath.is_file():
             print(f"error: file not found: {filepath}", file=sys.stderr)
             sys.exit(2)
 
-        source = filepath.read_text(encoding="utf-8")
-        try:
-            diagnostics = check_compatibility(
-                source,
-                str(filepath),
-                targets,
-                include_groups=include_groups,
-                exclude_groups=exclude_groups,
-            )
-        except SyntaxError as exc:
-            print(f"error: failed to parse {filepath}: {exc}", file=sys.stderr)
-            sys.exit(2)
-        all_diagnostics.extend(diagnostics)
+    _configure_disk_caches(enabled=not args.no_cache)
+
+    all_diagnostics: list[Diagnostic] = []
+    try:
+        for diagnostics in _check_files(args.files, targets, include_groups, exclude_groups):
+            all_diagnostics.extend(diagnostics)
+    except SyntaxError as exc:
+        # ast.parse sets the offending file's path on the error.
+        print(f"error: failed to parse {exc.filename}: {exc}", file=sys.stderr)
+        sys.exit(2)
 
     # Post-check filtering (rule codes, severity)
     all_diagnostics = _filter_diagnostics(
@@ -427,9 +527,11 @@ def _run_check(args: argparse.Namespace) -> None:
 
     # Output
     if args.sarif_output:
-        print(format_sarif(all_diagnostics))
+        write_sarif(all_diagnostics, sys.stdout)
+        sys.stdout.write("\n")
     elif args.json_output:
-        print(_format_json(all_diagnostics, targets))
+        _write_json(all_diagnostics, targets, sys.stdout)
+        sys.stdout.write("\n")
     else:
         print(_format_text(all_diagnostics))
 
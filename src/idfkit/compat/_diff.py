@@ -6,13 +6,24 @@ from ``EpJSONSchema`` instances, then computes diffs between versions.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, cast
 
 from ..schema import EpJSONSchema
 
+# Process-wide table of choice sets. The same sets recur across fields
+# (``Yes``/``No``, roughness classes...) and across versions, so every index
+# shares a single frozenset object per distinct set of values.
+_VALUE_SETS: dict[frozenset[str], frozenset[str]] = {}
 
-@dataclass(frozen=True)
+
+def _intern_values(values: frozenset[str]) -> frozenset[str]:
+    """Return the shared frozenset equal to *values*."""
+    return _VALUE_SETS.setdefault(values, values)
+
+
+@dataclass(frozen=True, slots=True)
 class SchemaIndex:
     """Pre-computed index of user-facing string identifiers in a schema.
 
@@ -23,15 +34,65 @@ class SchemaIndex:
             valid enum/choice string values for that field.
         groups: Mapping from object type name to its IDD group
             (e.g. ``"Zone"`` → ``"Thermal Zones and Surfaces"``).
+        object_types_cf: Case-folded copy of *object_types*, derived on
+            construction for O(1) case-insensitive membership tests.
+        object_type_by_cf: Mapping from case-folded object type name to its
+            canonical spelling in the schema (e.g. ``"zone"`` → ``"Zone"``).
+        choices_cf: Case-folded copy of *choices* (both the
+            ``(object_type, field_name)`` key and the values), derived on
+            construction for O(1) case-insensitive choice lookups.
+        by_type: *choices* bucketed by object type
+            (``{"Material": {"roughness": {...}}}``), derived on construction
+            so per-type work does not have to scan every choice key.
     """
 
     version: tuple[int, int, int]
     object_types: frozenset[str]
     choices: dict[tuple[str, str], frozenset[str]]
     groups: dict[str, str] = field(default_factory=lambda: {})
-
-
-@dataclass(frozen=True)
+    object_types_cf: frozenset[str] = field(init=False, repr=False, compare=False)
+    object_type_by_cf: dict[str, str] = field(init=False, repr=False, compare=False)
+    choices_cf: dict[tuple[str, str], frozenset[str]] = field(init=False, repr=False, compare=False)
+    by_type: dict[str, dict[str, frozenset[str]]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        choices_cf: dict[tuple[str, str], frozenset[str]] = {}
+        by_type: dict[str, dict[str, frozenset[str]]] = {}
+        for (obj_type, field_name), values in self.choices.items():
+            fields = by_type.get(obj_type)
+            if fields is None:
+                fields = by_type[obj_type] = {}
+            fields[field_name] = values
+            key_cf = (obj_type.casefold(), field_name.casefold())
+            values_cf = _intern_values(frozenset(sys.intern(v.casefold()) for v in values))
+            existing = choices_cf.get(key_cf)
+            choices_cf[key_cf] = values_cf if existing is None else _intern_values(existing | values_cf)
+        object_type_by_cf = {t.casefold(): t for t in self.object_types}
+        object.__setattr__(self, "object_types_cf", frozenset(object_type_by_cf))
+        object.__setattr__(self, "object_type_by_cf", object_type_by_cf)
+        object.__setattr__(self, "choices_cf", choices_cf)
+        object.__setattr__(self, "by_type", by_type)
+
+
+def intern_index_values(index: SchemaIndex) -> SchemaIndex:
+    """Point *index*'s choice maps at the shared value sets, in place.
+
+    Indices built in-process already share them; this is for indices
+    restored from the on-disk cache, which carry private copies.
+    """
+    choices = index.choices
+    for key, values in choices.items():
+        choices[key] = _intern_values(values)
+    choices_cf = index.choices_cf
+    for key, values in choices_cf.items():
+        choices_cf[key] = _intern_values(values)
+    for fields in index.by_type.values():
+        for field_name, values in fields.items():
+            fields[field_name] = _intern_values(values)
+    return index
+
+
+@dataclass(frozen=True, slots=True)
 class SchemaDiff:
     """Differences between two schema versions.
 
@@ -53,25 +114,28 @@ class SchemaDiff:
     added_choices: dict[tuple[str, str], frozenset[str]]
 
 
-def _extract_enum_values(field_schema: dict[str, Any]) -> set[str]:
+_EMPTY_VALUES: frozenset[str] = frozenset()
+
+
+def _extract_enum_values(field_schema: dict[str, Any]) -> frozenset[str]:
     """Extract string enum values from a field schema definition.
 
-    Handles both direct ``"enum"`` keys and ``"anyOf"`` branches.
+    Handles both direct ``"enum"`` keys and ``"anyOf"`` branches. Most fields
+    have neither, so that case returns a shared empty set without allocating.
     """
-    values: set[str] = set()
-    if "enum" in field_schema:
-        for v in field_schema["enum"]:
-            if isinstance(v, str):
-                values.add(v)
-    if "anyOf" in field_schema:
-        any_of_list = cast(list[Any], field_schema["anyOf"])
-        for sub in any_of_list:
-            sub_dict = cast(dict[str, Any], sub)
-            if isinstance(sub, dict) and "enum" in sub_dict:
-                for val in cast(list[Any], sub_dict["enum"]):
-                    if isinstance(val, str):
-                        values.add(val)
-    return values
+    enum: Any = field_schema.get("enum")
+    any_of: Any = field_schema.get("anyOf")
+    if any_of is None:
+        if enum is None:
+            return _EMPTY_VALUES
+        return frozenset(sys.intern(v) for v in enum if isinstance(v, str))
+    values: set[str] = set() if enum is None else {sys.intern(v) for v in enum if isinstance(v, str)}
+    for sub in any_of:
+        if isinstance(sub, dict):
+            sub_enum: Any = cast(dict[str, Any], sub).get("enum")
+            if sub_enum is not None:
+                values.update(sys.intern(v) for v in sub_enum if isinstance(v, str))
+    return frozenset(values)
 
 
 def build_schema_index(schema: EpJSONSchema) -> SchemaIndex:
@@ -101,7 +165,7 @@ def build_schema_index(schema: EpJSONSchema) -> SchemaIndex:
             field_def = cast(dict[str, Any], raw_field)
             enum_values = _extract_enum_values(field_def)
             if enum_values:
-                choices[(obj_type, field_name)] = frozenset(enum_values)
+                choices[(obj_type, field_name)] = _intern_values(enum_values)
 
     return SchemaIndex(
         version=schema.version,
@@ -111,6 +175,33 @@ def build_schema_index(schema: EpJSONSchema) -> SchemaIndex:
     )
 
 
+def _diff_field_maps(
+    obj_type: str,
+    from_fields: dict[str, frozenset[str]],
+    to_fields: dict[str, frozenset[str]],
+    removed_choices: dict[tuple[str, str], frozenset[str]],
+    added_choices: dict[tuple[str, str], frozenset[str]],
+) -> None:
+    """Record the choice changes between one object type's field maps."""
+    for field_name in from_fields.keys() - to_fields.keys():
+        if from_fields[field_name]:
+            removed_choices[(obj_type, field_name)] = from_fields[field_name]
+    for field_name in to_fields.keys() - from_fields.keys():
+        if to_fields[field_name]:
+            added_choices[(obj_type, field_name)] = to_fields[field_name]
+    for field_name in from_fields.keys() & to_fields.keys():
+        from_vals = from_fields[field_name]
+        to_vals = to_fields[field_name]
+        if from_vals == to_vals:
+            continue
+        removed = from_vals - to_vals
+        if removed:
+            removed_choices[(obj_type, field_name)] = removed
+        added = to_vals - from_vals
+        if added:
+            added_choices[(obj_type, field_name)] = added
+
+
 def diff_schemas(from_index: SchemaIndex, to_index: SchemaIndex) -> SchemaDiff:
     """Compute the diff between two :class:`SchemaIndex` instances.
 
@@ -123,16 +214,21 @@ def diff_schemas(from_index: SchemaIndex, to_index: SchemaIndex) -> SchemaDiff:
     removed_choices: dict[tuple[str, str], frozenset[str]] = {}
     added_choices: dict[tuple[str, str], frozenset[str]] = {}
 
-    all_keys = set(from_index.choices.keys()) | set(to_index.choices.keys())
-    for key in all_keys:
-        from_vals = from_index.choices.get(key, frozenset())
-        to_vals = to_index.choices.get(key, frozenset())
-        removed = from_vals - to_vals
-        added = to_vals - from_vals
-        if removed:
-            removed_choices[key] = frozenset(removed)
-        if added:
-            added_choices[key] = frozenset(added)
+    from_by_type = from_index.by_type
+    to_by_type = to_index.by_type
+    from_obj_types = from_by_type.keys()
+    to_obj_types = to_by_type.keys()
+
+    # Object types with choices on only one side contribute all their fields.
+    for obj_type in from_obj_types - to_obj_types:
+        _diff_field_maps(obj_type, from_by_type[obj_type], {}, removed_choices, added_choices)
+    for obj_type in to_obj_types - from_obj_types:
+        _diff_field_maps(obj_type, {}, to_by_type[obj_type], removed_choices, added_choices)
+    for obj_type in from_obj_types & to_obj_types:
+        from_fields = from_by_type[obj_type]
+        to_fields = to_by_type[obj_type]
+        if from_fields != to_fields:
+            _diff_field_maps(obj_type, from_fields, to_fields, removed_choices, added_choices)
 
     return SchemaDiff(
         from_version=from_index.version,
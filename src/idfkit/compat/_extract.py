@@ -3,9 +3,33 @@
 from __future__ import annotations
 
 import ast
+import re
+import sys
+import threading
+from collections.abc import Callable
+from typing import Any
 
+from . import _ast_cache
 from ._models import ExtractedLiteral, LiteralKind
 
+# Every pattern recognised below needs either an ``add`` attribute or, for
+# subscripts, an idfkit import; a source mentioning neither cannot yield any
+# literals. ``\b`` keeps this exact for the ``add`` token while still
+# rejecting most unrelated files without tokenising them.
+_PREFILTER = re.compile(r"idfkit|\badd\b")
+_PREFILTER_BYTES = re.compile(rb"idfkit|\badd\b")
+
+
+def may_contain_literals(source: str | bytes) -> bool:
+    """Return False if *source* cannot contain any idfkit literal.
+
+    A cheap regex pre-filter run before hashing or parsing; ``True`` only
+    means the source has to be parsed to find out.
+    """
+    if isinstance(source, bytes):
+        return _PREFILTER_BYTES.search(source) is not None
+    return _PREFILTER.search(source) is not None
+
 
 def extract_literals(source: str, filename: str = "<unknown>") -> list[ExtractedLiteral]:
     """Parse *source* as Python and extract high-confidence idfkit literals.
@@ -22,6 +46,13 @@ def extract_literals(source: str, filename: str = "<unknown>") -> list[Extracted
 
     Dynamic strings, f-strings, and variable references are ignored.
 
+    Sources that mention neither ``idfkit`` nor an ``add`` identifier are
+    rejected by :func:`may_contain_literals` without being parsed (so syntax
+    errors in them go unreported). Other results are cached in memory by
+    source content, and on disk when the CLI enables it (see
+    :mod:`._ast_cache`), so re-extracting an unchanged file skips parsing
+    entirely.
+
     Args:
         source: Python source code to analyse.
         filename: File path used in extracted literal records.
@@ -29,26 +60,64 @@ def extract_literals(source: str, filename: str = "<unknown>") -> list[Extracted
     Returns:
         List of :class:`ExtractedLiteral` instances.
     """
+    if not may_contain_literals(source):
+        return []
+    key = _ast_cache.source_key(source)
+    cached = _ast_cache.load(key)
+    if cached is not None:
+        return cached
     tree = ast.parse(source, filename)
-    has_import = _has_idfkit_import(tree)
-    visitor = _LiteralVisitor(has_idfkit_import=has_import)
+    visitor = _get_visitor(has_idfkit_import=_has_idfkit_import(tree))
     visitor.visit(tree)
-    return visitor.literals
+    literals = visitor.literals
+    _ast_cache.store(key, literals)
+    return literals
+
+
+_visitors = threading.local()
+
+
+def _get_visitor(*, has_idfkit_import: bool) -> _LiteralVisitor:
+    """Return this thread's reusable visitor, reset for a new file."""
+    visitor: _LiteralVisitor | None = getattr(_visitors, "visitor", None)
+    if visitor is None:
+        visitor = _visitors.visitor = _LiteralVisitor(has_idfkit_import=has_idfkit_import)
+    else:
+        visitor.reset(has_idfkit_import=has_idfkit_import)
+    return visitor
+
+
+def _is_idfkit_module(name: str) -> bool:
+    """Return True if *name* is ``idfkit`` or one of its submodules."""
+    return name == "idfkit" or name.startswith("idfkit.")
 
 
 def _has_idfkit_import(tree: ast.Module) -> bool:
-    """Return True if the AST contains any ``import idfkit`` or ``from idfkit import ...``."""
-    for node in ast.walk(tree):
+    """Return True if the module imports ``idfkit`` (``import idfkit`` or ``from idfkit import ...``).
+
+    Only module-level statements are scanned, including the bodies of
+    module-level ``if``/``try`` blocks (``if TYPE_CHECKING:``, optional-import
+    guards); function and class bodies are not walked. Returns at the first
+    match, so a typical script with imports at the top costs O(1).
+    """
+    stack: list[ast.stmt] = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
         if isinstance(node, ast.Import):
-            for alias in node.names:
-                if alias.name == "idfkit" or alias.name.startswith("idfkit."):
-                    return True
-        elif (
-            isinstance(node, ast.ImportFrom)
-            and node.module
-            and (node.module == "idfkit" or node.module.startswith("idfkit."))
-        ):
-            return True
+            if any(_is_idfkit_module(alias.name) for alias in node.names):
+                return True
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and _is_idfkit_module(node.module):
+                return True
+        elif isinstance(node, ast.If):
+            stack.extend(reversed(node.orelse))
+            stack.extend(reversed(node.body))
+        elif isinstance(node, ast.Try):
+            stack.extend(reversed(node.finalbody))
+            stack.extend(reversed(node.orelse))
+            for handler in reversed(node.handlers):
+                stack.extend(reversed(handler.body))
+            stack.extend(reversed(node.body))
     return False
 
 
@@ -62,12 +131,60 @@ def _end_col(node: ast.expr) -> int:
     return node.col_offset
 
 
-class _LiteralVisitor(ast.NodeVisitor):
-    """AST visitor that collects idfkit-relevant string literals."""
+# Node types that never have AST children and are never dispatched. They are
+# filtered out before being pushed, which skips most of the tree: every string
+# constant already handled as an ``add`` argument, every ``Name`` and every
+# ``Load``/``Store`` context and operator node.
+_LEAF_TYPES: frozenset[type[ast.AST]] = frozenset({
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.Store,
+    ast.Del,
+    *ast.operator.__subclasses__(),
+    *ast.unaryop.__subclasses__(),
+    *ast.cmpop.__subclasses__(),
+    *ast.boolop.__subclasses__(),
+})
+
+
+class _LiteralVisitor:
+    """AST visitor that collects idfkit-relevant string literals.
+
+    Walks the tree iteratively in the same pre-order as
+    :class:`ast.NodeVisitor`, but dispatches on ``type(node)`` through a
+    prebuilt table instead of a ``getattr(self, "visit_" + name)`` lookup
+    and recursive ``generic_visit`` call per node.
+    """
 
     def __init__(self, *, has_idfkit_import: bool) -> None:
+        self._all_handlers: dict[type[ast.AST], Callable[[Any], None]] = {
+            ast.Call: self.visit_Call,
+            ast.Subscript: self.visit_Subscript,
+        }
+        self._call_handlers: dict[type[ast.AST], Callable[[Any], None]] = {ast.Call: self.visit_Call}
+        self.reset(has_idfkit_import=has_idfkit_import)
+
+    def reset(self, *, has_idfkit_import: bool) -> None:
+        """Prepare the visitor for a new file; the previous ``literals`` list is left to its owner."""
         self.literals: list[ExtractedLiteral] = []
         self._has_idfkit_import = has_idfkit_import
+        self._handlers = self._all_handlers if has_idfkit_import else self._call_handlers
+
+    def visit(self, tree: ast.AST) -> None:
+        """Walk *tree*, collecting literals from every matching node."""
+        handlers = self._handlers
+        leaves = _LEAF_TYPES
+        iter_child_nodes = ast.iter_child_nodes
+        stack: list[ast.AST] = [tree]
+        while stack:
+            node = stack.pop()
+            handler = handlers.get(type(node))
+            if handler is not None:
+                handler(node)
+            children = [child for child in iter_child_nodes(node) if type(child) not in leaves]
+            children.reverse()
+            stack.extend(children)
 
     # ------------------------------------------------------------------
     # Pattern: something.add("ObjectType", ...)
@@ -75,7 +192,6 @@ class _LiteralVisitor(ast.NodeVisitor):
     def visit_Call(self, node: ast.Call) -> None:
         if isinstance(node.func, ast.Attribute) and node.func.attr == "add":
             self._handle_add_call(node)
-        self.generic_visit(node)
 
     def _handle_add_call(self, node: ast.Call) -> None:
         if not node.args:
@@ -84,7 +200,9 @@ class _LiteralVisitor(ast.NodeVisitor):
         if not (isinstance(first_arg, ast.Constant) and isinstance(first_arg.value, str)):
             return
 
-        obj_type_value: str = first_arg.value
+        # Object types and field names recur across many calls; intern them so
+        # every literal shares one string object per distinct name.
+        obj_type_value: str = sys.intern(first_arg.value)
 
         self.literals.append(
             ExtractedLiteral(
@@ -101,13 +219,13 @@ class _LiteralVisitor(ast.NodeVisitor):
             if kw.arg is not None and isinstance(kw.value, ast.Constant) and isinstance(kw.value.value, str):
                 self.literals.append(
                     ExtractedLiteral(
-                        value=kw.value.value,
+                        value=sys.intern(kw.value.value),
                         kind=LiteralKind.CHOICE_VALUE,
                         line=kw.value.lineno,
                         col=kw.value.col_offset,
                         end_col=_end_col(kw.value),
                         obj_type=obj_type_value,
-                        field_name=kw.arg,
+                        field_name=sys.intern(kw.arg),
                     )
                 )
 
@@ -131,13 +249,13 @@ class _LiteralVisitor(ast.NodeVisitor):
                 ):
                     self.literals.append(
                         ExtractedLiteral(
-                            value=val_node.value,
+                            value=sys.intern(val_node.value),
                             kind=LiteralKind.CHOICE_VALUE,
                             line=val_node.lineno,
                             col=val_node.col_offset,
                             end_col=_end_col(val_node),
                             obj_type=obj_type_value,
-                            field_name=key_node.value,
+                            field_name=sys.intern(key_node.value),
                         )
                     )
 
@@ -148,11 +266,10 @@ class _LiteralVisitor(ast.NodeVisitor):
         if self._has_idfkit_import and isinstance(node.slice, ast.Constant) and isinstance(node.slice.value, str):
             self.literals.append(
                 ExtractedLiteral(
-                    value=node.slice.value,
+                    value=sys.intern(node.slice.value),
                     kind=LiteralKind.OBJECT_TYPE,
                     line=node.slice.lineno,
                     col=node.slice.col_offset,
                     end_col=_end_col(node.slice),
                 )
             )
-        self.generic_visit(node)
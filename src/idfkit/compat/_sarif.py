@@ -9,8 +9,9 @@ __ https://sarifweb.azurewebsites.net/
 
 from __future__ import annotations
 
+import io
 import json
-from typing import Any
+from typing import Any, TextIO
 
 from ._models import DIAGNOSTIC_CODES, CompatSeverity, Diagnostic
 
@@ -23,6 +24,11 @@ _SEVERITY_MAP: dict[CompatSeverity, str] = {
 }
 
 
+# Placeholder marking where the results go in the dumped envelope; the
+# envelope supplies the indentation of the first result, the separator the rest.
+_RESULTS_PLACEHOLDER = "\0results\0"
+
+
 def _build_rules() -> list[dict[str, Any]]:
     """Build the ``rules`` array for the SARIF ``tool.driver`` block."""
     rules: list[dict[str, Any]] = []
@@ -67,15 +73,16 @@ def _diagnostic_to_result(diag: Diagnostic) -> dict[str, Any]:
     return result
 
 
-def format_sarif(diagnostics: list[Diagnostic], *, tool_version: str = "0.1.0") -> str:
-    """Format a list of diagnostics as a SARIF 2.1.0 JSON string.
+def write_sarif(diagnostics: list[Diagnostic], stream: TextIO, *, tool_version: str = "0.1.0") -> None:
+    """Write diagnostics to *stream* as a SARIF 2.1.0 JSON document.
+
+    Results are written one at a time, so the full document is never held
+    in memory; the output is identical to :func:`format_sarif`.
 
     Args:
         diagnostics: Lint diagnostics to format.
+        stream: Text stream to write to (e.g. ``sys.stdout``).
         tool_version: Version string for the tool metadata.
-
-    Returns:
-        A JSON string conforming to the SARIF 2.1.0 schema.
     """
     sarif: dict[str, Any] = {
         "$schema": _SARIF_SCHEMA,
@@ -90,8 +97,34 @@ def format_sarif(diagnostics: list[Diagnostic], *, tool_version: str = "0.1.0")
                         "rules": _build_rules(),
                     },
                 },
-                "results": [_diagnostic_to_result(d) for d in diagnostics],
+                "results": [_RESULTS_PLACEHOLDER] if diagnostics else [],
             },
         ],
     }
-    return json.dumps(sarif, indent=2)
+    envelope = json.dumps(sarif, indent=2)
+    if not diagnostics:
+        stream.write(envelope)
+        return
+    head, tail = envelope.split(json.dumps(_RESULTS_PLACEHOLDER), 1)
+    stream.write(head)
+    for i, diag in enumerate(diagnostics):
+        if i:
+            stream.write(",\n        ")
+        # Re-indent to the results array's depth; JSON escapes newlines inside strings.
+        stream.write(json.dumps(_diagnostic_to_result(diag), indent=2).replace("\n", "\n        "))
+    stream.write(tail)
+
+
+def format_sarif(diagnostics: list[Diagnostic], *, tool_version: str = "0.1.0") -> str:
+    """Format a list of diagnostics as a SARIF 2.1.0 JSON string.
+
+    Args:
+        diagnostics: Lint diagnostics to format.
+        tool_version: Version string for the tool metadata.
+
+    Returns:
+        A JSON string conforming to the SARIF 2.1.0 schema.
+    """
+    buf = io.StringIO()
+    write_sarif(diagnostics, buf, tool_version=tool_version)
+    return buf.getvalue()
@@ -121,6 +121,7 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
     """
 
     __slots__ = (
+        "__weakref__",
         "_collections",
         "_cst",
         "_raw_text",
@@ -648,7 +649,10 @@ class IDFDocument(EppyDocumentMixin, Generic[Strict]):
         when a ``Version`` object is added (e.g. during parsing or copy).
         """
         result = super().addidfobject(obj)
-        if obj.obj_type.upper() == "VERSION":
+        obj_type_upper = obj.obj_type.upper()
+        if obj_type_upper.startswith("SCHEDULE"):
+            self._schedules_cache = None
+        if obj_type_upper == "VERSION":
             vi = obj.data.get("version_identifier")
             if isinstance(vi, str) and vi.strip():
                 with contextlib.suppress(ValueError, IndexError):
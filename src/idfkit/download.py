@@ -8,13 +8,17 @@ and caches them locally for use by idfkit.
 from __future__ import annotations
 
 import gzip
+import io
 import json
+import logging
+import re
 import shutil
 import tarfile
 import tempfile
-from io import BytesIO
+from collections.abc import Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
@@ -26,19 +30,68 @@ from .versions import (
     version_string,
 )
 
+logger = logging.getLogger(__name__)
+
 _GITHUB_API_BASE = "https://api.github.com/repos/NatLabRockies/EnergyPlus/releases/tags"
 _SCHEMA_FILENAME = "Energy+.schema.epJSON"
 _SCHEMA_FILENAME_GZ = "Energy+.schema.epJSON.gz"
 
+# Parallel ranged download of release tarballs: number of concurrent
+# connections, and the smallest chunk worth a connection of its own.
+_DOWNLOAD_WORKERS = 8
+_MIN_CHUNK_SIZE = 4 * 1024 * 1024
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+\d+-\d+/(\d+)")
+
+
+def _release_cache_path(cache_root: Path, tag: str) -> Path:
+    """Return the path of the cached GitHub release response for *tag* under *cache_root*."""
+    return cache_root / "releases" / f"{tag}.json"
+
 
-def _get_release_assets(version: tuple[int, int, int]) -> list[dict[str, Any]]:
-    """Fetch the list of release assets from GitHub API."""
+def _read_release_cache(path: Path) -> tuple[str, list[dict[str, Any]]] | None:
+    """Return the cached ``(etag, assets)`` pair at *path*, or ``None`` if absent or unreadable."""
+    try:
+        data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        etag: str = data["etag"]
+        assets: list[dict[str, Any]] = data["assets"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return etag, assets
+
+
+def _get_release_assets(version: tuple[int, int, int], cache_root: Path) -> list[dict[str, Any]]:
+    """Fetch the list of release assets from GitHub API.
+
+    The response is cached with its ``ETag`` under ``<cache_root>/releases/``,
+    where *cache_root* is the schema download directory.
+    Later calls send ``If-None-Match`` and reuse the cached assets on a
+    ``304 Not Modified``, which skips the JSON body and does not count
+    against GitHub's unauthenticated rate limit.
+    """
     tag = github_release_tag(version)
     url = f"{_GITHUB_API_BASE}/{tag}"
-    req = Request(url, headers={"Accept": "application/vnd.github.v3+json"})  # noqa: S310
-    with urlopen(req, timeout=30) as resp:  # noqa: S310
-        data: dict[str, Any] = json.loads(resp.read())
-    return data.get("assets", [])
+    cache_path = _release_cache_path(cache_root, tag)
+    cached = _read_release_cache(cache_path)
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
+    req = Request(url, headers=headers)  # noqa: S310
+    try:
+        with urlopen(req, timeout=30) as resp:  # noqa: S310
+            data: dict[str, Any] = json.loads(resp.read())
+            etag = resp.headers.get("ETag")
+    except HTTPError as e:
+        if e.code == 304 and cached is not None:
+            return cached[1]
+        raise
+    assets: list[dict[str, Any]] = data.get("assets", [])
+    if isinstance(etag, str):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({"etag": etag, "assets": assets}), encoding="utf-8")
+        except OSError as e:
+            logger.debug("Could not cache release info for %s at %s: %s", tag, cache_path, e)
+    return assets
 
 
 def _find_linux_tarball_url(assets: list[dict[str, Any]]) -> str | None:
@@ -50,10 +103,70 @@ def _find_linux_tarball_url(assets: list[dict[str, Any]]) -> str | None:
     return None
 
 
-def _extract_schema_from_tarball(tarball_bytes: bytes) -> bytes | None:
-    """Extract the Energy+.schema.epJSON file from a tarball."""
-    with tarfile.open(fileobj=BytesIO(tarball_bytes), mode="r:gz") as tar:
-        for member in tar.getmembers():
+def _fetch_range(url: str, lo: int, hi: int) -> bytes:
+    """Download bytes ``lo..hi`` (inclusive) of *url*."""
+    req = Request(url, headers={"Range": f"bytes={lo}-{hi}"})  # noqa: S310
+    with urlopen(req, timeout=300) as resp:  # noqa: S310
+        data: bytes = resp.read()
+        if resp.status != 206 or len(data) != hi - lo + 1:
+            msg = f"server did not honor byte range {lo}-{hi}"
+            raise URLError(msg)
+    return data
+
+
+def _download_ranges(url: str, total: int) -> Generator[bytes, None, None]:
+    """Download the *total* bytes of *url* as parallel HTTP range requests, yielding chunks in order.
+
+    A chunk is no longer referenced here once it has been yielded, so the
+    consumer decides how long each one stays in memory.
+    """
+    workers = max(1, min(_DOWNLOAD_WORKERS, total // _MIN_CHUNK_SIZE))
+    chunk = -(-total // workers)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = [executor.submit(_fetch_range, url, lo, min(lo + chunk, total) - 1) for lo in range(0, total, chunk)]
+        pending.reverse()
+        while pending:
+            yield pending.pop().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _ChunkStream(io.RawIOBase):
+    """Read-only stream over an iterator of byte chunks.
+
+    Each chunk is dropped once it has been read, so only the chunks not yet
+    consumed are held in memory.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._view = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._view:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._view = memoryview(chunk)
+        n = min(len(buffer), len(self._view))
+        buffer[:n] = self._view[:n]
+        self._view = self._view[n:]
+        return n
+
+
+def _scan_tarball_for_schema(fileobj: IO[bytes]) -> bytes | None:
+    """Return the Energy+.schema.epJSON contents from a gzipped tar stream.
+
+    Opens the archive in streaming mode (``r|gz``) so members are read
+    sequentially with O(block) memory, and stops at the first match instead
+    of indexing the whole archive.
+    """
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as tar:
+        for member in tar:
             if member.name.endswith(_SCHEMA_FILENAME):
                 f = tar.extractfile(member)
                 if f is not None:
@@ -61,6 +174,27 @@ def _extract_schema_from_tarball(tarball_bytes: bytes) -> bytes | None:
     return None
 
 
+def _download_schema_from_tarball(url: str) -> bytes | None:
+    """Download the release tarball at *url* and return its schema file contents.
+
+    A one-byte ranged probe reveals the total size via ``Content-Range``; the
+    tarball is then fetched as parallel range requests whose chunks are
+    scanned in order and released as they are read, so the archive is never
+    copied into one buffer. Servers that ignore ``Range`` and answer with a
+    plain ``200`` are scanned straight off the response stream.
+    """
+    probe = Request(url, headers={"Range": "bytes=0-0"})  # noqa: S310
+    with urlopen(probe, timeout=300) as resp:  # noqa: S310
+        match = _CONTENT_RANGE_RE.match(resp.headers.get("Content-Range") or "") if resp.status == 206 else None
+        if match is None:
+            return _scan_tarball_for_schema(resp)
+    chunks = _download_ranges(url, int(match.group(1)))
+    try:
+        return _scan_tarball_for_schema(io.BufferedReader(_ChunkStream(chunks)))
+    finally:
+        chunks.close()
+
+
 def download_schema(
     version: tuple[int, int, int],
     target_dir: Path | None = None,
@@ -89,8 +223,8 @@ def download_schema(
         raise ValueError(msg)
 
     # Determine target path
-    dirname = version_dirname(version)
-    target_dir = (Path.home() / ".idfkit" / "schemas" / dirname) if target_dir is None else (target_dir / dirname)
+    schema_root = (Path.home() / ".idfkit" / "schemas") if target_dir is None else target_dir
+    target_dir = schema_root / version_dirname(version)
     target_dir.mkdir(parents=True, exist_ok=True)
 
     filename = _SCHEMA_FILENAME_GZ if compress else _SCHEMA_FILENAME
@@ -101,7 +235,7 @@ def download_schema(
 
     # Get release assets from GitHub
     try:
-        assets = _get_release_assets(version)
+        assets = _get_release_assets(version, schema_root)
     except (HTTPError, URLError, TimeoutError) as e:
         msg = f"Failed to fetch release info for {version_string(version)}: {e}"
         raise RuntimeError(msg) from e
@@ -111,17 +245,13 @@ def download_schema(
         msg = f"No Linux tarball found in release assets for {version_string(version)}"
         raise RuntimeError(msg)
 
-    # Download the tarball
+    # Download the tarball and extract the schema file
     try:
-        req = Request(tarball_url)  # noqa: S310
-        with urlopen(req, timeout=300) as resp:  # noqa: S310
-            tarball_bytes = resp.read()
+        schema_bytes = _download_schema_from_tarball(tarball_url)
     except (HTTPError, URLError, TimeoutError) as e:
         msg = f"Failed to download tarball for {version_string(version)}: {e}"
         raise RuntimeError(msg) from e
 
-    # Extract the schema file
-    schema_bytes = _extract_schema_from_tarball(tarball_bytes)
     if schema_bytes is None:
         msg = f"Could not find {_SCHEMA_FILENAME} in release tarball for {version_string(version)}"
         raise RuntimeError(msg)
@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import logging
 import math
-from collections.abc import Sequence
+import weakref
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from itertools import pairwise
 from typing import TYPE_CHECKING, Any, cast
 
 logger = logging.getLogger(__name__)
@@ -178,6 +180,36 @@ class Vector3D:
         return cls(0.0, 0.0, 0.0)
 
 
+def _newell_normal(points: Sequence[tuple[float, float, float]]) -> tuple[float, float, float]:
+    """Un-normalized polygon normal of ``(x, y, z)`` tuples by Newell's method."""
+    # Components are accumulated as plain floats rather than allocating a
+    # Vector3D per edge.
+    nx = ny = nz = 0
+    for (x1, y1, z1), (x2, y2, z2) in zip(points, [*points[1:], *points[:1]], strict=True):
+        nx += (y1 - y2) * (z1 + z2)
+        ny += (z1 - z2) * (x1 + x2)
+        nz += (x1 - x2) * (y1 + y2)
+    return (nx, ny, nz)
+
+
+def _azimuth_from_unit_normal(nx: float, ny: float) -> float:
+    """Azimuth in degrees clockwise from north of a unit normal's horizontal part."""
+    # For horizontal surfaces the azimuth is undefined
+    if abs(nx) < 1e-10 and abs(ny) < 1e-10:
+        return 0.0
+    # atan2(x, y) gives the angle from +Y axis toward +X axis,
+    # which is clockwise from north -- exactly the convention we need.
+    angle = math.degrees(math.atan2(nx, ny))
+    if angle < 0:
+        angle += 360.0
+    return angle
+
+
+# Squared |cos(tilt)| thresholds for Polygon3D.is_horizontal / is_vertical.
+_HORIZONTAL_COS_SQ = 0.99**2
+_VERTICAL_COS_SQ = 0.01**2
+
+
 @dataclass
 class Polygon3D:
     """
@@ -236,20 +268,16 @@ class Polygon3D:
             >>> floor.normal
             Vector3D(x=0.0, y=0.0, z=1.0)
         """
-        if self.num_vertices < 3:
+        if len(self.vertices) < 3:
             return Vector3D(0, 0, 1)
+        return Vector3D(*self._raw_normal).normalize()
 
-        # Use Newell's method for robustness
-        n = Vector3D(0, 0, 0)
-        for i in range(self.num_vertices):
-            v1 = self.vertices[i]
-            v2 = self.vertices[(i + 1) % self.num_vertices]
-            n = Vector3D(
-                n.x + (v1.y - v2.y) * (v1.z + v2.z),
-                n.y + (v1.z - v2.z) * (v1.x + v2.x),
-                n.z + (v1.x - v2.x) * (v1.y + v2.y),
-            )
-        return n.normalize()
+    @property
+    def _raw_normal(self) -> tuple[float, float, float]:
+        """Un-normalized Newell normal; direction-only callers skip the sqrt and divisions."""
+        if len(self.vertices) < 3:
+            return (0, 0, 1)
+        return _newell_normal(self.as_tuple_list())
 
     @property
     def area(self) -> float:
@@ -264,22 +292,23 @@ class Polygon3D:
             ... ]).area
             25.0
         """
-        if self.num_vertices < 3:
+        verts = self.vertices
+        if len(verts) < 3:
             return 0.0
 
-        # Triangulate and sum areas
-        total = Vector3D(0, 0, 0)
-        v0 = self.vertices[0]
+        # Fan-triangulate from the first vertex and sum the cross products
+        # component-wise (edge vectors are never materialized as Vector3D).
+        tx = ty = tz = 0
+        v0 = verts[0]
+        x0, y0, z0 = v0.x, v0.y, v0.z
+        for v1, v2 in pairwise(verts[1:]):
+            e1x, e1y, e1z = v1.x - x0, v1.y - y0, v1.z - z0
+            e2x, e2y, e2z = v2.x - x0, v2.y - y0, v2.z - z0
+            tx += e1y * e2z - e1z * e2y
+            ty += e1z * e2x - e1x * e2z
+            tz += e1x * e2y - e1y * e2x
 
-        for i in range(1, self.num_vertices - 1):
-            v1 = self.vertices[i]
-            v2 = self.vertices[i + 1]
-            edge1 = v1 - v0
-            edge2 = v2 - v0
-            cross = edge1.cross(edge2)
-            total = total + cross
-
-        return total.length() / 2.0
+        return math.hypot(tx, ty, tz) / 2.0
 
     @property
     def centroid(self) -> Vector3D:
@@ -292,13 +321,14 @@ class Polygon3D:
             ... ]).centroid
             Vector3D(x=2.0, y=2.0, z=0.0)
         """
-        if not self.vertices:
+        verts = self.vertices
+        if not verts:
             return Vector3D.origin()
 
-        x = sum(v.x for v in self.vertices) / self.num_vertices
-        y = sum(v.y for v in self.vertices) / self.num_vertices
-        z = sum(v.z for v in self.vertices) / self.num_vertices
-        return Vector3D(x, y, z)
+        # sum() is C-level (and compensated for floats on 3.12+), so three
+        # passes beat one interpreted accumulation loop.
+        n = len(verts)
+        return Vector3D(sum(v.x for v in verts) / n, sum(v.y for v in verts) / n, sum(v.z for v in verts) / n)
 
     @property
     def tilt(self) -> float:
@@ -325,9 +355,12 @@ class Polygon3D:
             ... ]).tilt
             90.0
         """
-        n = self.normal
+        nx, ny, nz = self._raw_normal
+        mag = math.hypot(nx, ny, nz)
+        # nz / |n| is exactly normal.z; a degenerate polygon counts as vertical.
+        cos_tilt = nz / mag if mag else 0.0
         # Clamp to avoid floating-point issues with acos
-        clamped = max(-1.0, min(1.0, n.z))
+        clamped = max(-1.0, min(1.0, cos_tilt))
         return math.degrees(math.acos(clamped))
 
     @property
@@ -358,15 +391,7 @@ class Polygon3D:
             0.0
         """
         n = self.normal
-        # For horizontal surfaces the azimuth is undefined
-        if abs(n.x) < 1e-10 and abs(n.y) < 1e-10:
-            return 0.0
-        # atan2(x, y) gives the angle from +Y axis toward +X axis,
-        # which is clockwise from north -- exactly the convention we need.
-        angle = math.degrees(math.atan2(n.x, n.y))
-        if angle < 0:
-            angle += 360.0
-        return angle
+        return _azimuth_from_unit_normal(n.x, n.y)
 
     @property
     def is_horizontal(self) -> bool:
@@ -384,8 +409,9 @@ class Polygon3D:
             ... ]).is_horizontal
             False
         """
-        n = self.normal
-        return abs(n.z) > 0.99
+        # |n.z| / |n| > 0.99, compared squared to avoid the sqrt and division.
+        nx, ny, nz = self._raw_normal
+        return nz * nz > _HORIZONTAL_COS_SQ * (nx * nx + ny * ny + nz * nz)
 
     @property
     def is_vertical(self) -> bool:
@@ -403,8 +429,10 @@ class Polygon3D:
             ... ]).is_vertical
             False
         """
-        n = self.normal
-        return abs(n.z) < 0.01
+        # |n.z| / |n| < 0.01, compared squared; a degenerate polygon counts as vertical.
+        nx, ny, nz = self._raw_normal
+        mag_sq = nx * nx + ny * ny + nz * nz
+        return mag_sq == 0 or nz * nz < _VERTICAL_COS_SQ * mag_sq
 
     def translate(self, offset: Vector3D) -> Polygon3D:
         """Return translated polygon.
@@ -418,18 +446,59 @@ class Polygon3D:
         return Polygon3D([v + offset for v in self.vertices])
 
     def rotate_z(self, angle_deg: float, anchor: Vector3D | None = None) -> Polygon3D:
-        """Rotate around Z axis."""
+        """Rotate around Z axis.
+
+        Whole turns (including ``0``) return an unrotated copy.
+        """
+        if angle_deg % 360.0 == 0:
+            return Polygon3D(list(self.vertices))
         if anchor is None:
             anchor = self.centroid
 
-        rotated: list[Vector3D] = []
-        for v in self.vertices:
-            # Translate to anchor, rotate, translate back
-            relative = v - anchor
-            rotated_rel = relative.rotate_z(angle_deg)
-            rotated.append(rotated_rel + anchor)
+        angle_rad = math.radians(angle_deg)
+        rotated = _rotate_z_points(self.as_tuple_list(), math.cos(angle_rad), math.sin(angle_rad), anchor.as_tuple())
+        return Polygon3D([Vector3D(x, y, z) for x, y, z in rotated])
+
+    def affine_z(
+        self,
+        cos_a: float,
+        sin_a: float,
+        offset: Vector3D,
+        anchor: Vector3D | None = None,
+    ) -> Polygon3D:
+        """Rotate around the Z axis, then translate, in a single vertex pass.
+
+        Equivalent to ``self.rotate_z(angle_deg, anchor).translate(offset)``
+        but takes the rotation as a precomputed cosine/sine pair, so callers
+        transforming many polygons by the same angle evaluate the trig once.
+
+        Args:
+            cos_a: Cosine of the rotation angle.
+            sin_a: Sine of the rotation angle.
+            offset: Translation applied after the rotation.
+            anchor: Point to rotate around.  If ``None``, the origin is used.
 
-        return Polygon3D(rotated)
+        Examples:
+            >>> sq = Polygon3D.from_tuples([(1, 0, 0), (2, 0, 0), (2, 1, 0), (1, 1, 0)])
+            >>> moved = sq.affine_z(0.0, 1.0, Vector3D(10, 0, 5))
+            >>> moved.vertices[0]
+            Vector3D(x=10.0, y=1.0, z=5.0)
+        """
+        ax, ay, az = anchor.as_tuple() if anchor is not None else (0.0, 0.0, 0.0)
+        ox, oy, oz = offset.x, offset.y, offset.z
+        moved: list[Vector3D] = []
+        for v in self.vertices:
+            rx = v.x - ax
+            ry = v.y - ay
+            moved.append(
+                Vector3D(
+                    rx * cos_a - ry * sin_a + ax + ox,
+                    rx * sin_a + ry * cos_a + ay + oy,
+                    # "- az + az" keeps z bit-identical to translating to the anchor and back.
+                    v.z - az + az + oz,
+                )
+            )
+        return Polygon3D(moved)
 
     def as_tuple_list(self) -> list[tuple[float, float, float]]:
         """Return vertices as list of tuples.
@@ -455,6 +524,24 @@ class Polygon3D:
         return cls([Vector3D.from_tuple(c) for c in coords])
 
 
+def _rotate_z_points(
+    points: list[tuple[float, float, float]],
+    cos_a: float,
+    sin_a: float,
+    anchor: tuple[float, float, float],
+) -> list[tuple[float, float, float]]:
+    """Rotate ``(x, y, z)`` tuples about the vertical axis through *anchor*."""
+    ax, ay, az = anchor
+    rotated: list[tuple[float, float, float]] = []
+    for x, y, z in points:
+        # Translate to anchor, rotate, translate back
+        rx = x - ax
+        ry = y - ay
+        # "- az + az" keeps z bit-identical to translating to the anchor and back.
+        rotated.append((rx * cos_a - ry * sin_a + ax, rx * sin_a + ry * cos_a + ay, z - az + az))
+    return rotated
+
+
 def get_surface_coords(surface: IDFObject) -> Polygon3D | None:
     """
     Extract coordinates from a surface object.
@@ -464,6 +551,11 @@ def get_surface_coords(surface: IDFObject) -> Polygon3D | None:
     to fixed flat ``vertex_N_x_coordinate`` fields for surface types whose
     vertex count is fixed in the schema (e.g. ``FenestrationSurface:Detailed``).
 
+    Parsed coordinates are cached per surface and reused until the surface's
+    [mutation_version][idfkit.objects.IDFObject.mutation_version] changes, so
+    repeated geometry queries do not re-read the vertex fields.  Edits made
+    directly to the raw ``surface.data`` dict bypass that counter.
+
     Examples:
         Extract geometry from a 10 m x 3 m south-facing exterior wall:
 
@@ -504,7 +596,50 @@ def _get_vertices(surface: IDFObject) -> list[Vector3D]:
       flat ``vertex_N_x_coordinate`` fields per the schema's fixed
       ``legacy_idd.fields`` ordering.
     """
-    vertices: list[Vector3D] = []
+    return [Vector3D(x, y, z) for x, y, z in _get_vertex_tuples(surface)]
+
+
+def _flat_vertex_field_names(i: int) -> tuple[str, str, str]:
+    """Return the flat ``vertex_N_{x,y,z}_coordinate`` field names for vertex *i* (1-based)."""
+    return (f"vertex_{i}_x_coordinate", f"vertex_{i}_y_coordinate", f"vertex_{i}_z_coordinate")
+
+
+# Flat vertex field names, precomputed up to EnergyPlus' 120-vertex surface
+# limit so reading and writing coordinates does not format three names per
+# vertex on every call.
+_FLAT_VERTEX_KEYS: list[tuple[str, str, str]] = [_flat_vertex_field_names(i) for i in range(1, 121)]
+
+
+def _flat_vertex_keys(count: int) -> list[tuple[str, str, str]]:
+    """Return the flat field-name triples for the first *count* vertices."""
+    while len(_FLAT_VERTEX_KEYS) < count:
+        _FLAT_VERTEX_KEYS.append(_flat_vertex_field_names(len(_FLAT_VERTEX_KEYS) + 1))
+    return _FLAT_VERTEX_KEYS[:count]
+
+
+# Parsed vertices keyed by surface identity (IDFObject.__hash__ uses id(self)).
+# Each entry stores (vertices, mutation_version) so a surface's coordinates
+# are parsed once however many zone/area/height queries read them, and stale
+# entries are discarded when the surface is modified.
+_Vertices = tuple[tuple[float, float, float], ...]
+_vertex_cache: weakref.WeakKeyDictionary[IDFObject, tuple[_Vertices, int]] = weakref.WeakKeyDictionary()
+
+
+def _get_vertex_tuples(surface: IDFObject) -> list[tuple[float, float, float]]:
+    """Like ``_get_vertices``, but as plain ``(x, y, z)`` tuples."""
+    cached = _vertex_cache.get(surface)
+    if cached is not None:
+        vertices, version = cached
+        if version == surface.mutation_version:
+            return list(vertices)
+    vertices = _parse_vertex_tuples(surface)
+    _vertex_cache[surface] = (tuple(vertices), surface.mutation_version)
+    return vertices
+
+
+def _parse_vertex_tuples(surface: IDFObject) -> list[tuple[float, float, float]]:
+    """Read vertex coordinates from *surface*'s raw field data."""
+    vertices: list[tuple[float, float, float]] = []
     items_raw: Any = surface.data.get("vertices")
     if isinstance(items_raw, list):
         for item in cast("list[dict[str, Any]]", items_raw):
@@ -513,19 +648,18 @@ def _get_vertices(surface: IDFObject) -> list[Vector3D]:
             z = item.get("vertex_z_coordinate")
             if x is None or y is None or z is None or x == "" or y == "" or z == "":
                 continue
-            vertices.append(Vector3D(float(x), float(y), float(z)))
+            vertices.append((float(x), float(y), float(z)))
         return vertices
 
     # Fixed flat-field surfaces (e.g. FenestrationSurface:Detailed).
-    i = 1
-    while True:
-        x = surface.data.get(f"vertex_{i}_x_coordinate")
-        y = surface.data.get(f"vertex_{i}_y_coordinate")
-        z = surface.data.get(f"vertex_{i}_z_coordinate")
+    data = surface.data
+    for xk, yk, zk in _FLAT_VERTEX_KEYS:
+        x = data.get(xk)
+        y = data.get(yk)
+        z = data.get(zk)
         if x is None or y is None or z is None or x == "" or y == "" or z == "":
             break
-        vertices.append(Vector3D(float(x), float(y), float(z)))
-        i += 1
+        vertices.append((float(x), float(y), float(z)))
     return vertices
 
 
@@ -557,36 +691,97 @@ def set_surface_coords(surface: IDFObject, polygon: Polygon3D) -> None:
         >>> get_surface_coords(wall).area
         15.0
     """
+    doc = surface._document  # pyright: ignore[reportPrivateUsage]
+    _set_vertex_tuples(surface, polygon.as_tuple_list(), wrapper=_uses_vertex_wrapper(doc, surface.obj_type))
+
+
+def _uses_vertex_wrapper(doc: IDFDocument | None, obj_type: str) -> bool:
+    """Return True if *obj_type* stores its vertices under the ``vertices`` wrapper key."""
+    pc = doc.schema.get_parsing_cache(obj_type) if doc and doc.schema else None
+    return pc is not None and pc.ext_wrapper_key == "vertices"
+
+
+def _set_vertex_tuples(surface: IDFObject, vertices: list[tuple[float, float, float]], *, wrapper: bool) -> None:
+    """Write *vertices* and ``number_of_vertices`` back to *surface*."""
     # Set number of vertices
-    surface.number_of_vertices = len(polygon.vertices)
+    surface.number_of_vertices = len(vertices)
 
     # Extensible surface types (BuildingSurface:Detailed etc.) use the
     # canonical wrapper. Fixed-vertex types (FenestrationSurface:Detailed)
     # use flat ``vertex_N_x_coordinate`` fields per the schema's fixed
     # legacy_idd ordering.
-    doc = surface._document  # pyright: ignore[reportPrivateUsage]
-    pc = doc.schema.get_parsing_cache(surface.obj_type) if doc and doc.schema else None
-    if pc and pc.ext_wrapper_key == "vertices":
+    if wrapper:
         surface.data["vertices"] = [
             {
-                "vertex_x_coordinate": vertex.x,
-                "vertex_y_coordinate": vertex.y,
-                "vertex_z_coordinate": vertex.z,
+                "vertex_x_coordinate": x,
+                "vertex_y_coordinate": y,
+                "vertex_z_coordinate": z,
             }
-            for vertex in polygon.vertices
+            for x, y, z in vertices
         ]
     else:
         # Fixed flat-field surface — write vertex_N_x/y/z_coordinate.
         # Clear any stale vertex flat keys so removed vertices vanish.
         for key in [k for k in surface.data if k.startswith("vertex_") and k != "vertices"]:
             del surface.data[key]
-        for i, v in enumerate(polygon.vertices, 1):
-            surface.data[f"vertex_{i}_x_coordinate"] = v.x
-            surface.data[f"vertex_{i}_y_coordinate"] = v.y
-            surface.data[f"vertex_{i}_z_coordinate"] = v.z
+        data = surface.data
+        for (xk, yk, zk), (x, y, z) in zip(_flat_vertex_keys(len(vertices)), vertices, strict=True):
+            data[xk] = x
+            data[yk] = y
+            data[zk] = z
     surface._bump_version()  # pyright: ignore[reportPrivateUsage]
 
 
+def transform_surface_vertices(
+    doc: IDFDocument,
+    transform: Callable[[list[tuple[float, float, float]]], list[tuple[float, float, float]]],
+) -> None:
+    """Apply *transform* to the vertices of every surface in *doc*.
+
+    Visits every surface of the [VERTEX_SURFACE_TYPES][idfkit.geometry.VERTEX_SURFACE_TYPES]
+    and replaces its vertices with ``transform(vertices)``.  Vertices are
+    passed as plain ``(x, y, z)`` tuples, so a transform written as a single
+    list comprehension runs without building any
+    [Vector3D][idfkit.geometry.Vector3D] or [Polygon3D][idfkit.geometry.Polygon3D]
+    objects, and the vertex storage layout is resolved once per surface type
+    rather than once per surface.  Surfaces with fewer than three vertices are
+    skipped.
+
+    This is the shared pass behind [translate_building][idfkit.geometry.translate_building],
+    [rotate_building][idfkit.geometry.rotate_building] and
+    [scale_building][idfkit.geometry_builders.scale_building].
+
+    Examples:
+        Mirror a building across the XZ plane:
+
+        >>> from idfkit import new_document
+        >>> model = new_document()
+        >>> wall = model.add("BuildingSurface:Detailed", "Wall",
+        ...     surface_type="Wall", construction_name="", zone_name="",
+        ...     outside_boundary_condition="Outdoors",
+        ...     sun_exposure="SunExposed", wind_exposure="WindExposed",
+        ...     number_of_vertices=3,
+        ...     vertices=[
+        ...         {"vertex_x_coordinate": 0, "vertex_y_coordinate": 2, "vertex_z_coordinate": 3},
+        ...         {"vertex_x_coordinate": 0, "vertex_y_coordinate": 2, "vertex_z_coordinate": 0},
+        ...         {"vertex_x_coordinate": 4, "vertex_y_coordinate": 2, "vertex_z_coordinate": 0},
+        ...     ],
+        ...     validate=False)
+        >>> transform_surface_vertices(model, lambda pts: [(x, -y, z) for x, y, z in reversed(pts)])
+        >>> get_surface_coords(wall).as_tuple_list()
+        [(4.0, -2.0, 0.0), (0.0, -2.0, 0.0), (0.0, -2.0, 3.0)]
+    """
+    for stype in VERTEX_SURFACE_TYPES:
+        collection = doc.get_collection(stype)
+        if not collection:
+            continue
+        wrapper = _uses_vertex_wrapper(doc, stype)
+        for surface in collection:
+            vertices = _get_vertex_tuples(surface)
+            if len(vertices) >= 3:
+                _set_vertex_tuples(surface, transform(vertices), wrapper=wrapper)
+
+
 def get_zone_origin(zone: IDFObject) -> Vector3D:
     """Get the origin point of a zone.
 
@@ -630,65 +825,68 @@ def translate_to_world(doc: IDFDocument) -> None:  # noqa: C901
 
     Applies zone origins and rotations to surface coordinates.
     """
-    # Check coordinate system
+    # Singleton objects and the zone list are looked up once and reused
+    # for both the transform and the reset below.
     geo_rules = doc["GlobalGeometryRules"]
+    rules = geo_rules.first() if geo_rules else None
+    building = doc["Building"]
+    b = building.first() if building else None
+    zones = list(doc["Zone"])
+
+    # Check coordinate system
     if geo_rules:
-        rules = geo_rules.first()
         coord_system = getattr(rules, "coordinate_system", "World")
         if coord_system and coord_system.lower() == "world":
             return  # Already in world coordinates
 
     # Get building north axis
-    building = doc["Building"]
     north_axis = 0.0
     if building:
-        b = building.first()
         north_axis = float(getattr(b, "north_axis", 0) or 0)
 
     # Process each zone
-    for zone in doc["Zone"]:
+    for zone in zones:
         zone_origin = get_zone_origin(zone)
         zone_rotation = get_zone_rotation(zone)
         total_rotation = north_axis + zone_rotation
+        if total_rotation == 0 and zone_origin == Vector3D.origin():
+            # Identity transform: the zone is already in world coordinates.
+            continue
+        angle_rad = math.radians(total_rotation)
+        cos_a = math.cos(angle_rad)
+        sin_a = math.sin(angle_rad)
 
-        # Get surfaces in this zone
-        zone_name = zone.name
-        surfaces = list(doc.get_referencing(zone_name))
-
-        for surface in surfaces:
+        # Get surfaces in this zone (snapshot: rewriting them must not
+        # disturb the reference graph set being iterated)
+        for surface in list(doc.get_referencing(zone.name)):
             # Only process surfaces with coordinates
             coords = get_surface_coords(surface)
             if coords is None:
                 continue
 
-            # Apply rotation
+            # Apply rotation (about the surface centroid) and translation
             if total_rotation != 0:
-                coords = coords.rotate_z(total_rotation)
-
-            # Apply translation
-            coords = coords.translate(zone_origin)
+                coords = coords.affine_z(cos_a, sin_a, zone_origin, anchor=coords.centroid)
+            else:
+                coords = coords.translate(zone_origin)
 
             # Update surface
             set_surface_coords(surface, coords)
 
     # Update zone origins to zero
-    for zone in doc["Zone"]:
+    for zone in zones:
         zone.x_origin = 0.0
         zone.y_origin = 0.0
         zone.z_origin = 0.0
         zone.direction_of_relative_north = 0.0
 
     # Update building north axis
-    if building:
-        b = building.first()
-        if b is not None:
-            b.north_axis = 0.0
+    if b is not None:
+        b.north_axis = 0.0
 
     # Update coordinate system to World
-    if geo_rules:
-        rules = geo_rules.first()
-        if rules is not None:
-            rules.coordinate_system = "World"
+    if rules is not None:
+        rules.coordinate_system = "World"
 
 
 def calculate_surface_area(surface: IDFObject) -> float:
@@ -777,12 +975,110 @@ def calculate_surface_azimuth(surface: IDFObject) -> float:
     return coords.azimuth if coords else 0.0
 
 
-def calculate_zone_floor_area(doc: IDFDocument, zone_name: str) -> float:
+def calculate_surface_azimuths(doc: IDFDocument, surface_type: str = "BuildingSurface:Detailed") -> dict[str, float]:
+    """Calculate the azimuth of every surface of one type in a single pass.
+
+    Equivalent to calling [calculate_surface_azimuth][idfkit.geometry.calculate_surface_azimuth]
+    on each surface, but works directly on the parsed vertex coordinates
+    without building a [Polygon3D][idfkit.geometry.Polygon3D] per surface,
+    which makes orientation reports over large models cheaper.
+
+    Args:
+        doc: The document to read.
+        surface_type: Object type to report on.
+
+    Returns:
+        Mapping of surface name to azimuth in degrees (0 = north, 90 = east).
+        Surfaces with fewer than three vertices map to ``0.0``.
+
+    Examples:
+        >>> from idfkit import new_document
+        >>> model = new_document()
+        >>> wall = model.add("BuildingSurface:Detailed", "SouthWall",
+        ...     surface_type="Wall", construction_name="", zone_name="",
+        ...     outside_boundary_condition="Outdoors",
+        ...     sun_exposure="SunExposed", wind_exposure="WindExposed",
+        ...     number_of_vertices=4,
+        ...     vertices=[
+        ...         {"vertex_x_coordinate": 0, "vertex_y_coordinate": 0, "vertex_z_coordinate": 3},
+        ...         {"vertex_x_coordinate": 0, "vertex_y_coordinate": 0, "vertex_z_coordinate": 0},
+        ...         {"vertex_x_coordinate": 10, "vertex_y_coordinate": 0, "vertex_z_coordinate": 0},
+        ...         {"vertex_x_coordinate": 10, "vertex_y_coordinate": 0, "vertex_z_coordinate": 3},
+        ...     ],
+        ...     validate=False)
+        >>> calculate_surface_azimuths(model)
+        {'SouthWall': 180.0}
+    """
+    azimuths: dict[str, float] = {}
+    for surface in doc.get_collection(surface_type):
+        verts = _get_vertex_tuples(surface)
+        if len(verts) < 3:
+            azimuths[surface.name] = 0.0
+            continue
+        nx, ny, nz = _newell_normal(verts)
+        mag = math.hypot(nx, ny, nz)
+        # Same normalization as Vector3D.normalize, so results match Polygon3D.azimuth.
+        azimuths[surface.name] = _azimuth_from_unit_normal(nx / mag, ny / mag) if mag else 0.0
+    return azimuths
+
+
+def group_surfaces_by_zone(doc: IDFDocument) -> dict[str, list[IDFObject]]:
+    """Group the ``BuildingSurface:Detailed`` objects of *doc* by upper-cased ``zone_name``.
+
+    One scan over the surfaces, in document order.  Pass the result as
+    ``surfaces_by_zone`` to [calculate_zone_floor_area][idfkit.geometry.calculate_zone_floor_area],
+    [calculate_zone_ceiling_area][idfkit.geometry.calculate_zone_ceiling_area],
+    [calculate_zone_height][idfkit.geometry.calculate_zone_height] and
+    [calculate_zone_volume][idfkit.geometry.calculate_zone_volume] when computing
+    them for many zones, so each call costs O(surfaces in the zone) instead of
+    a scan of the whole model.  The mapping is a snapshot: rebuild it after
+    adding, removing or re-zoning surfaces.
+
+    Examples:
+        >>> from idfkit import new_document
+        >>> model = new_document()
+        >>> floor = model.add("BuildingSurface:Detailed", "Office_Floor",
+        ...     surface_type="Floor", construction_name="", zone_name="Office",
+        ...     outside_boundary_condition="Ground", validate=False)
+        >>> group_surfaces_by_zone(model)
+        {'OFFICE': [BuildingSurface:Detailed('Office_Floor')]}
+    """
+    by_zone: dict[str, list[IDFObject]] = {}
+    for surface in doc["BuildingSurface:Detailed"]:
+        key = (surface.data.get("zone_name") or "").upper()
+        bucket = by_zone.get(key)
+        if bucket is None:
+            by_zone[key] = [surface]
+        else:
+            bucket.append(surface)
+    return by_zone
+
+
+def _zone_surfaces(
+    doc: IDFDocument, zone_name: str, surfaces_by_zone: dict[str, list[IDFObject]] | None
+) -> list[IDFObject]:
+    """Return the ``BuildingSurface:Detailed`` objects of *zone_name*, in document order.
+
+    Reads them from *surfaces_by_zone* when given, otherwise scans the
+    surfaces' ``zone_name`` fields.
+    """
+    target = zone_name.upper()
+    if surfaces_by_zone is not None:
+        return surfaces_by_zone.get(target, [])
+    return [s for s in doc["BuildingSurface:Detailed"] if (s.data.get("zone_name") or "").upper() == target]
+
+
+def calculate_zone_floor_area(
+    doc: IDFDocument, zone_name: str, *, surfaces_by_zone: dict[str, list[IDFObject]] | None = None
+) -> float:
     """Calculate the total floor area of a zone.
 
     Sums the area of all ``BuildingSurface:Detailed`` objects whose
     ``surface_type`` is ``"Floor"`` and whose ``zone_name`` matches.
 
+    *surfaces_by_zone*, from [group_surfaces_by_zone][idfkit.geometry.group_surfaces_by_zone],
+    replaces the scan of every surface when computing many zones.
+
     Examples:
         Calculate the floor area of a 5 m x 4 m office:
 
@@ -807,23 +1103,25 @@ def calculate_zone_floor_area(doc: IDFDocument, zone_name: str) -> float:
     """
     total_area = 0.0
 
-    for surface in doc["BuildingSurface:Detailed"]:
-        if (getattr(surface, "zone_name", None) or "").upper() != zone_name.upper():
-            continue
-
-        surface_type = getattr(surface, "surface_type", None) or ""
+    for surface in _zone_surfaces(doc, zone_name, surfaces_by_zone):
+        surface_type = surface.data.get("surface_type") or ""
         if surface_type and surface_type.lower() == "floor":
             total_area += calculate_surface_area(surface)
 
     return total_area
 
 
-def calculate_zone_ceiling_area(doc: IDFDocument, zone_name: str) -> float:
+def calculate_zone_ceiling_area(
+    doc: IDFDocument, zone_name: str, *, surfaces_by_zone: dict[str, list[IDFObject]] | None = None
+) -> float:
     """Calculate the total ceiling/roof area of a zone (eppy compatibility).
 
     Sums the area of all surfaces whose ``surface_type`` is ``"Ceiling"``
     or ``"Roof"`` in the given zone.
 
+    *surfaces_by_zone*, from [group_surfaces_by_zone][idfkit.geometry.group_surfaces_by_zone],
+    replaces the scan of every surface when computing many zones.
+
     Examples:
         Calculate the ceiling area of a 5 m x 4 m office at z=3 m:
 
@@ -848,23 +1146,25 @@ def calculate_zone_ceiling_area(doc: IDFDocument, zone_name: str) -> float:
     """
     total_area = 0.0
 
-    for surface in doc["BuildingSurface:Detailed"]:
-        if (getattr(surface, "zone_name", None) or "").upper() != zone_name.upper():
-            continue
-
-        surface_type = getattr(surface, "surface_type", None) or ""
+    for surface in _zone_surfaces(doc, zone_name, surfaces_by_zone):
+        surface_type = surface.data.get("surface_type") or ""
         if surface_type and surface_type.lower() in ("ceiling", "roof"):
             total_area += calculate_surface_area(surface)
 
     return total_area
 
 
-def calculate_zone_height(doc: IDFDocument, zone_name: str) -> float:
+def calculate_zone_height(
+    doc: IDFDocument, zone_name: str, *, surfaces_by_zone: dict[str, list[IDFObject]] | None = None
+) -> float:
     """Calculate the height of a zone from its surfaces.
 
     Returns the difference between the maximum and minimum Z coordinates
     across all surfaces belonging to the zone.
 
+    *surfaces_by_zone*, from [group_surfaces_by_zone][idfkit.geometry.group_surfaces_by_zone],
+    replaces the scan of every surface when computing many zones.
+
     Examples:
         Determine the floor-to-ceiling height of a 3 m tall office:
 
@@ -888,24 +1188,18 @@ def calculate_zone_height(doc: IDFDocument, zone_name: str) -> float:
         >>> calculate_zone_height(model, "Office")
         3.0
     """
-    z_min = float("inf")
-    z_max = float("-inf")
+    zs: list[float] = []
 
-    for surface in doc["BuildingSurface:Detailed"]:
-        if (getattr(surface, "zone_name", None) or "").upper() != zone_name.upper():
-            continue
-
-        coords = get_surface_coords(surface)
-        if coords is None:
+    for surface in _zone_surfaces(doc, zone_name, surfaces_by_zone):
+        verts = _get_vertex_tuples(surface)
+        if len(verts) < 3:
             continue
 
-        for v in coords.vertices:
-            z_min = min(z_min, v.z)
-            z_max = max(z_max, v.z)
+        zs.extend(v[2] for v in verts)
 
-    if z_min == float("inf"):
+    if not zs:
         return 0.0
-    return z_max - z_min
+    return max(zs) - min(zs)
 
 
 def translate_building(doc: IDFDocument, offset: Vector3D) -> None:
@@ -942,11 +1236,10 @@ def translate_building(doc: IDFDocument, offset: Vector3D) -> None:
         >>> wall.vertices[0].vertex_x_coordinate
         100.0
     """
-    for stype in VERTEX_SURFACE_TYPES:
-        for surface in doc.get_collection(stype):
-            coords = get_surface_coords(surface)
-            if coords is not None:
-                set_surface_coords(surface, coords.translate(offset))
+    dx, dy, dz = offset.x, offset.y, offset.z
+    if dx == 0 and dy == 0 and dz == 0:
+        return
+    transform_surface_vertices(doc, lambda vertices: [(x + dx, y + dy, z + dz) for x, y, z in vertices])
 
 
 def rotate_building(doc: IDFDocument, angle_deg: float, anchor: Vector3D | None = None) -> None:
@@ -962,43 +1255,44 @@ def rotate_building(doc: IDFDocument, angle_deg: float, anchor: Vector3D | None
         anchor: Point to rotate around.  If ``None``, the origin ``(0, 0, 0)``
             is used.
     """
-    if anchor is None:
-        anchor = Vector3D.origin()
-
-    for stype in VERTEX_SURFACE_TYPES:
-        for surface in doc.get_collection(stype):
-            coords = get_surface_coords(surface)
-            if coords is not None:
-                set_surface_coords(surface, coords.rotate_z(angle_deg, anchor=anchor))
-
-
-def calculate_zone_volume(doc: IDFDocument, zone_name: str) -> float:
+    if angle_deg % 360.0 == 0:
+        return
+    pivot = anchor.as_tuple() if anchor is not None else (0.0, 0.0, 0.0)
+    angle_rad = math.radians(angle_deg)
+    cos_a = math.cos(angle_rad)
+    sin_a = math.sin(angle_rad)
+    transform_surface_vertices(doc, lambda vertices: _rotate_z_points(vertices, cos_a, sin_a, pivot))
+
+
+def calculate_zone_volume(
+    doc: IDFDocument, zone_name: str, *, surfaces_by_zone: dict[str, list[IDFObject]] | None = None
+) -> float:
     """
     Calculate the volume of a zone from its surfaces.
 
     Uses the divergence theorem to compute volume from surface polygons.
     Returns 0.0 if the zone has no surfaces.
+
+    *surfaces_by_zone*, from [group_surfaces_by_zone][idfkit.geometry.group_surfaces_by_zone],
+    replaces the scan of every surface when computing many zones.
     """
     volume = 0.0
 
-    for surface in doc["BuildingSurface:Detailed"]:
-        if (getattr(surface, "zone_name", None) or "").upper() != zone_name.upper():
-            continue
-
-        coords = get_surface_coords(surface)
-        if coords is None or coords.num_vertices < 3:
+    for surface in _zone_surfaces(doc, zone_name, surfaces_by_zone):
+        verts = _get_vertex_tuples(surface)
+        n = len(verts)
+        if n < 3:
             continue
 
         # Contribution to volume using signed volume of tetrahedra
-        centroid = coords.centroid
-        for i in range(coords.num_vertices):
-            v1 = coords.vertices[i]
-            v2 = coords.vertices[(i + 1) % coords.num_vertices]
-
-            # Volume of tetrahedron with origin
-            volume += v1.dot(v2.cross(centroid)) / 6.0
+        cx = sum(v[0] for v in verts) / n
+        cy = sum(v[1] for v in verts) / n
+        cz = sum(v[2] for v in verts) / n
+        for (ax, ay, az), (bx, by, bz) in zip(verts, verts[1:] + verts[:1], strict=True):
+            # Volume of tetrahedron with origin: a . (b x centroid), scaled below
+            volume += ax * (by * cz - bz * cy) + ay * (bz * cx - bx * cz) + az * (bx * cy - by * cx)
 
-    return abs(volume)
+    return abs(volume) / 6.0
 
 
 # ---------------------------------------------------------------------------
@@ -1193,10 +1487,15 @@ def _inset_polygon(wall_poly: Polygon3D, wwr: float) -> Polygon3D | None:
     origin = wall_poly.centroid
 
     # Project vertices to 2D
+    ox, oy, oz = origin.x, origin.y, origin.z
+    rx, ry, rz = right.x, right.y, right.z
+    ux, uy, uz = local_up.x, local_up.y, local_up.z
     coords_2d: list[tuple[float, float]] = []
     for v in wall_poly.vertices:
-        d = v - origin
-        coords_2d.append((right.dot(d), local_up.dot(d)))
+        dx = v.x - ox
+        dy = v.y - oy
+        dz = v.z - oz
+        coords_2d.append((rx * dx + ry * dy + rz * dz, ux * dx + uy * dy + uz * dz))
 
     # Bounding rectangle in 2D
     xs = [c[0] for c in coords_2d]
@@ -1228,7 +1527,7 @@ def _inset_polygon(wall_poly: Polygon3D, wwr: float) -> Polygon3D | None:
     ]
 
     # Project back to 3D
-    window_verts = [origin + right * u + local_up * v for u, v in win_2d]
+    window_verts = [Vector3D(ox + rx * u + ux * v, oy + ry * u + uy * v, oz + rz * u + uz * v) for u, v in win_2d]
     return Polygon3D(window_verts)
 
 
@@ -14,17 +14,19 @@ from __future__ import annotations
 import logging
 from collections.abc import Sequence
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 from .geometry import (
-    VERTEX_SURFACE_TYPES,
     Polygon3D,
     Vector3D,
+    _get_vertex_tuples,  # pyright: ignore[reportPrivateUsage]
     get_surface_coords,
     polygon_area_2d,
     polygon_difference_2d,
     polygon_intersection_2d,
     set_surface_coords,
+    transform_surface_vertices,
 )
 
 if TYPE_CHECKING:
@@ -115,25 +117,23 @@ def add_shading_block(
         raise ValueError(msg)
 
     svp, clockwise = get_geometry_convention(doc)
-    wall_order = WALL_ORDER.get((svp, clockwise), (0, 1, 2, 3))
+    # Picks the UL/LL/LR/UR corners in the document's winding order.
+    order_corners = itemgetter(*WALL_ORDER.get((svp, clockwise), (0, 1, 2, 3)))
 
     z_bot = base_z
     z_top = base_z + height
     created: list[IDFObject] = []
-    n = len(fp)
 
     # Walls
-    for j in range(n):
-        p1 = fp[j]
-        p2 = fp[(j + 1) % n]
-        wall_name = f"{name} Wall {j + 1}"
-        corners = [
+    for j, (p1, p2) in enumerate(zip(fp, fp[1:] + fp[:1], strict=True), 1):
+        wall_name = f"{name} Wall {j}"
+        corners = (
             Vector3D(p1[0], p1[1], z_top),  # UL
             Vector3D(p1[0], p1[1], z_bot),  # LL
             Vector3D(p2[0], p2[1], z_bot),  # LR
             Vector3D(p2[0], p2[1], z_top),  # UR
-        ]
-        poly = Polygon3D([corners[k] for k in wall_order])
+        )
+        poly = Polygon3D(list(order_corners(corners)))
         obj = doc.add("Shading:Site:Detailed", wall_name, validate=False)
         set_surface_coords(obj, poly)
         created.append(obj)
@@ -194,26 +194,21 @@ def bounding_box(doc: IDFDocument) -> tuple[tuple[float, float], tuple[float, fl
         ``((min_x, min_y), (max_x, max_y))`` or ``None`` if no
         surfaces with valid coordinates exist.
     """
-    min_x = float("inf")
-    min_y = float("inf")
-    max_x = float("-inf")
-    max_y = float("-inf")
-    found = False
+    xs: list[float] = []
+    ys: list[float] = []
 
     for srf in doc["BuildingSurface:Detailed"]:
-        coords = get_surface_coords(srf)
-        if coords is None:
+        # Only the coordinates are needed, so skip building a Polygon3D.
+        verts = _get_vertex_tuples(srf)
+        if len(verts) < 3:
             continue
-        for v in coords.vertices:
-            min_x = min(min_x, v.x)
-            min_y = min(min_y, v.y)
-            max_x = max(max_x, v.x)
-            max_y = max(max_y, v.y)
-            found = True
-
-    if not found:
+        xs.extend(v[0] for v in verts)
+        ys.extend(v[1] for v in verts)
+
+    if not xs:
         return None
-    return ((min_x, min_y), (max_x, max_y))
+    # One builtin min/max reduction per axis instead of four comparisons per vertex.
+    return ((min(xs), min(ys)), (max(xs), max(ys)))
 
 
 def scale_building(
@@ -236,22 +231,15 @@ def scale_building(
     else:
         fx = fy = fz = factor
 
+    if fx == 1 and fy == 1 and fz == 1:
+        return
+
     ax, ay, az = (anchor.x, anchor.y, anchor.z) if anchor else (0.0, 0.0, 0.0)
 
-    for stype in VERTEX_SURFACE_TYPES:
-        for srf in doc.get_collection(stype):
-            coords = get_surface_coords(srf)
-            if coords is None:
-                continue
-            new_vertices = [
-                Vector3D(
-                    ax + (v.x - ax) * fx,
-                    ay + (v.y - ay) * fy,
-                    az + (v.z - az) * fz,
-                )
-                for v in coords.vertices
-            ]
-            set_surface_coords(srf, Polygon3D(new_vertices))
+    transform_surface_vertices(
+        doc,
+        lambda vertices: [(ax + (x - ax) * fx, ay + (y - ay) * fy, az + (z - az) * fz) for x, y, z in vertices],
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -12,8 +12,9 @@ The main entry point for 8760-value arrays is
 from __future__ import annotations
 
 import calendar
+import math
 from collections.abc import Sequence
-from datetime import date
+from itertools import pairwise
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -21,6 +22,17 @@ if TYPE_CHECKING:
     from ..objects import IDFObject
 
 
+def _build_through_fields(year: int) -> tuple[str, ...]:
+    """Return the ``Through: m/d`` field for every day index of *year*."""
+    return tuple(
+        f"Through: {month}/{day}" for month in range(1, 13) for day in range(1, calendar.monthrange(year, month)[1] + 1)
+    )
+
+
+# ``Through:`` fields by day-of-year index, keyed by ``calendar.isleap``.
+_THROUGH_FIELDS = {False: _build_through_fields(2023), True: _build_through_fields(2024)}
+
+
 def create_schedule_type_limits(
     doc: IDFDocument,
     name: str,
@@ -42,14 +54,15 @@ def create_schedule_type_limits(
     Returns:
         The created ``ScheduleTypeLimits`` object.
     """
-    kwargs: dict[str, Any] = {
-        "lower_limit_value": lower,
-        "upper_limit_value": upper,
-        "numeric_type": numeric_type,
-    }
-    if unit_type:
-        kwargs["unit_type"] = unit_type
-    return doc.add("ScheduleTypeLimits", name, **kwargs)
+    optional: dict[str, Any] = {"unit_type": unit_type} if unit_type else {}
+    return doc.add(
+        "ScheduleTypeLimits",
+        name,
+        lower_limit_value=lower,
+        upper_limit_value=upper,
+        numeric_type=numeric_type,
+        **optional,
+    )
 
 
 def create_constant_schedule(
@@ -70,10 +83,8 @@ def create_constant_schedule(
     Returns:
         The created ``Schedule:Constant`` object.
     """
-    kwargs: dict[str, Any] = {"hourly_value": value}
-    if type_limits:
-        kwargs["schedule_type_limits_name"] = type_limits
-    return doc.add("Schedule:Constant", name, **kwargs)
+    optional: dict[str, Any] = {"schedule_type_limits_name": type_limits} if type_limits else {}
+    return doc.add("Schedule:Constant", name, hourly_value=value, **optional)
 
 
 def create_compact_schedule_from_values(
@@ -129,31 +140,25 @@ def create_compact_schedule_from_values(
 
     num_days = 366 if is_leap else 365
 
-    # 1. Split into daily profiles
-    daily_profiles: list[tuple[float, ...]] = []
-    for d in range(num_days):
-        start = d * 24
-        daily_profiles.append(tuple(values[start : start + 24]))
-
-    # 2. Group consecutive days with identical profiles into date ranges.
-    #    Each range is (start_day_index, end_day_index, profile).
-    ranges: list[tuple[int, int, tuple[float, ...]]] = []
-    run_start = 0
-    for d in range(1, num_days):
-        if not _profiles_equal(daily_profiles[d], daily_profiles[run_start], tolerance):
-            ranges.append((run_start, d - 1, daily_profiles[run_start]))
-            run_start = d
-    ranges.append((run_start, num_days - 1, daily_profiles[run_start]))
+    # 1-2. Split into daily profiles and group consecutive days with
+    #      identical profiles into (start_day, end_day, profile) ranges.
+    ranges = _group_daily_profiles(tuple(values), num_days, tolerance)
 
     # 3. Build Compact DSL fields.
-    jan1 = date(year, 1, 1)
+    #    Non-adjacent ranges often repeat a profile (e.g. alternating
+    #    weekday/weekend blocks), so Until fields are built once per
+    #    distinct profile.
+    through_fields = _THROUGH_FIELDS[is_leap]
+    until_fields: dict[tuple[float, ...], list[str]] = {}
     fields: list[str] = []
 
     for _, end_day, profile in ranges:
-        end_date = date.fromordinal(jan1.toordinal() + end_day)
-        fields.append(f"Through: {end_date.month}/{end_date.day}")
+        fields.append(through_fields[end_day])
         fields.append("For: AllDays")
-        fields.extend(_profile_to_until_fields(profile))
+        profile_fields = until_fields.get(profile)
+        if profile_fields is None:
+            profile_fields = until_fields[profile] = _profile_to_until_fields(profile)
+        fields.extend(profile_fields)
 
     # 4. Create the Schedule:Compact object using the canonical extensible
     #    wrapper shape: data=[{"field": ...}, {"field": ...}, ...].
@@ -170,9 +175,56 @@ def create_compact_schedule_from_values(
 # ---------------------------------------------------------------------------
 
 
+def _group_daily_profiles(
+    hourly: tuple[float, ...], num_days: int, tolerance: float
+) -> list[tuple[int, int, tuple[float, ...]]]:
+    """Group consecutive days with matching 24-hour profiles into date ranges.
+
+    Each range is ``(start_day_index, end_day_index, profile)``.  A year
+    holding one value throughout is recognised with a single C-level count
+    and returned as one range without building any daily profiles.
+    """
+    first = hourly[0]
+    # ``first == first`` excludes NaN, which never merges with itself below.
+    if first == first and hourly.count(first) == len(hourly):
+        return [(0, num_days - 1, hourly[:24])]
+
+    # Converting once means each day is a plain tuple slice.  Days exactly
+    # equal to the run's profile (the common case) are settled by a C-level
+    # tuple comparison; only the rest fall back to the tolerance check.
+    daily_profiles = [hourly[start : start + 24] for start in range(0, len(hourly), 24)]
+    ranges: list[tuple[int, int, tuple[float, ...]]] = []
+    run_start = 0
+    run_profile = daily_profiles[0]
+    for d in range(1, num_days):
+        profile = daily_profiles[d]
+        if profile != run_profile and not _profiles_equal(profile, run_profile, tolerance):
+            ranges.append((run_start, d - 1, run_profile))
+            run_start = d
+            run_profile = profile
+    ranges.append((run_start, num_days - 1, run_profile))
+    return ranges
+
+
 def _profiles_equal(a: tuple[float, ...], b: tuple[float, ...], tol: float) -> bool:
     """Compare two 24-value daily profiles within tolerance."""
-    return len(a) == len(b) and all(abs(x - y) <= tol for x, y in zip(a, b, strict=True))
+    if len(a) != len(b):
+        return False
+    # If every hour is within tol, the daily totals are within len * tol, so
+    # comparing totals rejects most differing days without the per-hour loop.
+    # fsum totals are correctly rounded; the slack absorbs that rounding.
+    # NaN totals never reject, and infinities (which fsum refuses) fall
+    # through to the per-hour comparison.
+    try:
+        total_a = math.fsum(a)
+        total_b = math.fsum(b)
+    except (ValueError, OverflowError):
+        pass
+    else:
+        slack = 1e-12 * (len(a) * tol + abs(total_a) + abs(total_b))
+        if abs(total_a - total_b) > len(a) * tol + slack:
+            return False
+    return all(abs(x - y) <= tol for x, y in zip(a, b, strict=True))
 
 
 def _profile_to_until_fields(profile: Sequence[float]) -> list[str]:
@@ -186,28 +238,32 @@ def _profile_to_until_fields(profile: Sequence[float]) -> list[str]:
     the values within a single day come from the same input array and are
     compared to themselves, not to values from a different day.
     """
+    # Hours at which the value changes, plus the end of the day, are the
+    # Until: boundaries; each run's value is the one in its first hour.
+    boundaries = [h for h, (prev, cur) in enumerate(pairwise(profile), 1) if cur != prev]
+    boundaries.append(24)
+
     fields: list[str] = []
-    prev_value = profile[0]
-    run_end_hour = 1
-
-    for h in range(1, 24):
-        if profile[h] != prev_value:
-            fields.append(f"Until: {run_end_hour:02d}:00")
-            fields.append(_format_value(prev_value))
-            prev_value = profile[h]
-            run_end_hour = h + 1
-        else:
-            run_end_hour = h + 1
-
-    # Final hour block
-    fields.append(f"Until: {run_end_hour:02d}:00")
-    fields.append(_format_value(prev_value))
+    start_hour = 0
+    for end_hour in boundaries:
+        fields.append(f"Until: {end_hour:02d}:00")
+        fields.append(_format_value(profile[start_hour]))
+        start_hour = end_hour
 
     return fields
 
 
+# Most schedule values are small whole numbers (0/1 fractions, on/off flags,
+# setpoints), so their formatted strings are looked up rather than formatted.
+_WHOLE_NUMBER_STRINGS: dict[float, str] = {float(i): str(i) for i in range(-100, 101)}
+
+
 def _format_value(v: float) -> str:
     """Format a numeric value for Compact DSL, dropping trailing zeros."""
+    text = _WHOLE_NUMBER_STRINGS.get(v)
+    # -0.0 compares equal to 0.0 but formats as "-0".
+    if text is not None and (v or math.copysign(1.0, v) > 0):
+        return text
     # Using :.15g handles integers (1.0 → "1"), floats, inf, and nan
     # without the OverflowError risk of int(v) on non-finite values.
     return f"{v:.15g}"
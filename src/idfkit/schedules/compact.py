@@ -8,12 +8,13 @@ from __future__ import annotations
 
 import re
 import weakref
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from typing import TYPE_CHECKING, Any, cast
 
-from idfkit.schedules.day_types import get_applicable_day_types
-from idfkit.schedules.time_utils import END_OF_DAY, evaluate_time_values
+from idfkit.schedules.day_types import DAY_TYPE_PRIORITY, get_applicable_day_types
+from idfkit.schedules.time_utils import END_OF_DAY, evaluate_time_values, hourly_step_values
 from idfkit.schedules.types import (
     DAY_TYPE_ALL_OTHER_DAYS,
     DAY_TYPE_ALLDAYS,
@@ -41,11 +42,18 @@ from idfkit.schedules.types import (
 if TYPE_CHECKING:
     from idfkit.objects import IDFObject
 
-# Regex patterns for parsing Schedule:Compact fields
-_THROUGH_PATTERN = re.compile(r"^through:\s*(\d{1,2})[/\-](\d{1,2})$", re.IGNORECASE)
-_FOR_PATTERN = re.compile(r"^for:\s*(.+)$", re.IGNORECASE)
-_UNTIL_PATTERN = re.compile(r"^until:\s*(\d{1,2}):(\d{2})(?::(\d{2}))?$", re.IGNORECASE)
-_INTERPOLATE_PATTERN = re.compile(r"^interpolate:\s*(yes|no|average|linear)$", re.IGNORECASE)
+# Regex for parsing Schedule:Compact fields.  The four keywords are fused
+# into one alternation so each field is matched once; ``lastgroup`` names
+# the keyword that matched.
+_FIELD_PATTERN = re.compile(
+    r"^(?:"
+    r"(?P<through>through:\s*(?P<month>\d{1,2})[/\-](?P<day>\d{1,2}))"
+    r"|(?P<for>for:\s*(?P<day_types>.+))"
+    r"|(?P<until>until:\s*(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?)"
+    r"|(?P<interpolate>interpolate:\s*(?P<mode>yes|no|average|linear))"
+    r")$",
+    re.IGNORECASE,
+)
 _VALUE_PATTERN = re.compile(r"^-?\d+\.?\d*$")
 
 # Day type name mapping (case-insensitive)
@@ -71,10 +79,14 @@ _DAY_TYPE_MAP = {
 
 # Cache for parse_compact results, keyed by IDFObject identity.
 # IDFObject.__hash__ uses id(self) so WeakKeyDictionary works correctly.
-# Each entry stores (result_tuple, mutation_version) so that stale
-# results are discarded when the object is mutated.
+# Each entry stores (result_tuple, mutation_version, period_table) so that
+# stale results are discarded when the object is mutated.
 _ParseResult = tuple[list[CompactPeriod], Interpolation]
-_parse_cache: weakref.WeakKeyDictionary[IDFObject, tuple[_ParseResult, int]] = weakref.WeakKeyDictionary()
+_ParseEntry = tuple[_ParseResult, int, tuple[int, ...]]
+_parse_cache: weakref.WeakKeyDictionary[IDFObject, _ParseEntry] = weakref.WeakKeyDictionary()
+
+# Period tables are indexed by ``month * 32 + day``.
+_PERIOD_TABLE_SIZE = 13 * 32
 
 
 @dataclass
@@ -89,15 +101,25 @@ class _ParseState:
     consecutive_none: int
 
 
+def _close_period(state: _ParseState) -> None:
+    """Append the open rule to the open period, index and tabulate its rules and store it."""
+    period = state.current_period
+    if period is None:
+        return
+    if state.current_rule is not None:
+        period.day_rules.append(state.current_rule)
+    period.rule_index = _index_rules(period.day_rules)
+    for rule in period.day_rules:
+        rule.hourly_values = hourly_step_values(rule.time_values)
+    state.periods.append(period)
+
+
 def _process_through(state: _ParseState, match: re.Match[str]) -> None:
     """Process a Through: keyword."""
-    if state.current_period is not None:
-        if state.current_rule is not None:
-            state.current_period.day_rules.append(state.current_rule)
-        state.periods.append(state.current_period)
+    _close_period(state)
 
-    month = int(match.group(1))
-    day = int(match.group(2))
+    month = int(match.group("month"))
+    day = int(match.group("day"))
     state.current_period = CompactPeriod(end_month=month, end_day=day, day_rules=[])
     state.current_rule = None
 
@@ -107,16 +129,16 @@ def _process_for(state: _ParseState, match: re.Match[str]) -> None:
     if state.current_rule is not None and state.current_period is not None:
         state.current_period.day_rules.append(state.current_rule)
 
-    day_types_str = match.group(1)
+    day_types_str = match.group("day_types")
     day_types = _parse_day_types(day_types_str)
     state.current_rule = CompactDayRule(day_types=day_types, time_values=[])
 
 
 def _process_until(state: _ParseState, match: re.Match[str], ext_fields: list[str]) -> None:
     """Process an Until: keyword."""
-    hour = int(match.group(1))
-    minute = int(match.group(2))
-    second = int(match.group(3)) if match.group(3) else 0
+    hour = int(match.group("hour"))
+    minute = int(match.group("minute"))
+    second = int(match.group("second")) if match.group("second") else 0
 
     until_time = END_OF_DAY if hour == 24 else time(hour, minute, second)
 
@@ -131,22 +153,23 @@ def _process_until(state: _ParseState, match: re.Match[str], ext_fields: list[st
 
 def _process_field(state: _ParseState, value_str: str, ext_fields: list[str]) -> None:
     """Process a single field value in Schedule:Compact."""
-    if match := _THROUGH_PATTERN.match(value_str):
+    match = _FIELD_PATTERN.match(value_str)
+    if match is None:
+        return
+    keyword = match.lastgroup
+    if keyword == "through":
         _process_through(state, match)
-    elif match := _FOR_PATTERN.match(value_str):
+    elif keyword == "for":
         _process_for(state, match)
-    elif match := _UNTIL_PATTERN.match(value_str):
+    elif keyword == "until":
         _process_until(state, match, ext_fields)
-    elif (match := _INTERPOLATE_PATTERN.match(value_str)) and match.group(1).lower() in ("yes", "average", "linear"):
+    elif match.group("mode").lower() in ("yes", "average", "linear"):
         state.interpolation = Interpolation.AVERAGE
 
 
 def _finalize_parse_state(state: _ParseState) -> None:
     """Save the final period and rule from parse state."""
-    if state.current_period is not None:
-        if state.current_rule is not None:
-            state.current_period.day_rules.append(state.current_rule)
-        state.periods.append(state.current_period)
+    _close_period(state)
 
 
 def parse_compact(obj: IDFObject) -> tuple[list[CompactPeriod], Interpolation]:
@@ -167,11 +190,14 @@ def parse_compact(obj: IDFObject) -> tuple[list[CompactPeriod], Interpolation]:
     Raises:
         ValueError: If the schedule syntax is invalid.
     """
+    return _parse_compact_entry(obj)[0]
+
+
+def _parse_compact_entry(obj: IDFObject) -> _ParseEntry:
+    """Return the cached parse entry for *obj*, parsing it if missing or stale."""
     cached = _parse_cache.get(obj)
-    if cached is not None:
-        result, version = cached
-        if version == obj.mutation_version:
-            return result
+    if cached is not None and cached[1] == obj.mutation_version:
+        return cached
 
     # Schedule:Compact stores its DSL fields canonically: a list of
     # ``{"field": <token>}`` dicts under the ``data`` wrapper.
@@ -207,9 +233,24 @@ def parse_compact(obj: IDFObject) -> tuple[list[CompactPeriod], Interpolation]:
         state.field_index += 1
 
     _finalize_parse_state(state)
-    result: _ParseResult = (state.periods, state.interpolation)
-    _parse_cache[obj] = (result, obj.mutation_version)
-    return result
+    entry: _ParseEntry = ((state.periods, state.interpolation), obj.mutation_version, _period_table(state.periods))
+    _parse_cache[obj] = entry
+    return entry
+
+
+def _period_table(periods: list[CompactPeriod]) -> tuple[int, ...]:
+    """Map ``month * 32 + day`` to the index of the period ``_find_period_for_date`` would pick."""
+    if not periods:
+        return ()
+    table: list[int] = []
+    for i, period in enumerate(periods):
+        # A slot goes to the first period ending on or after it; periods
+        # ending before an earlier one add nothing.
+        end = min(period.end_month * 32 + min(period.end_day, 31), _PERIOD_TABLE_SIZE - 1)
+        table.extend([i] * (end + 1 - len(table)))
+    # Dates past all periods wrap around to the last one.
+    table.extend([len(periods) - 1] * (_PERIOD_TABLE_SIZE - len(table)))
+    return tuple(table)
 
 
 def _parse_day_types(day_types_str: str) -> set[str]:
@@ -257,7 +298,7 @@ def evaluate_compact(
     Returns:
         The schedule value.
     """
-    periods, interpolation = parse_compact(obj)
+    (periods, interpolation), _, period_table = _parse_compact_entry(obj)
 
     if not periods:
         return 0.0
@@ -266,25 +307,36 @@ def evaluate_compact(
     current_time = dt.time()
 
     # Find the period containing this date
-    period = _find_period_for_date(periods, d)
+    period = _find_period_for_date(periods, d, period_table)
     if period is None:
         return 0.0
 
     # Get applicable day types for this date
     applicable_types = get_applicable_day_types(
-        d, day_type, holidays or set(), custom_day_1 or set(), custom_day_2 or set()
+        d, day_type, holidays or frozenset(), custom_day_1 or frozenset(), custom_day_2 or frozenset()
     )
 
-    # Find the matching day rule
-    rule = _find_matching_rule(period.day_rules, applicable_types)
+    # Find the matching day rule; parsed periods carry a prebuilt index and
+    # remember the match for each (shared) set of applicable day types
+    if period.rule_index:
+        try:
+            rule = period.rule_matches[applicable_types]
+        except KeyError:
+            rule = period.rule_matches[applicable_types] = _match_rule_index(period.rule_index, applicable_types)
+    else:
+        rule = _find_matching_rule(period.day_rules, applicable_types)
     if rule is None:
         return 0.0
 
-    # Evaluate the time-value pairs
+    # Evaluate the time-value pairs; on-the-hour rules are a table lookup
+    if rule.hourly_values is not None and interpolation is Interpolation.NO:
+        return rule.hourly_values[current_time.hour]
     return evaluate_time_values(rule.time_values, current_time, interpolation)
 
 
-def _find_period_for_date(periods: list[CompactPeriod], d: date) -> CompactPeriod | None:
+def _find_period_for_date(
+    periods: list[CompactPeriod], d: date, period_table: tuple[int, ...] = ()
+) -> CompactPeriod | None:
     """Find the period containing a date.
 
     Periods are sequential and cover the entire year. Each period's end date
@@ -293,10 +345,15 @@ def _find_period_for_date(periods: list[CompactPeriod], d: date) -> CompactPerio
     Args:
         periods: List of periods in order.
         d: The date to find.
+        period_table: Lookup table for *periods* built by ``_period_table``;
+            when given, the period is found by indexing instead of scanning.
 
     Returns:
         The period containing the date, or None.
     """
+    if period_table:
+        return periods[period_table[d.month * 32 + d.day]]
+
     for period in periods:
         if (d.month, d.day) <= (period.end_month, period.end_day):
             return period
@@ -305,7 +362,7 @@ def _find_period_for_date(periods: list[CompactPeriod], d: date) -> CompactPerio
     return periods[-1] if periods else None
 
 
-def _find_matching_rule(rules: list[CompactDayRule], applicable_types: set[str]) -> CompactDayRule | None:
+def _find_matching_rule(rules: list[CompactDayRule], applicable_types: AbstractSet[str]) -> CompactDayRule | None:
     """Find the first rule that matches the applicable day types.
 
     Rules are checked in order. The first rule with a matching day type wins.
@@ -319,20 +376,26 @@ def _find_matching_rule(rules: list[CompactDayRule], applicable_types: set[str])
     Returns:
         The first matching rule, or None.
     """
-    from idfkit.schedules.day_types import DAY_TYPE_PRIORITY
+    return _match_rule_index(_index_rules(rules), applicable_types)
+
+
+def _index_rules(rules: list[CompactDayRule]) -> dict[str, CompactDayRule]:
+    """Map each day type to the first rule that lists it."""
+    index: dict[str, CompactDayRule] = {}
+    for rule in rules:
+        for day_type in rule.day_types:
+            index.setdefault(day_type, rule)
+    return index
+
 
+def _match_rule_index(index: dict[str, CompactDayRule], applicable_types: AbstractSet[str]) -> CompactDayRule | None:
+    """Pick the rule for the most specific applicable day type from an ``_index_rules`` table."""
     # For each priority level, check if any rule matches
     for priority_type in DAY_TYPE_PRIORITY:
-        if priority_type not in applicable_types:
-            continue
-
-        for rule in rules:
-            if priority_type in rule.day_types:
+        if priority_type in applicable_types:
+            rule = index.get(priority_type)
+            if rule is not None:
                 return rule
 
     # Fallback: check AllOtherDays
-    for rule in rules:
-        if DAY_TYPE_ALL_OTHER_DAYS in rule.day_types:
-            return rule
-
-    return None
+    return index.get(DAY_TYPE_ALL_OTHER_DAYS)
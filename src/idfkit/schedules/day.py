@@ -6,7 +6,7 @@ and Schedule:Day:List objects.
 
 from __future__ import annotations
 
-import re
+import weakref
 from datetime import datetime, time
 from typing import TYPE_CHECKING, Any, cast
 
@@ -16,6 +16,19 @@ from idfkit.schedules.types import Interpolation, TimeValue
 if TYPE_CHECKING:
     from idfkit.objects import IDFObject
 
+# Field names are looked up on every evaluation, so they are built once:
+# "Hour 1" through "Hour 24" for Schedule:Day:Hourly.
+_HOUR_FIELDS = tuple(f"Hour {hour}" for hour in range(1, 25))
+
+# Midnight on the reference date used when a whole day is evaluated at once.
+_DAY_START = datetime(2024, 1, 1)
+
+
+# Parsed Schedule:Day:Interval and Schedule:Day:List pairs, stored with the
+# object's mutation version so that stale entries are discarded when the
+# object is mutated.
+_time_values_cache: weakref.WeakKeyDictionary[IDFObject, tuple[list[TimeValue], int]] = weakref.WeakKeyDictionary()
+
 
 def _parse_time(time_str: str) -> time:
     """Parse an EnergyPlus time string.
@@ -35,21 +48,17 @@ def _parse_time(time_str: str) -> time:
     if time_str.startswith("24"):
         return END_OF_DAY
 
-    # Try various formats
-    # HH:MM:SS
-    match = re.match(r"^(\d{1,2}):(\d{2}):(\d{2})$", time_str)
-    if match:
-        return time(int(match[1]), int(match[2]), int(match[3]))
-
-    # HH:MM
-    match = re.match(r"^(\d{1,2}):(\d{2})$", time_str)
-    if match:
-        return time(int(match[1]), int(match[2]))
-
-    # HH only
-    match = re.match(r"^(\d{1,2})$", time_str)
-    if match:
-        return time(int(match[1]), 0)
+    # "HH:MM:SS", "HH:MM" or "HH": a 1-2 digit hour, then 2-digit fields
+    parts = time_str.split(":")
+    if (
+        len(parts) <= 3
+        and 1 <= len(parts[0]) <= 2
+        and all(len(part) == 2 for part in parts[1:])
+        and all(part.isdecimal() for part in parts)
+    ):
+        minute = int(parts[1]) if len(parts) > 1 else 0
+        second = int(parts[2]) if len(parts) > 2 else 0
+        return time(int(parts[0]), minute, second)
 
     msg = f"Cannot parse time: {time_str!r}"
     raise ValueError(msg)
@@ -84,9 +93,7 @@ def evaluate_day_hourly(obj: IDFObject, dt: datetime) -> float:
     Returns:
         The schedule value for the given hour.
     """
-    hour = dt.hour  # 0-23
-    field_name = f"Hour {hour + 1}"  # Fields are "Hour 1" through "Hour 24"
-    value = obj.get(field_name)
+    value = obj.get(_HOUR_FIELDS[dt.hour])
     if value is None:
         return 0.0
     return float(value)
@@ -131,25 +138,47 @@ def evaluate_day_list(
     Returns:
         The schedule value at the given time.
     """
-    # Get minutes per item (default 60)
-    minutes_per_item = obj.get("Minutes per Item")
-    minutes_per_item = 60 if minutes_per_item is None else int(minutes_per_item)
+    interpolation = _list_interpolation(obj, interpolation)
+    time_values = _parse_list_time_values(obj)
+    if not time_values:
+        return 0.0
 
-    # Get interpolate setting from the object
+    return evaluate_time_values(time_values, dt.time(), interpolation)
+
+
+def _list_interpolation(obj: IDFObject, interpolation: Interpolation) -> Interpolation:
+    """Return the interpolation mode for a Schedule:Day:List, honouring its own setting."""
     interpolate_field = obj.get("Interpolate to Timestep")
     if interpolate_field:
         interpolate_str = str(interpolate_field).lower()
         if interpolate_str in ("average", "linear", "yes"):
-            interpolation = Interpolation.AVERAGE
+            return Interpolation.AVERAGE
+    return interpolation
+
+
+def _parse_list_time_values(obj: IDFObject) -> list[TimeValue]:
+    """Build time-value pairs from the fixed-width values of a Schedule:Day:List.
+
+    Results are cached per object until it is next mutated.
+    """
+    cached = _time_values_cache.get(obj)
+    if cached is not None and cached[1] == obj.mutation_version:
+        return cached[0]
+
+    # Get minutes per item (default 60)
+    minutes_per_item = obj.get("Minutes per Item")
+    minutes_per_item = 60 if minutes_per_item is None else int(minutes_per_item)
 
-    # Build time-value pairs from the list
+    # Schedule:Day:List stores its values canonically as
+    # ``obj.data["extensions"]`` — a list of ``{"value": ...}`` dicts.
+    items_raw: Any = obj.data.get("extensions") or []
+    if not isinstance(items_raw, list):
+        items_raw = []
     time_values: list[TimeValue] = []
     current_minutes = 0
-    i = 1
 
-    while True:
-        field_name = f"Value {i}"
-        value = obj.get(field_name)
+    for item in cast("list[dict[str, Any]]", items_raw):
+        value = item.get("value")
         if value is None:
             break
 
@@ -163,20 +192,19 @@ def evaluate_day_list(
             until_time = time(hours, mins)
 
         time_values.append(TimeValue(until_time=until_time, value=float(value)))
-        i += 1
-
         if current_minutes >= 1440:
             break
 
-    if not time_values:
-        return 0.0
-
-    return evaluate_time_values(time_values, dt.time(), interpolation)
+    _time_values_cache[obj] = (time_values, obj.mutation_version)
+    return time_values
 
 
 def _parse_interval_time_values(obj: IDFObject) -> list[TimeValue]:
     """Parse time-value pairs from a Schedule:Day:Interval.
 
+    Results are cached per object until it is next mutated, so evaluating
+    the same day schedule at many timesteps parses its fields only once.
+
     Args:
         obj: The Schedule:Day:Interval object.
 
@@ -186,6 +214,10 @@ def _parse_interval_time_values(obj: IDFObject) -> list[TimeValue]:
     Raises:
         ValueError: If times are not in ascending order.
     """
+    cached = _time_values_cache.get(obj)
+    if cached is not None and cached[1] == obj.mutation_version:
+        return cached[0]
+
     time_values: list[TimeValue] = []
 
     # Schedule:Day:Interval stores its time/value pairs canonically as
@@ -212,6 +244,7 @@ def _parse_interval_time_values(obj: IDFObject) -> list[TimeValue]:
 
         time_values.append(TimeValue(until_time=until_time, value=float(value)))
 
+    _time_values_cache[obj] = (time_values, obj.mutation_version)
     return time_values
 
 
@@ -231,27 +264,38 @@ def get_day_values(
         List of values for the day (24 * timestep values).
     """
     obj_type = obj.obj_type
-    values: list[float] = []
+    if obj_type == "Schedule:Constant":
+        return _day_values_constant(obj, timestep)
+    if obj_type == "Schedule:Day:Hourly":
+        return _day_values_hourly(obj, timestep)
+    if obj_type == "Schedule:Day:Interval":
+        return _day_values_from_pairs(_parse_interval_time_values(obj), timestep, interpolation)
+    if obj_type == "Schedule:Day:List":
+        interpolation = _list_interpolation(obj, interpolation)
+        return _day_values_from_pairs(_parse_list_time_values(obj), timestep, interpolation)
+
+    msg = f"Unsupported day schedule type: {obj_type}"
+    raise ValueError(msg)
 
-    minutes_per_step = 60 // timestep
 
-    for hour in range(24):
-        for step in range(timestep):
-            minute = step * minutes_per_step
-            dt = datetime(2024, 1, 1, hour, minute)
-
-            if obj_type == "Schedule:Constant":
-                value = evaluate_constant(obj, dt)
-            elif obj_type == "Schedule:Day:Hourly":
-                value = evaluate_day_hourly(obj, dt)
-            elif obj_type == "Schedule:Day:Interval":
-                value = evaluate_day_interval(obj, dt, interpolation)
-            elif obj_type == "Schedule:Day:List":
-                value = evaluate_day_list(obj, dt, interpolation)
-            else:
-                msg = f"Unsupported day schedule type: {obj_type}"
-                raise ValueError(msg)
-
-            values.append(value)
+def _day_values_constant(obj: IDFObject, timestep: int) -> list[float]:
+    """Return a day of values for a Schedule:Constant."""
+    return [evaluate_constant(obj, _DAY_START)] * (24 * timestep)
+
 
+def _day_values_hourly(obj: IDFObject, timestep: int) -> list[float]:
+    """Return a day of values for a Schedule:Day:Hourly, each hour repeated per step."""
+    values: list[float] = []
+    for hour in range(24):
+        values.extend([evaluate_day_hourly(obj, _DAY_START.replace(hour=hour))] * timestep)
     return values
+
+
+def _day_values_from_pairs(time_values: list[TimeValue], timestep: int, interpolation: Interpolation) -> list[float]:
+    """Return a day of values by evaluating parsed time-value pairs at every step."""
+    minutes_per_step = 60 // timestep
+    return [
+        evaluate_time_values(time_values, time(hour, step * minutes_per_step), interpolation)
+        for hour in range(24)
+        for step in range(timestep)
+    ]
@@ -6,6 +6,7 @@ used by both compact.py and week.py.
 
 from __future__ import annotations
 
+from collections.abc import Set as AbstractSet
 from datetime import date
 
 from idfkit.schedules.types import (
@@ -50,13 +51,33 @@ DAY_TYPE_PRIORITY: list[str] = [
 ]
 
 
+# Day types for each override, and for an ordinary date by ``date.weekday()``.
+# They are built once and shared, so the common case allocates nothing.
+_OVERRIDE_DAY_TYPES: dict[DayType, frozenset[str]] = {
+    DayType.SUMMER_DESIGN: frozenset({DAY_TYPE_SUMMER_DESIGN, DAY_TYPE_ALLDAYS}),
+    DayType.WINTER_DESIGN: frozenset({DAY_TYPE_WINTER_DESIGN, DAY_TYPE_ALLDAYS}),
+    DayType.HOLIDAY: frozenset({DAY_TYPE_HOLIDAY, DAY_TYPE_ALLDAYS}),
+    DayType.CUSTOM_DAY_1: frozenset({DAY_TYPE_CUSTOM_DAY_1, DAY_TYPE_ALLDAYS}),
+    DayType.CUSTOM_DAY_2: frozenset({DAY_TYPE_CUSTOM_DAY_2, DAY_TYPE_ALLDAYS}),
+}
+_WEEKDAY_DAY_TYPES: tuple[frozenset[str], ...] = tuple(
+    frozenset({
+        WEEKDAY_TO_DAY_TYPE[weekday],
+        DAY_TYPE_WEEKDAYS if weekday < 5 else DAY_TYPE_WEEKENDS,
+        DAY_TYPE_ALLDAYS,
+        DAY_TYPE_ALL_OTHER_DAYS,
+    })
+    for weekday in range(7)
+)
+
+
 def get_applicable_day_types(
     d: date,
     day_type: DayType,
-    holidays: set[date],
-    custom_day_1: set[date],
-    custom_day_2: set[date],
-) -> set[str]:
+    holidays: AbstractSet[date],
+    custom_day_1: AbstractSet[date],
+    custom_day_2: AbstractSet[date],
+) -> frozenset[str]:
     """Get all day types that apply to a date.
 
     Args:
@@ -69,49 +90,22 @@ def get_applicable_day_types(
     Returns:
         Set of applicable day type strings.
     """
-    types: set[str] = set()
-
     # Handle explicit override
-    if day_type == DayType.SUMMER_DESIGN:
-        types.add(DAY_TYPE_SUMMER_DESIGN)
-        types.add(DAY_TYPE_ALLDAYS)
-        return types
-    if day_type == DayType.WINTER_DESIGN:
-        types.add(DAY_TYPE_WINTER_DESIGN)
-        types.add(DAY_TYPE_ALLDAYS)
-        return types
-    if day_type == DayType.HOLIDAY:
-        types.add(DAY_TYPE_HOLIDAY)
-        types.add(DAY_TYPE_ALLDAYS)
-        return types
-    if day_type == DayType.CUSTOM_DAY_1:
-        types.add(DAY_TYPE_CUSTOM_DAY_1)
-        types.add(DAY_TYPE_ALLDAYS)
-        return types
-    if day_type == DayType.CUSTOM_DAY_2:
-        types.add(DAY_TYPE_CUSTOM_DAY_2)
-        types.add(DAY_TYPE_ALLDAYS)
-        return types
+    if day_type is not DayType.NORMAL:
+        return _OVERRIDE_DAY_TYPES[day_type]
 
-    # Check special days
-    if d in custom_day_2:
-        types.add(DAY_TYPE_CUSTOM_DAY_2)
-    if d in custom_day_1:
-        types.add(DAY_TYPE_CUSTOM_DAY_1)
-    if d in holidays:
-        types.add(DAY_TYPE_HOLIDAY)
-
-    # Add weekday type
-    weekday = d.weekday()
-    types.add(WEEKDAY_TO_DAY_TYPE[weekday])
+    # Weekday type, weekday/weekend group, AllDays and AllOtherDays
+    types = _WEEKDAY_DAY_TYPES[d.weekday()]
 
-    # Add group types
-    if weekday < 5:  # Monday-Friday
-        types.add(DAY_TYPE_WEEKDAYS)
-    else:  # Saturday-Sunday
-        types.add(DAY_TYPE_WEEKENDS)
-
-    types.add(DAY_TYPE_ALLDAYS)
-    types.add(DAY_TYPE_ALL_OTHER_DAYS)
+    # Check special days
+    if d in custom_day_2 or d in custom_day_1 or d in holidays:
+        special = set(types)
+        if d in custom_day_2:
+            special.add(DAY_TYPE_CUSTOM_DAY_2)
+        if d in custom_day_1:
+            special.add(DAY_TYPE_CUSTOM_DAY_1)
+        if d in holidays:
+            special.add(DAY_TYPE_HOLIDAY)
+        return frozenset(special)
 
     return types
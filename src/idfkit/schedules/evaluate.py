@@ -28,7 +28,7 @@ from idfkit.schedules.types import (
     parse_interpolation,
 )
 from idfkit.schedules.week import evaluate_week_compact, evaluate_week_daily
-from idfkit.schedules.year import evaluate_year
+from idfkit.schedules.year import evaluate_year, get_year_values
 from idfkit.simulation.fs import FileSystem, LocalFileSystem
 
 if TYPE_CHECKING:
@@ -249,11 +249,28 @@ def values(
     start = datetime(year, start_date[0], start_date[1], 0, 0)
     end = datetime(year, end_date[0], end_date[1], 23, 59)
 
+    schedule_type = schedule.obj_type
+
+    # Schedule:Year is swept a day at a time when every day holds a whole
+    # number of steps; the result matches evaluating each step below.
+    if schedule_type == "Schedule:Year" and document is not None and timestep > 0 and 60 % timestep == 0:
+        return get_year_values(
+            schedule,
+            start.date(),
+            end.date(),
+            document,
+            timestep,
+            day_type_enum,
+            holidays,
+            custom_day_1,
+            custom_day_2,
+            interpolation_enum,
+        )
+
     result: list[float] = []
     current = start
 
     # Pre-compute for Schedule:File
-    schedule_type = schedule.obj_type
     file_cache: ScheduleFileCache | None = None
     if schedule_type == "Schedule:File":
         file_cache = ScheduleFileCache()
@@ -6,7 +6,9 @@ both day.py and compact.py.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from datetime import time
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from idfkit.schedules.types import Interpolation
@@ -20,6 +22,8 @@ END_OF_DAY = time(23, 59, 59, 999999)
 #: Exact minutes corresponding to end-of-day (24 hours).
 END_OF_DAY_MINUTES = 1440.0
 
+_UNTIL_MINUTES = attrgetter("until_minutes")
+
 
 def time_to_minutes(t: time) -> float:
     """Convert a time to minutes from midnight.
@@ -47,7 +51,8 @@ def evaluate_time_values(
     """Evaluate a list of time-value pairs at a given time.
 
     Args:
-        time_values: List of TimeValue pairs (must be sorted by time).
+        time_values: List of TimeValue pairs (must be sorted by time; the
+            interval is located by binary search).
         current_time: Time to evaluate.
         interpolation: Interpolation mode.
 
@@ -59,28 +64,47 @@ def evaluate_time_values(
 
     current_minutes = time_to_minutes(current_time)
 
-    # Find the interval containing current_time
-    prev_value = 0.0
-    prev_minutes = 0.0
-
-    for tv in time_values:
-        until_minutes = time_to_minutes(tv.until_time)
-
-        # "Until: HH:MM" means value applies for times < HH:MM
-        # At exactly HH:MM, we transition to the next interval
-        if current_minutes < until_minutes:
-            # Linear interpolation when enabled and interval is valid
-            should_interpolate = (
-                interpolation in (Interpolation.AVERAGE, Interpolation.LINEAR) and until_minutes > prev_minutes
-            )
-            if should_interpolate:
-                fraction = (current_minutes - prev_minutes) / (until_minutes - prev_minutes)
-                return prev_value + fraction * (tv.value - prev_value)
-            # Step function: return the value for this interval
-            return tv.value
-
-        prev_value = tv.value
-        prev_minutes = until_minutes
-
-    # Past all intervals, return last value
-    return time_values[-1].value
+    # "Until: HH:MM" means value applies for times < HH:MM, so the interval
+    # containing current_time is the first one ending strictly after it.
+    i = bisect_right(time_values, current_minutes, key=_UNTIL_MINUTES)
+    if i == len(time_values):
+        # Past all intervals, return last value
+        return time_values[-1].value
+
+    tv = time_values[i]
+    # Step function: return the value for this interval
+    if interpolation is not Interpolation.AVERAGE and interpolation is not Interpolation.LINEAR:
+        return tv.value
+
+    if i:
+        prev = time_values[i - 1]
+        prev_value = prev.value
+        prev_minutes = prev.until_minutes
+    else:
+        prev_value = 0.0
+        prev_minutes = 0.0
+
+    # Linear interpolation when the interval is valid
+    if tv.until_minutes > prev_minutes:
+        fraction = (current_minutes - prev_minutes) / (tv.until_minutes - prev_minutes)
+        return prev_value + fraction * (tv.value - prev_value)
+    return tv.value
+
+
+def hourly_step_values(time_values: list[TimeValue]) -> tuple[float, ...] | None:
+    """Expand time-value pairs that change only on the hour into 24 hourly values.
+
+    When every ``until_time`` falls on a whole hour, the step-function value
+    is constant within each hour, so ``evaluate_time_values(time_values, t,
+    Interpolation.NO)`` equals ``result[t.hour]`` for any time ``t``.
+
+    Args:
+        time_values: List of TimeValue pairs.
+
+    Returns:
+        The value for each hour of the day, or None if the list is empty or
+        any interval ends off the hour.
+    """
+    if not time_values or any(tv.until_minutes % 60 for tv in time_values):
+        return None
+    return tuple(evaluate_time_values(time_values, time(hour), Interpolation.NO) for hour in range(24))
@@ -5,8 +5,8 @@ This module defines enums and dataclasses used throughout the schedules package.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, time
+from dataclasses import dataclass, field
+from datetime import date, time, timedelta
 from enum import Enum
 from typing import Literal
 
@@ -117,15 +117,18 @@ class SpecialDay:
     day_type: str
     """Day type: "Holiday", "CustomDay1", or "CustomDay2"."""
 
+    end_date: date = field(init=False, repr=False, compare=False)
+    """Last date of the special day period."""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "end_date", self.start_date + timedelta(days=self.duration - 1))
+
     def contains(self, d: date) -> bool:
         """Check if a date falls within this special day period."""
-        from datetime import timedelta
-
-        end_date = self.start_date + timedelta(days=self.duration - 1)
-        return self.start_date <= d <= end_date
+        return self.start_date <= d <= self.end_date
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeValue:
     """A time-value pair for interval schedules.
 
@@ -138,6 +141,14 @@ class TimeValue:
     value: float
     """The schedule value."""
 
+    until_minutes: float = field(init=False, repr=False, compare=False)
+    """``until_time`` in minutes from midnight (1440.0 for ``Until: 24:00``)."""
+
+    def __post_init__(self) -> None:
+        from idfkit.schedules.time_utils import time_to_minutes
+
+        object.__setattr__(self, "until_minutes", time_to_minutes(self.until_time))
+
 
 @dataclass
 class CompactDayRule:
@@ -149,6 +160,9 @@ class CompactDayRule:
     time_values: list[TimeValue]
     """Time-value pairs defining the schedule for these days."""
 
+    hourly_values: tuple[float, ...] | None = field(default=None, repr=False, compare=False)
+    """Step values for each hour when every interval ends on the hour, filled in by the parser."""
+
 
 @dataclass
 class CompactPeriod:
@@ -163,6 +177,14 @@ class CompactPeriod:
     day_rules: list[CompactDayRule]
     """Day rules within this period."""
 
+    rule_index: dict[str, CompactDayRule] = field(default_factory=lambda: {}, repr=False, compare=False)
+    """First rule listing each day type, filled in by the parser once the period is complete."""
+
+    rule_matches: dict[frozenset[str], CompactDayRule | None] = field(
+        default_factory=lambda: {}, repr=False, compare=False
+    )
+    """Rule chosen for each set of applicable day types, filled in as dates are evaluated."""
+
     def contains(self, d: date) -> bool:
         """Check if a date falls within this period.
 
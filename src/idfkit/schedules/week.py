@@ -5,6 +5,7 @@ Handles Schedule:Week:Daily and Schedule:Week:Compact objects.
 
 from __future__ import annotations
 
+from collections.abc import Set as AbstractSet
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Any, cast
 
@@ -146,24 +147,9 @@ def evaluate_week_daily(
         evaluate_day_list,
     )
 
-    d = dt.date()
-    day_name = _get_day_schedule_name_for_date(
-        obj,
-        d,
-        day_type,
-        holidays or set(),
-        custom_day_1 or set(),
-        custom_day_2 or set(),
-    )
-
-    if day_name is None:
-        return 0.0
-
-    # Look up the day schedule in the document
-    day_obj = _find_day_schedule(doc, day_name)
+    day_obj = _week_daily_day_schedule(obj, dt.date(), doc, day_type, holidays, custom_day_1, custom_day_2)
     if day_obj is None:
-        msg = f"Day schedule not found: {day_name!r}"
-        raise ValueError(msg)
+        return 0.0
 
     # Evaluate based on day schedule type
     day_type_str = day_obj.obj_type
@@ -180,6 +166,97 @@ def evaluate_week_daily(
         raise ValueError(msg)
 
 
+def get_day_schedule(
+    obj: IDFObject,
+    d: date,
+    doc: IDFDocument,
+    day_type: DayType = DayType.NORMAL,
+    holidays: set[date] | None = None,
+    custom_day_1: set[date] | None = None,
+    custom_day_2: set[date] | None = None,
+) -> IDFObject | None:
+    """Get the day schedule a week schedule applies on a date.
+
+    Args:
+        obj: The Schedule:Week:Daily or Schedule:Week:Compact object.
+        d: The date.
+        doc: The IDF document (for looking up day schedules).
+        day_type: Override day type.
+        holidays: Set of holiday dates.
+        custom_day_1: Set of CustomDay1 dates.
+        custom_day_2: Set of CustomDay2 dates.
+
+    Returns:
+        The day schedule object, or None if no day schedule is assigned
+        (the week schedule then evaluates to 0.0 all day).
+
+    Raises:
+        ValueError: If the week schedule type is unsupported or the
+            referenced day schedule cannot be found.
+    """
+    week_type = obj.obj_type
+    if week_type == "Schedule:Week:Daily":
+        return _week_daily_day_schedule(obj, d, doc, day_type, holidays, custom_day_1, custom_day_2)
+    if week_type == "Schedule:Week:Compact":
+        return _week_compact_day_schedule(obj, d, doc, day_type, holidays, custom_day_1, custom_day_2)
+    msg = f"Unsupported week schedule type: {week_type}"
+    raise ValueError(msg)
+
+
+def _week_daily_day_schedule(
+    obj: IDFObject,
+    d: date,
+    doc: IDFDocument,
+    day_type: DayType,
+    holidays: set[date] | None,
+    custom_day_1: set[date] | None,
+    custom_day_2: set[date] | None,
+) -> IDFObject | None:
+    """Return the day schedule a Schedule:Week:Daily applies on *d*, or None if unassigned."""
+    day_name = _get_day_schedule_name_for_date(
+        obj,
+        d,
+        day_type,
+        holidays or set(),
+        custom_day_1 or set(),
+        custom_day_2 or set(),
+    )
+    if day_name is None:
+        return None
+    return _require_day_schedule(doc, day_name)
+
+
+def _week_compact_day_schedule(
+    obj: IDFObject,
+    d: date,
+    doc: IDFDocument,
+    day_type: DayType,
+    holidays: set[date] | None,
+    custom_day_1: set[date] | None,
+    custom_day_2: set[date] | None,
+) -> IDFObject | None:
+    """Return the day schedule a Schedule:Week:Compact applies on *d*, or None if unassigned."""
+    # Determine what day types apply to this date
+    applicable_types = get_applicable_day_types(
+        d, day_type, holidays or frozenset(), custom_day_1 or frozenset(), custom_day_2 or frozenset()
+    )
+
+    # Find the first matching DayType List / Schedule:Day Name pair
+    day_name = _find_matching_day_in_week_compact(obj, applicable_types)
+    if day_name is None:
+        return None
+    return _require_day_schedule(doc, day_name)
+
+
+def _require_day_schedule(doc: IDFDocument, name: str) -> IDFObject:
+    """Look up a day schedule by name, raising ValueError if it does not exist."""
+    day_obj = _find_day_schedule(doc, name)
+    if day_obj is None:
+        msg = f"Day schedule not found: {name!r}"
+        raise ValueError(msg)
+    return day_obj
+
+
 def _find_day_schedule(doc: IDFDocument, name: str) -> IDFObject | None:
     """Find a day schedule by name in the document.
 
@@ -243,25 +320,11 @@ def evaluate_week_compact(
         evaluate_day_list,
     )
 
-    d = dt.date()
-
-    # Determine what day types apply to this date
-    applicable_types = get_applicable_day_types(
-        d, day_type, holidays or set(), custom_day_1 or set(), custom_day_2 or set()
-    )
-
-    # Find the first matching DayType List / Schedule:Day Name pair
-    day_name = _find_matching_day_in_week_compact(obj, applicable_types)
-
-    if day_name is None:
-        return 0.0
-
-    # Look up and evaluate the day schedule
-    day_obj = _find_day_schedule(doc, day_name)
+    day_obj = _week_compact_day_schedule(obj, dt.date(), doc, day_type, holidays, custom_day_1, custom_day_2)
     if day_obj is None:
-        msg = f"Day schedule not found: {day_name!r}"
-        raise ValueError(msg)
+        return 0.0
 
+    # Evaluate the day schedule
     day_type_str = day_obj.obj_type
     if day_type_str == "Schedule:Constant":
         return evaluate_constant(day_obj, dt)
@@ -276,7 +339,7 @@ def evaluate_week_compact(
         raise ValueError(msg)
 
 
-def _find_matching_day_in_week_compact(obj: IDFObject, applicable_types: set[str]) -> str | None:
+def _find_matching_day_in_week_compact(obj: IDFObject, applicable_types: AbstractSet[str]) -> str | None:
     """Find the day schedule name that matches the applicable day types.
 
     Schedule:Week:Compact has pairs of fields:
@@ -5,7 +5,8 @@ Handles Schedule:Year objects which reference week schedules for date ranges.
 
 from __future__ import annotations
 
-from datetime import date, datetime
+import weakref
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Any, cast
 
 from idfkit.schedules.types import DayType, Interpolation
@@ -14,6 +15,27 @@ if TYPE_CHECKING:
     from idfkit.document import IDFDocument
     from idfkit.objects import IDFObject
 
+# Week schedule object types, in lookup order.
+_WEEK_SCHEDULE_TYPES = ("Schedule:Week:Daily", "Schedule:Week:Compact")
+
+# Week schedules by uppercase name for each document, stored with the
+# document's ``schedules_dict``.  That dict is rebuilt whenever a schedule is
+# added, removed or renamed, so a different dict means the index is stale.
+_week_index_cache: weakref.WeakKeyDictionary[IDFDocument, tuple[dict[str, IDFObject], dict[str, IDFObject]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Parsed date ranges of each Schedule:Year as
+# (start_month, start_day, end_month, end_day, week_name).  Each entry stores
+# (ranges, mutation_version, range_table) so that stale results are discarded
+# when the object is mutated.
+_YearRange = tuple[int, int, int, int, str]
+_YearEntry = tuple[list[_YearRange], int, tuple[int, ...]]
+_year_ranges_cache: weakref.WeakKeyDictionary[IDFObject, _YearEntry] = weakref.WeakKeyDictionary()
+
+# Range tables are indexed by ``month * 32 + day``.
+_RANGE_TABLE_SIZE = 13 * 32
+
 
 def _parse_month_day(month_str: str, day_str: str) -> tuple[int, int]:
     """Parse month and day fields from Schedule:Year.
@@ -119,6 +141,78 @@ def evaluate_year(
         raise ValueError(msg)
 
 
+def get_year_values(
+    obj: IDFObject,
+    start: date,
+    end: date,
+    doc: IDFDocument,
+    timestep: int = 1,
+    day_type: DayType = DayType.NORMAL,
+    holidays: set[date] | None = None,
+    custom_day_1: set[date] | None = None,
+    custom_day_2: set[date] | None = None,
+    interpolation: Interpolation = Interpolation.NO,
+) -> list[float]:
+    """Get all values of a Schedule:Year from *start* through *end* in one pass.
+
+    Produces the same values as calling [evaluate_year][idfkit.schedules.year.evaluate_year]
+    at every timestep of every day in the range, but walks the days in order:
+    each date range's week schedule is looked up once, the day schedule is
+    resolved once per day, and each distinct day schedule's values are
+    computed once.
+
+    Args:
+        obj: The Schedule:Year object.
+        start: First date to evaluate.
+        end: Last date to evaluate (inclusive).
+        doc: The IDF document.
+        timestep: Values per hour; must divide 60.
+        day_type: Override day type.
+        holidays: Set of holiday dates.
+        custom_day_1: Set of CustomDay1 dates.
+        custom_day_2: Set of CustomDay2 dates.
+        interpolation: Interpolation mode.
+
+    Returns:
+        List of values, one per timestep for the entire period.
+
+    Raises:
+        ValueError: If a week or day schedule cannot be found or a date is out of range.
+    """
+    from idfkit.schedules.day import get_day_values
+    from idfkit.schedules.week import get_day_schedule
+
+    range_table = _year_entry(obj)[2]
+    week_objs: dict[int, IDFObject] = {}
+    day_values: dict[IDFObject, list[float]] = {}
+    empty_day = [0.0] * (24 * timestep)
+
+    result: list[float] = []
+    d = start
+    one_day = timedelta(days=1)
+    while d <= end:
+        index = range_table[d.month * 32 + d.day]
+        week_obj = week_objs.get(index)
+        if week_obj is None:
+            week_name, found = _find_week_for_date(obj, d, d.year, doc)
+            if found is None:
+                msg = f"Week schedule not found: {week_name!r}"
+                raise ValueError(msg)
+            week_obj = week_objs[index] = found
+
+        day_obj = get_day_schedule(week_obj, d, doc, day_type, holidays, custom_day_1, custom_day_2)
+        if day_obj is None:
+            result.extend(empty_day)
+        else:
+            values = day_values.get(day_obj)
+            if values is None:
+                values = day_values[day_obj] = get_day_values(day_obj, timestep, interpolation)
+            result.extend(values)
+        d += one_day
+
+    return result
+
+
 def _find_week_for_date(
     obj: IDFObject,
     d: date,
@@ -143,12 +237,33 @@ def _find_week_for_date(
     Returns:
         Tuple of (week_name, week_object). week_object may be None if not found.
     """
+    _ = year  # Ranges are month/day based, so the same table serves every year
+    ranges, _, range_table = _year_entry(obj)
+    index = range_table[d.month * 32 + d.day]
+    if index < 0:
+        # No matching date range found
+        return "", None
+
+    week_name = ranges[index][4]
+    return week_name, _find_week_schedule(doc, week_name)
+
+
+def _year_entry(obj: IDFObject) -> _YearEntry:
+    """Return the cached range entry for *obj*, parsing it if missing or stale.
+
+    Ranges missing a week name or any date field are skipped.
+    """
+    cached = _year_ranges_cache.get(obj)
+    if cached is not None and cached[1] == obj.mutation_version:
+        return cached
+
     # Schedule:Year stores its date-range groups canonically as
     # ``obj.data["schedule_weeks"]`` — a list of dicts with
     # schedule_week_name / start_month / start_day / end_month / end_day.
     items_raw: Any = obj.data.get("schedule_weeks") or []
     if not isinstance(items_raw, list):
         items_raw = []
+    ranges: list[_YearRange] = []
     for item in cast("list[dict[str, Any]]", items_raw):
         week_name = item.get("schedule_week_name")
         if week_name is None:
@@ -159,27 +274,45 @@ def _find_week_for_date(
         end_month = item.get("end_month")
         end_day = item.get("end_day")
 
-        if any(v is None for v in (start_month, start_day, end_month, end_day)):
+        if start_month is None or start_day is None or end_month is None or end_day is None:
             continue
 
         start_m, start_d = _parse_month_day(str(start_month), str(start_day))
         end_m, end_d = _parse_month_day(str(end_month), str(end_day))
+        # Reject impossible dates up front; 2024 is a leap year, so a range
+        # may start or end on February 29 and simply skips it in other years.
+        date(2024, start_m, start_d)
+        date(2024, end_m, end_d)
+        ranges.append((start_m, start_d, end_m, end_d, str(week_name)))
+
+    entry: _YearEntry = (ranges, obj.mutation_version, _range_table(ranges))
+    _year_ranges_cache[obj] = entry
+    return entry
 
-        start_date = date(year, start_m, start_d)
-        end_date = date(year, end_m, end_d)
 
-        # Handle year wraparound (e.g., Nov 1 - Feb 28)
-        if end_date < start_date:
-            # Check if date is in the end-of-year portion or start-of-year portion
-            if d >= start_date or d <= end_date:
-                week_obj = _find_week_schedule(doc, str(week_name))
-                return str(week_name), week_obj
-        elif start_date <= d <= end_date:
-            week_obj = _find_week_schedule(doc, str(week_name))
-            return str(week_name), week_obj
+def _range_table(ranges: list[_YearRange]) -> tuple[int, ...]:
+    """Map each ``month * 32 + day`` to the index of the first range covering it, or -1.
 
-    # No matching date range found
-    return "", None
+    Within one year, comparing ``(month, day)`` tuples orders dates the same
+    way as comparing the dates themselves.
+    """
+    table = [-1] * _RANGE_TABLE_SIZE
+    for month in range(1, 13):
+        for day in range(1, 32):
+            month_day = (month, day)
+            for index, (start_m, start_d, end_m, end_d, _) in enumerate(ranges):
+                if _range_covers((start_m, start_d), (end_m, end_d), month_day):
+                    table[month * 32 + day] = index
+                    break
+    return tuple(table)
+
+
+def _range_covers(start: tuple[int, int], end: tuple[int, int], month_day: tuple[int, int]) -> bool:
+    """Check whether an inclusive ``(month, day)`` range covers *month_day*."""
+    # Handle year wraparound (e.g., Nov 1 - Feb 28)
+    if end < start:
+        return month_day >= start or month_day <= end
+    return start <= month_day <= end
 
 
 def _find_week_schedule(doc: IDFDocument, name: str) -> IDFObject | None:
@@ -192,12 +325,15 @@ def _find_week_schedule(doc: IDFDocument, name: str) -> IDFObject | None:
     Returns:
         The week schedule object, or None if not found.
     """
-    week_types = ["Schedule:Week:Daily", "Schedule:Week:Compact"]
-
-    name_upper = name.upper()
-    for sched_type in week_types:
-        for obj in doc.get_collection(sched_type):
-            if obj.name and obj.name.upper() == name_upper:
-                return obj
-
-    return None
+    schedules = doc.schedules_dict
+    cached = _week_index_cache.get(doc)
+    if cached is None or cached[1] is not schedules:
+        # The first object with a given name wins, as in a linear search.
+        index: dict[str, IDFObject] = {}
+        for sched_type in _WEEK_SCHEDULE_TYPES:
+            for obj in doc.get_collection(sched_type):
+                if obj.name:
+                    index.setdefault(obj.name.upper(), obj)
+        cached = _week_index_cache[doc] = (index, schedules)
+
+    return cached[0].get(name.upper())
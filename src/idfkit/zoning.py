@@ -45,6 +45,7 @@ import enum
 import math
 from collections.abc import Sequence
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import TYPE_CHECKING, overload
 
 from .geometry import Polygon3D, Vector3D, set_surface_coords
@@ -654,7 +655,8 @@ def _build_story_surfaces(
 ) -> list[IDFObject]:
     """Create zones and surfaces for one story."""
     svp, clockwise = get_geometry_convention(doc)
-    wall_order = WALL_ORDER.get((svp, clockwise), (0, 1, 2, 3))
+    # Picks the UL/LL/LR/UR corners in the document's winding order.
+    order_corners = itemgetter(*WALL_ORDER.get((svp, clockwise), (0, 1, 2, 3)))
 
     created: list[IDFObject] = []
     zone_names_this_story: list[str] = []
@@ -704,13 +706,13 @@ def _build_story_surfaces(
                 wind_exposure=wind,
                 validate=False,
             )
-            corners = [
+            corners = (
                 Vector3D(p1[0], p1[1], spec.z_top),  # UL
                 Vector3D(p1[0], p1[1], spec.z_bot),  # LL
                 Vector3D(p2[0], p2[1], spec.z_bot),  # LR
                 Vector3D(p2[0], p2[1], spec.z_top),  # UR
-            ]
-            poly = Polygon3D([corners[k] for k in wall_order])
+            )
+            poly = Polygon3D(list(order_corners(corners)))
             set_surface_coords(wall, poly)
             created.append(wall)
 
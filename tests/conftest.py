@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import fnmatch
 import json
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
 
 from idfkit import IDFDocument, new_document
+from idfkit.compat._models import ExtractedLiteral
 from idfkit.objects import IDFObject
 from idfkit.references import ReferenceGraph
 from idfkit.schema import EpJSONSchema, get_schema
@@ -290,3 +292,13 @@ def reference_graph() -> ReferenceGraph:
     graph.register(obj_c, "zone_name", "Zone2")
 
     return graph
+
+
+@pytest.fixture(autouse=True)
+def _isolated_literal_cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep cached compat literals out of the user's real cache directory."""
+    cache_dir = tmp_path_factory.mktemp("compat-literal-cache")
+    monkeypatch.setattr("idfkit.compat._ast_cache.default_literal_cache_dir", lambda: cache_dir)
+    monkeypatch.setattr("idfkit.compat._ast_cache._disk_cache_dir", None)
+    monkeypatch.setattr("idfkit.compat._ast_cache._memory", OrderedDict[str, list[ExtractedLiteral]]())
+    return cache_dir
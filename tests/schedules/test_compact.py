@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 import pytest
 
@@ -13,6 +13,7 @@ from idfkit.schedules.compact import (  # pyright: ignore[reportPrivateUsage]
     _find_period_for_date,
     _parse_cache,
     _parse_day_types,
+    _period_table,
     evaluate_compact,
     parse_compact,
 )
@@ -163,6 +164,23 @@ class TestFindPeriodForDate:
         """Test empty periods list."""
         assert _find_period_for_date([], date(2024, 1, 1)) is None
 
+    def test_period_table_matches_scan(self) -> None:
+        """Table lookup picks the same period as the scan for every day of the year."""
+        periods = [
+            CompactPeriod(end_month=2, end_day=29, day_rules=[]),
+            CompactPeriod(end_month=1, end_day=15, day_rules=[]),
+            CompactPeriod(end_month=6, end_day=40, day_rules=[]),
+            CompactPeriod(end_month=11, end_day=30, day_rules=[]),
+        ]
+        table = _period_table(periods)
+
+        d = date(2024, 1, 1)
+        while d.year == 2024:
+            assert _find_period_for_date(periods, d, table) is _find_period_for_date(periods, d)
+            d += timedelta(days=1)
+        # December wraps around to the last period.
+        assert _find_period_for_date(periods, date(2024, 12, 25), table) is periods[3]
+
 
 class TestFindMatchingRule:
     """Tests for _find_matching_rule function."""
@@ -533,6 +551,41 @@ class TestInterpolateKeyword:
         assert interp == Interpolation.NO
 
 
+class TestFieldKeywords:
+    """Tests for keyword matching in _process_field."""
+
+    def test_lowercase_keywords_and_seconds(self) -> None:
+        """Keywords match case-insensitively and Until: accepts seconds."""
+        sched = _make_compact(
+            "through: 6-30",
+            "for: weekdays",
+            "until: 07:30:15",
+            "0.0",
+            "UNTIL: 24:00",
+            "1.0",
+        )
+        periods, _ = parse_compact(sched)
+        assert (periods[0].end_month, periods[0].end_day) == (6, 30)
+        rule = periods[0].day_rules[0]
+        assert rule.day_types == {DAY_TYPE_WEEKDAYS}
+        assert [(tv.until_time.minute, tv.until_time.second) for tv in rule.time_values] == [(30, 15), (59, 59)]
+
+    def test_unrecognized_fields_are_skipped(self) -> None:
+        """Fields matching no keyword leave the parse state unchanged."""
+        sched = _make_compact(
+            "Through: 12/31",
+            "For: AllDays",
+            "Interpolate: Maybe",
+            "Until: 24:00",
+            "1.0",
+            "Through 12/31",
+        )
+        periods, interp = parse_compact(sched)
+        assert interp == Interpolation.NO
+        assert len(periods) == 1
+        assert len(periods[0].day_rules[0].time_values) == 1
+
+
 class TestCacheStaleness:
     """Tests that a mutated object invalidates the parse cache (lines 173-179)."""
 
@@ -635,7 +688,7 @@ class TestNoMatchingRule:
         """period=None from _find_period_for_date returns 0.0 (line 270)."""
         import idfkit.schedules.compact as compact_module
 
-        monkeypatch.setattr(compact_module, "_find_period_for_date", lambda periods, d: None)
+        monkeypatch.setattr(compact_module, "_find_period_for_date", lambda periods, d, period_table=(): None)
 
         sched = _make_compact(
             "Through: 12/31",
@@ -685,3 +738,106 @@ class TestAllOtherDaysFallback:
         applicable_types = {DAY_TYPE_SUMMER_DESIGN}  # No AllDays, no AllOtherDays
         result = _find_matching_rule(rules, applicable_types)
         assert result == rules[0]
+
+
+class TestRuleIndex:
+    """Tests for the per-period day-rule index built by parse_compact."""
+
+    def test_parsed_periods_are_indexed(self) -> None:
+        """Each day type maps to the first rule that lists it."""
+        sched = _make_compact(
+            "Through: 6/30",
+            "For: Weekdays",
+            "Until: 24:00",
+            "1.0",
+            "For: Monday AllOtherDays",
+            "Until: 24:00",
+            "0.5",
+            "Through: 12/31",
+            "For: AllDays",
+            "Until: 24:00",
+            "0.0",
+        )
+        periods, _ = parse_compact(sched)
+        first, second = periods[0].day_rules
+        assert periods[0].rule_index == {
+            DAY_TYPE_WEEKDAYS: first,
+            DAY_TYPE_MONDAY: second,
+            "AllOtherDays": second,
+        }
+        assert periods[1].rule_index == {DAY_TYPE_ALLDAYS: periods[1].day_rules[0]}
+        # Monday is more specific than Weekdays; Saturday falls through to AllOtherDays.
+        assert evaluate_compact(sched, datetime(2024, 1, 8, 12, 0)) == 0.5
+        assert evaluate_compact(sched, datetime(2024, 1, 9, 12, 0)) == 1.0
+        assert evaluate_compact(sched, datetime(2024, 1, 6, 12, 0)) == 0.5
+
+    def test_matches_are_remembered_per_day_type_set(self) -> None:
+        """Each distinct set of applicable day types is matched once per period."""
+        sched = _make_compact(
+            "Through: 12/31",
+            "For: Weekdays",
+            "Until: 24:00",
+            "1.0",
+            "For: AllOtherDays",
+            "Until: 24:00",
+            "0.0",
+        )
+        weekdays, others = parse_compact(sched)[0][0].day_rules
+
+        # 2024-01-08..12 are Monday..Friday, 2024-01-13 a Saturday.
+        for day in range(8, 14):
+            evaluate_compact(sched, datetime(2024, 1, day, 12, 0))
+        evaluate_compact(sched, datetime(2024, 1, 15, 12, 0))
+
+        matches = parse_compact(sched)[0][0].rule_matches
+        assert len(matches) == 6
+        assert list(matches.values()) == [weekdays] * 5 + [others]
+
+    def test_index_does_not_affect_equality(self) -> None:
+        """A hand-built period compares equal to a parsed one."""
+        rule = CompactDayRule(day_types={DAY_TYPE_ALLDAYS}, time_values=[])
+        indexed = CompactPeriod(end_month=12, end_day=31, day_rules=[rule], rule_index={DAY_TYPE_ALLDAYS: rule})
+        assert indexed == CompactPeriod(end_month=12, end_day=31, day_rules=[rule])
+
+
+class TestHourlyValues:
+    """Tests for the per-rule hourly table built by parse_compact."""
+
+    def test_on_the_hour_rules_are_tabulated(self) -> None:
+        """Rules that change on the hour get a 24-entry table; others do not."""
+        sched = _make_compact(
+            "Through: 12/31",
+            "For: Weekdays",
+            "Until: 08:00",
+            "0.0",
+            "Until: 24:00",
+            "1.0",
+            "For: AllOtherDays",
+            "Until: 07:30",
+            "0.0",
+            "Until: 24:00",
+            "0.5",
+        )
+        periods, _ = parse_compact(sched)
+        weekdays, others = periods[0].day_rules
+        assert weekdays.hourly_values == (0.0,) * 8 + (1.0,) * 16
+        assert others.hourly_values is None
+
+        # 2024-01-08 is a Monday, 2024-01-06 a Saturday.
+        assert evaluate_compact(sched, datetime(2024, 1, 8, 7, 59)) == 0.0
+        assert evaluate_compact(sched, datetime(2024, 1, 8, 8, 0)) == 1.0
+        assert evaluate_compact(sched, datetime(2024, 1, 6, 7, 15)) == 0.0
+        assert evaluate_compact(sched, datetime(2024, 1, 6, 7, 45)) == 0.5
+
+    def test_interpolation_bypasses_table(self) -> None:
+        """Interpolated schedules still blend across the hour."""
+        sched = _make_compact(
+            "Through: 12/31",
+            "For: AllDays",
+            "Interpolate: Average",
+            "Until: 12:00",
+            "0.0",
+            "Until: 24:00",
+            "1.0",
+        )
+        assert evaluate_compact(sched, datetime(2024, 1, 8, 18, 0)) == 0.5
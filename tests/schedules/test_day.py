@@ -7,7 +7,10 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from idfkit import new_document
 from idfkit.schedules.day import (
+    _parse_interval_time_values,  # pyright: ignore[reportPrivateUsage]
+    _parse_list_time_values,  # pyright: ignore[reportPrivateUsage]
     _parse_time,
     evaluate_constant,
     evaluate_day_hourly,
@@ -56,6 +59,12 @@ class TestParseTime:
         with pytest.raises(ValueError, match="Cannot parse time"):
             _parse_time("invalid")
 
+    @pytest.mark.parametrize("time_str", ["", "8:5", "123:00", "08:00:00:00", "+8:00", "08:0a", "8:"])
+    def test_malformed(self, time_str: str) -> None:
+        """Hours need 1-2 digits and minutes/seconds exactly 2."""
+        with pytest.raises(ValueError, match="Cannot parse time"):
+            _parse_time(time_str)
+
 
 class TestTimeToMinutes:
     """Tests for _time_to_minutes function."""
@@ -177,23 +186,14 @@ class TestEvaluateDayList:
         obj.obj_type = "Schedule:Day:List"
 
         def get_field(field: str) -> int | float | None:
-            # 24 values, one per hour
             if field == "Minutes per Item":
                 return 60
-            if field == "Interpolate to Timestep":
-                return None
-            if field.startswith("Value "):
-                try:
-                    idx = int(field.split()[1])
-                    if 1 <= idx <= 24:
-                        # Simple pattern: 0 for hours 0-7, 1 for hours 8-17, 0 for hours 18-23
-                        hour = idx - 1
-                        return 1.0 if 8 <= hour < 18 else 0.0
-                except (ValueError, IndexError):
-                    pass
             return None
 
         obj.get.side_effect = get_field
+        # 24 values, one per hour.
+        # Simple pattern: 0 for hours 0-7, 1 for hours 8-17, 0 for hours 18-23
+        obj.data = {"extensions": [{"value": 1.0 if 8 <= hour < 18 else 0.0} for hour in range(24)]}
         return obj
 
     def test_evaluate(self, list_schedule: MagicMock) -> None:
@@ -339,6 +339,48 @@ class TestParseIntervalTimeValuesEdgeCases:
         assert result == 1.0
 
 
+class TestTimeValuesCache:
+    """Tests for per-object caching of parsed interval and list day-schedule pairs."""
+
+    def test_cached_until_mutated(self) -> None:
+        """Repeat parses reuse the cached pairs; a mutation re-parses."""
+        doc = new_document()
+        obj = doc.add(
+            "Schedule:Day:Interval",
+            "Office Day",
+            data=[{"time": "08:00", "value_until_time": 0.0}, {"time": "24:00", "value_until_time": 1.0}],
+            validate=False,
+        )
+
+        first = _parse_interval_time_values(obj)
+        assert _parse_interval_time_values(obj) is first
+
+        obj["data"] = [{"time": "24:00", "value_until_time": 0.5}]
+        assert [tv.value for tv in _parse_interval_time_values(obj)] == [0.5]
+        assert evaluate_day_interval(obj, datetime(2024, 1, 1, 6, 0)) == 0.5
+
+    def test_list_cached_until_mutated(self) -> None:
+        """Schedule:Day:List pairs are cached the same way."""
+        doc = new_document()
+        obj = doc.add(
+            "Schedule:Day:List",
+            "Half Hours",
+            minutes_per_item=30,
+            extensions=[{"value": float(i % 2)} for i in range(48)],
+            validate=False,
+        )
+
+        first = _parse_list_time_values(obj)
+        assert len(first) == 48
+        assert first[0].until_time == time(0, 30)
+        assert _parse_list_time_values(obj) is first
+        assert evaluate_day_list(obj, datetime(2024, 1, 1, 0, 45)) == 1.0
+
+        obj.minutes_per_item = 60
+        assert len(_parse_list_time_values(obj)) == 24
+        assert evaluate_day_list(obj, datetime(2024, 1, 1, 0, 45)) == 0.0
+
+
 class TestEvaluateDayListInterpolation:
     """Tests for interpolation handling in evaluate_day_list (lines 141-143)."""
 
@@ -350,13 +392,11 @@ class TestEvaluateDayListInterpolation:
             fields: dict[str, object] = {
                 "Minutes per Item": 60,
                 "Interpolate to Timestep": "Average",
-                "Value 1": 0.0,
-                "Value 2": 1.0,
-                "Value 3": None,
             }
             return fields.get(field)
 
         obj.get.side_effect = get_field
+        obj.data = {"extensions": [{"value": 0.0}, {"value": 1.0}, {"value": None}]}
         # At 1:30 (halfway through the second interval [1:00→2:00]), interpolation
         # blends prev_value=0.0 (end of first interval) with tv.value=1.0 → 0.5.
         # Without interpolation the step function would return 1.0.
@@ -371,12 +411,11 @@ class TestEvaluateDayListInterpolation:
             fields: dict[str, object] = {
                 "Minutes per Item": 60,
                 "Interpolate to Timestep": "Yes",
-                "Value 1": 0.0,
-                "Value 2": None,
             }
             return fields.get(field)
 
         obj.get.side_effect = get_field
+        obj.data = {"extensions": [{"value": 0.0}, {"value": None}]}
         result = evaluate_day_list(obj, datetime(2024, 1, 1, 0, 0))
         assert result == 0.0
 
@@ -388,12 +427,11 @@ class TestEvaluateDayListInterpolation:
             fields: dict[str, object] = {
                 "Minutes per Item": 60,
                 "Interpolate to Timestep": "Linear",
-                "Value 1": 0.5,
-                "Value 2": None,
             }
             return fields.get(field)
 
         obj.get.side_effect = get_field
+        obj.data = {"extensions": [{"value": 0.5}, {"value": None}]}
         # The key point is that "Linear" sets interpolation to AVERAGE; the function executes the branch
         result = evaluate_day_list(obj, datetime(2024, 1, 1, 0, 0))
         assert isinstance(result, float)
@@ -428,14 +466,8 @@ class TestEvaluateDayListEmpty:
         """No Value fields returns 0.0."""
         obj = MagicMock()
 
-        def get_field(field: str) -> object:
-            if field in ("Minutes per Item", "Interpolate to Timestep"):
-                return None
-            if field == "Value 1":
-                return None
-            return None
-
-        obj.get.side_effect = get_field
+        obj.get.return_value = None
+        obj.data = {"extensions": []}
         result = evaluate_day_list(obj, datetime(2024, 1, 1, 10, 0))
         assert result == 0.0
 
@@ -450,16 +482,10 @@ class TestEvaluateDayListEndOfDay:
         def get_field(field: str) -> object:
             if field == "Minutes per Item":
                 return 60
-            if field == "Interpolate to Timestep":
-                return None
-            if field.startswith("Value "):
-                idx = int(field.split()[1])
-                if idx <= 24:
-                    return 1.0
-                return None
             return None
 
         obj.get.side_effect = get_field
+        obj.data = {"extensions": [{"value": 1.0}] * 25}
         result = evaluate_day_list(obj, datetime(2024, 1, 1, 23, 0))
         assert result == 1.0
 
@@ -494,16 +520,56 @@ class TestGetDayValuesAllTypes:
         def get_field(field: str) -> object:
             if field == "Minutes per Item":
                 return 60
-            if field == "Interpolate to Timestep":
-                return None
-            if field.startswith("Value "):
-                idx = int(field.split()[1])
-                if idx <= 24:
-                    return 0.9
-                return None
             return None
 
         obj.get.side_effect = get_field
+        obj.data = {"extensions": [{"value": 0.9}] * 24}
         result = get_day_values(obj, timestep=1)
         assert len(result) == 24
         assert all(v == 0.9 for v in result)
+
+    def test_sub_hourly_matches_pointwise_evaluation(self) -> None:
+        """Interval and list schedules parsed once agree with per-step evaluation."""
+        interval = MagicMock()
+        interval.obj_type = "Schedule:Day:Interval"
+        interval.data = {
+            "data": [
+                {"time": "08:00", "value_until_time": 0.0},
+                {"time": "17:30", "value_until_time": 1.0},
+                {"time": "24:00", "value_until_time": 0.25},
+            ]
+        }
+        day_list = MagicMock()
+        day_list.obj_type = "Schedule:Day:List"
+
+        def get_field(field: str) -> object:
+            if field == "Minutes per Item":
+                return 30
+            if field == "Interpolate to Timestep":
+                return "Average"
+            return None
+
+        day_list.get.side_effect = get_field
+        day_list.data = {"extensions": [{"value": float(idx % 5)} for idx in range(1, 49)]}
+
+        for interpolation in (Interpolation.NO, Interpolation.AVERAGE):
+            steps = [datetime(2024, 1, 1, hour, minute) for hour in range(24) for minute in range(0, 60, 15)]
+            assert get_day_values(interval, timestep=4, interpolation=interpolation) == [
+                evaluate_day_interval(interval, dt, interpolation) for dt in steps
+            ]
+            assert get_day_values(day_list, timestep=4, interpolation=interpolation) == [
+                evaluate_day_list(day_list, dt, interpolation) for dt in steps
+            ]
+
+    def test_hourly_sub_hourly_timestep(self) -> None:
+        """Each hour's value is repeated for every step within the hour."""
+        obj = MagicMock()
+        obj.obj_type = "Schedule:Day:Hourly"
+
+        def get_field(field: str) -> object:
+            return float(field.split()[1]) if field.startswith("Hour ") else None
+
+        obj.get.side_effect = get_field
+
+        result = get_day_values(obj, timestep=4)
+        assert result == [float(hour) for hour in range(1, 25) for _ in range(4)]
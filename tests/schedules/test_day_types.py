@@ -199,3 +199,26 @@ class TestGetApplicableDayTypes:
         )
 
         assert types == {DAY_TYPE_CUSTOM_DAY_2, DAY_TYPE_ALLDAYS}
+
+    def test_overlapping_special_days(self) -> None:
+        """A date in several special-day sets gets every matching type."""
+        d = date(2024, 12, 25)  # Wednesday
+        types = get_applicable_day_types(d, DayType.NORMAL, {d}, {d}, frozenset({d}))
+
+        assert types == {
+            DAY_TYPE_CUSTOM_DAY_2,
+            DAY_TYPE_CUSTOM_DAY_1,
+            DAY_TYPE_HOLIDAY,
+            "Wednesday",
+            DAY_TYPE_WEEKDAYS,
+            DAY_TYPE_ALLDAYS,
+            DAY_TYPE_ALL_OTHER_DAYS,
+        }
+
+    def test_ordinary_dates_share_precomputed_sets(self) -> None:
+        """Dates on the same weekday without special days reuse one frozenset."""
+        first = get_applicable_day_types(date(2024, 1, 8), DayType.NORMAL, set(), set(), set())
+        second = get_applicable_day_types(date(2024, 1, 15), DayType.NORMAL, set(), set(), set())
+
+        assert isinstance(first, frozenset)
+        assert first is second
@@ -292,12 +292,11 @@ class TestEvalSimpleDay:
             fields: dict[str, object] = {
                 "Minutes per Item": 60,
                 "Interpolate to Timestep": None,
-                "Value 1": 0.7,
-                "Value 2": None,
             }
             return fields.get(field)
 
         obj.get.side_effect = get_field
+        obj.data = {"extensions": [{"value": 0.7}, {"value": None}]}
         del obj._document
 
         result = evaluate(obj, datetime(2024, 1, 1, 0, 0))
@@ -514,12 +513,11 @@ class TestEvaluateWithInterpolation:
             fields: dict[str, object] = {
                 "Minutes per Item": 60,
                 "Interpolate to Timestep": None,
-                "Value 1": 1.0,
-                "Value 2": None,
             }
             return fields.get(field)
 
         obj.get.side_effect = get_field
+        obj.data = {"extensions": [{"value": 1.0}, {"value": None}]}
         del obj._document
 
         result = values(
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 from datetime import time
 
-from idfkit.schedules.time_utils import END_OF_DAY, END_OF_DAY_MINUTES, evaluate_time_values, time_to_minutes
+from idfkit.schedules.time_utils import (
+    END_OF_DAY,
+    END_OF_DAY_MINUTES,
+    evaluate_time_values,
+    hourly_step_values,
+    time_to_minutes,
+)
 from idfkit.schedules.types import Interpolation, TimeValue
 
 
@@ -95,3 +101,59 @@ class TestEvaluateTimeValues:
         # 13:00 is past the only interval
         result = evaluate_time_values(time_values, time(13, 0), Interpolation.NO)
         assert result == 0.5
+
+    def test_many_intervals(self) -> None:
+        """A 15-minute profile resolves every interval, boundaries included."""
+        time_values = [
+            TimeValue(until_time=time((q + 1) * 15 // 60, (q + 1) * 15 % 60) if q < 95 else END_OF_DAY, value=float(q))
+            for q in range(96)
+        ]
+
+        for q in range(96):
+            start = time(q * 15 // 60, q * 15 % 60)
+            assert evaluate_time_values(time_values, start, Interpolation.NO) == float(q)
+        assert evaluate_time_values(time_values, time(23, 59, 59), Interpolation.NO) == 95.0
+
+    def test_interpolation_uses_previous_interval(self) -> None:
+        """Interpolation runs from the previous interval's end and value."""
+        time_values = [
+            TimeValue(until_time=time(8, 0), value=0.0),
+            TimeValue(until_time=time(12, 0), value=1.0),
+            TimeValue(until_time=END_OF_DAY, value=1.0),
+        ]
+
+        assert evaluate_time_values(time_values, time(10, 0), Interpolation.AVERAGE) == 0.5
+        assert evaluate_time_values(time_values, time(10, 0), Interpolation.NO) == 1.0
+
+
+class TestHourlyStepValues:
+    """Tests for hourly_step_values."""
+
+    def test_on_the_hour_matches_step_evaluation(self) -> None:
+        """Each hour's entry is the step value anywhere in that hour."""
+        time_values = [
+            TimeValue(until_time=time(8, 0), value=0.0),
+            TimeValue(until_time=time(18, 0), value=1.0),
+            TimeValue(until_time=END_OF_DAY, value=0.5),
+        ]
+
+        hourly = hourly_step_values(time_values)
+
+        assert hourly == (0.0,) * 8 + (1.0,) * 10 + (0.5,) * 6
+        for hour in range(24):
+            for minute in (0, 30, 59):
+                current = time(hour, minute)
+                assert hourly[hour] == evaluate_time_values(time_values, current, Interpolation.NO)
+
+    def test_off_the_hour_returns_none(self) -> None:
+        """An interval ending mid-hour cannot be tabulated by hour."""
+        time_values = [
+            TimeValue(until_time=time(8, 30), value=0.0),
+            TimeValue(until_time=END_OF_DAY, value=1.0),
+        ]
+
+        assert hourly_step_values(time_values) is None
+
+    def test_empty_returns_none(self) -> None:
+        """An empty list keeps the general evaluation path."""
+        assert hourly_step_values([]) is None
@@ -91,6 +91,12 @@ class TestSpecialDay:
         assert not sd.contains(date(2024, 12, 23))
         assert not sd.contains(date(2024, 12, 27))
 
+    def test_end_date(self) -> None:
+        """Test end_date is derived from start_date and duration."""
+        sd = SpecialDay(name="New Year", start_date=date(2024, 12, 31), duration=2, day_type="Holiday")
+        assert sd.end_date == date(2025, 1, 1)
+        assert sd == SpecialDay(name="New Year", start_date=date(2024, 12, 31), duration=2, day_type="Holiday")
+
     def test_frozen(self) -> None:
         """Test that SpecialDay is immutable."""
         sd = SpecialDay(
@@ -118,6 +124,24 @@ class TestTimeValue:
         with pytest.raises(AttributeError):
             tv.value = 1.0  # type: ignore[misc]
 
+    def test_until_minutes(self) -> None:
+        """until_minutes is derived from until_time, with 24:00 mapped to exactly 1440."""
+        from idfkit.schedules.time_utils import END_OF_DAY
+
+        assert TimeValue(until_time=time(7, 30, 30), value=0.0).until_minutes == 450.5
+        assert TimeValue(until_time=END_OF_DAY, value=0.0).until_minutes == 1440.0
+        assert TimeValue(until_time=time(8, 0), value=1.0) == TimeValue(until_time=time(8, 0), value=1.0)
+
+    def test_slotted_and_picklable(self) -> None:
+        """TimeValue has no per-instance __dict__ and round-trips through pickle."""
+        import pickle
+
+        tv = TimeValue(until_time=time(7, 30, 15), value=0.5)
+        assert not hasattr(tv, "__dict__")
+        restored = pickle.loads(pickle.dumps(tv))  # noqa: S301
+        assert restored == tv
+        assert restored.until_minutes == tv.until_minutes
+
 
 class TestCompactDayRule:
     """Tests for CompactDayRule dataclass."""
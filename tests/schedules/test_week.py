@@ -65,10 +65,8 @@ def _make_day_schedule(name: str, obj_type: str, hourly_value: float = 1.0) -> M
             "Minutes per Item": 60,
             "Interpolate to Timestep": None,
         }
-        for i in range(1, 25):
-            fields[f"Value {i}"] = hourly_value
-        fields["Value 25"] = None
         obj.get.side_effect = lambda f: fields.get(f)
+        obj.data = {"extensions": [{"value": hourly_value}] * 24}
     return obj
 
 
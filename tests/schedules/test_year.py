@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock
 
 import pytest
 
+from idfkit import new_document
+from idfkit.document import IDFDocument
+from idfkit.objects import IDFObject
 from idfkit.schedules.types import DayType, Interpolation
 from idfkit.schedules.year import (
     _find_week_for_date,
     _find_week_schedule,
     _parse_month_day,
+    _year_entry,  # pyright: ignore[reportPrivateUsage]
     evaluate_year,
+    get_year_values,
 )
 
 # ---------------------------------------------------------------------------
@@ -125,6 +130,23 @@ class TestFindWeekSchedule:
         doc.get_collection.return_value = []
         assert _find_week_schedule(doc, "NonExistent") is None
 
+    def test_index_follows_document_changes(self) -> None:
+        """Adding, renaming and removing week schedules refreshes the cached index."""
+        doc = new_document()
+        daily = doc.add("Schedule:Week:Daily", "Office Week", validate=False)
+        assert _find_week_schedule(doc, "office week") is daily
+        assert _find_week_schedule(doc, "Shop Week") is None
+
+        compact = doc.add("Schedule:Week:Compact", "Shop Week", validate=False)
+        assert _find_week_schedule(doc, "Shop Week") is compact
+
+        daily.name = "Lab Week"
+        assert _find_week_schedule(doc, "Office Week") is None
+        assert _find_week_schedule(doc, "Lab Week") is daily
+
+        doc.removeidfobject(compact)
+        assert _find_week_schedule(doc, "Shop Week") is None
+
 
 # ---------------------------------------------------------------------------
 # _find_week_for_date
@@ -306,6 +328,61 @@ class TestFindWeekForDate:
         assert result is None
 
 
+class TestRangeTable:
+    """Tests for the month/day range table behind _find_week_for_date."""
+
+    def test_first_range_wins_and_leap_day_boundaries(self) -> None:
+        """Overlaps resolve to the earlier range; a Feb 29 boundary works in any year."""
+        year_obj = _make_year_obj([
+            ("Winter", "1", "1", "2", "29"),
+            ("Overlap", "2", "1", "12", "31"),
+        ])
+        doc = MagicMock()
+        doc.get_collection.return_value = []
+
+        for year in (2023, 2024):
+            assert _find_week_for_date(year_obj, date(year, 2, 15), year, doc)[0] == "Winter"
+            assert _find_week_for_date(year_obj, date(year, 2, 28), year, doc)[0] == "Winter"
+            assert _find_week_for_date(year_obj, date(year, 3, 1), year, doc)[0] == "Overlap"
+        assert _find_week_for_date(year_obj, date(2024, 2, 29), 2024, doc)[0] == "Winter"
+
+    def test_impossible_date_raises(self) -> None:
+        year_obj = _make_year_obj([("AllYear", "1", "1", "2", "30")])
+        with pytest.raises(ValueError):
+            _find_week_for_date(year_obj, date(2024, 1, 15), 2024, MagicMock())
+
+
+class TestYearRangesCache:
+    """Tests for per-object caching of parsed Schedule:Year ranges."""
+
+    def test_cached_until_mutated(self) -> None:
+        """Repeat lookups reuse the parsed ranges; a mutation re-parses."""
+        doc = new_document()
+        year_obj = doc.add(
+            "Schedule:Year",
+            "Office Year",
+            schedule_weeks=[
+                {
+                    "schedule_week_name": "Office Week",
+                    "start_month": 1,
+                    "start_day": 1,
+                    "end_month": "June",
+                    "end_day": 30,
+                },
+            ],
+            validate=False,
+        )
+
+        entry = _year_entry(year_obj)
+        assert entry[0] == [(1, 1, 6, 30, "Office Week")]
+        assert _year_entry(year_obj) is entry
+
+        year_obj["schedule_weeks"] = [
+            {"schedule_week_name": "Shop Week", "start_month": 1, "start_day": 1, "end_month": 12, "end_day": 31},
+        ]
+        assert _year_entry(year_obj)[0] == [(1, 1, 12, 31, "Shop Week")]
+
+
 # ---------------------------------------------------------------------------
 # evaluate_year
 # ---------------------------------------------------------------------------
@@ -542,3 +619,107 @@ class TestEvaluateYear:
             interpolation=Interpolation.NO,
         )
         assert result == 1.0
+
+
+class TestGetYearValues:
+    """Tests for get_year_values."""
+
+    def _make_document(self) -> tuple[IDFDocument, IDFObject]:
+        """Build a Schedule:Year with a Week:Daily summer and a wrapped Week:Compact winter."""
+        doc = new_document()
+        doc.add(
+            "Schedule:Day:Interval",
+            "Workday",
+            validate=False,
+            data=[
+                {"time": "08:00", "value_until_time": "0.1"},
+                {"time": "17:30", "value_until_time": "0.9"},
+                {"time": "24:00", "value_until_time": "0.2"},
+            ],
+        )
+        doc.add("Schedule:Constant", "Off", validate=False, hourly_value=0.05)
+        doc.add(
+            "Schedule:Week:Compact",
+            "WinterWeek",
+            validate=False,
+            data=[
+                {"daytype_list": "Weekdays", "schedule_day_name": "Workday"},
+                {"daytype_list": "AllOtherDays", "schedule_day_name": "Off"},
+            ],
+        )
+        doc.add(
+            "Schedule:Week:Daily",
+            "SummerWeek",
+            validate=False,
+            sunday_schedule_day_name="Off",
+            monday_schedule_day_name="Workday",
+            tuesday_schedule_day_name="Workday",
+            wednesday_schedule_day_name="Workday",
+            thursday_schedule_day_name="Workday",
+            friday_schedule_day_name="Workday",
+            saturday_schedule_day_name="Off",
+            holiday_schedule_day_name="Off",
+            summerdesignday_schedule_day_name="Workday",
+            winterdesignday_schedule_day_name="Workday",
+        )
+        year_obj = doc.add(
+            "Schedule:Year",
+            "YearSched",
+            validate=False,
+            schedule_weeks=[
+                {
+                    "schedule_week_name": "SummerWeek",
+                    "start_month": "5",
+                    "start_day": "1",
+                    "end_month": "9",
+                    "end_day": "30",
+                },
+                {
+                    "schedule_week_name": "WinterWeek",
+                    "start_month": "10",
+                    "start_day": "1",
+                    "end_month": "4",
+                    "end_day": "30",
+                },
+            ],
+        )
+        return doc, year_obj
+
+    def test_matches_pointwise_evaluation(self) -> None:
+        """Sweeping a range gives the same values as evaluating each timestep."""
+        doc, year_obj = self._make_document()
+        holidays = {date(2024, 7, 4), date(2024, 12, 25)}
+        # Windows crossing a range boundary, a holiday and a wrapped range.
+        for first, last in (
+            (date(2024, 4, 28), date(2024, 5, 6)),
+            (date(2024, 7, 1), date(2024, 7, 9)),
+            (date(2024, 12, 20), date(2024, 12, 31)),
+        ):
+            result = get_year_values(
+                year_obj, first, last, doc, timestep=4, holidays=holidays, interpolation=Interpolation.AVERAGE
+            )
+
+            expected: list[float] = []
+            current = datetime(first.year, first.month, first.day)
+            while current.date() <= last:
+                expected.append(
+                    evaluate_year(year_obj, current, doc, holidays=holidays, interpolation=Interpolation.AVERAGE)
+                )
+                current += timedelta(minutes=15)
+            assert result == expected
+
+    def test_day_type_override(self) -> None:
+        doc, year_obj = self._make_document()
+        result = get_year_values(year_obj, date(2024, 7, 6), date(2024, 7, 6), doc, day_type=DayType.SUMMER_DESIGN)
+        expected = [
+            evaluate_year(year_obj, datetime(2024, 7, 6, hour), doc, DayType.SUMMER_DESIGN) for hour in range(24)
+        ]
+        assert result == expected
+
+    def test_uncovered_date_raises(self) -> None:
+        year_obj = _make_year_obj([("WeekSched", "6", "1", "8", "31")])
+        doc = MagicMock()
+        doc.get_collection.return_value = []
+
+        with pytest.raises(ValueError, match="Week schedule not found"):
+            get_year_values(year_obj, date(2024, 1, 1), date(2024, 1, 2), doc)
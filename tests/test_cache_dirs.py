@@ -0,0 +1,40 @@
+"""Tests for idfkit._cache_dirs."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from idfkit._cache_dirs import user_cache_dir  # pyright: ignore[reportPrivateUsage]
+
+
+class TestUserCacheDir:
+    """Tests for user_cache_dir()."""
+
+    def test_linux(self) -> None:
+        with patch("idfkit._cache_dirs.sys") as mock_sys:
+            mock_sys.platform = "linux"
+            with patch.dict(os.environ, {}, clear=True):
+                result = user_cache_dir("compat")
+        assert result == Path.home() / ".cache" / "idfkit" / "compat"
+
+    def test_linux_xdg(self, tmp_path: Path) -> None:
+        with patch("idfkit._cache_dirs.sys") as mock_sys:
+            mock_sys.platform = "linux"
+            with patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmp_path)}, clear=True):
+                result = user_cache_dir("literals")
+        assert result == tmp_path / "idfkit" / "literals"
+
+    def test_darwin(self) -> None:
+        with patch("idfkit._cache_dirs.sys") as mock_sys:
+            mock_sys.platform = "darwin"
+            result = user_cache_dir("compat")
+        assert result == Path.home() / "Library" / "Caches" / "idfkit" / "compat"
+
+    def test_win32(self, tmp_path: Path) -> None:
+        with patch("idfkit._cache_dirs.sys") as mock_sys:
+            mock_sys.platform = "win32"
+            with patch.dict(os.environ, {"LOCALAPPDATA": str(tmp_path)}):
+                result = user_cache_dir("compat")
+        assert result == tmp_path / "idfkit" / "cache" / "compat"
@@ -0,0 +1,106 @@
+"""Unit tests for idfkit.compat._ast_cache (content-addressed literal cache)."""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from idfkit.compat import _ast_cache  # pyright: ignore[reportPrivateUsage]
+from idfkit.compat._extract import extract_literals
+from idfkit.compat._models import ExtractedLiteral, LiteralKind
+
+SOURCE = 'doc.add("Material", "Mat1", roughness="MediumSmooth")\n'
+
+
+class TestLiteralCache:
+    """Tests for the L1/L2 literal cache behind extract_literals."""
+
+    def test_round_trip_through_disk(self, _isolated_literal_cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        _ast_cache.set_disk_cache_dir(_isolated_literal_cache_dir)
+        literals = extract_literals(SOURCE)
+        key = _ast_cache.source_key(SOURCE)
+        assert (_isolated_literal_cache_dir / f"{key}.json.z").is_file()
+
+        # Drop L1 so the next load must come from disk.
+        monkeypatch.setattr(_ast_cache, "_memory", OrderedDict[str, list[ExtractedLiteral]]())
+        assert _ast_cache.load(key) == literals
+
+    def test_disk_cache_is_off_by_default(self, _isolated_literal_cache_dir: Path) -> None:
+        assert _ast_cache.get_disk_cache_dir() is None
+        extract_literals(SOURCE)
+        assert not any(_isolated_literal_cache_dir.iterdir())
+
+    def test_memory_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(_ast_cache, "_MEMORY_MAX_ENTRIES", 2)
+        sources = [SOURCE, SOURCE + "\n", SOURCE + "\n\n"]
+        for source in sources:
+            extract_literals(source)
+        keys = [_ast_cache.source_key(source) for source in sources]
+        assert _ast_cache.load(keys[0]) is None
+        assert _ast_cache.load(keys[1]) is not None
+        assert _ast_cache.load(keys[2]) is not None
+
+    def test_cache_hit_skips_parsing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        expected = extract_literals(SOURCE)
+
+        def _fail(*_args: object) -> None:
+            raise AssertionError
+
+        monkeypatch.setattr("idfkit.compat._extract.ast.parse", _fail)
+        assert extract_literals(SOURCE) == expected
+
+    def test_returned_list_is_caller_owned(self) -> None:
+        first = extract_literals(SOURCE)
+        first.clear()
+        assert len(extract_literals(SOURCE)) == 2
+
+    def test_key_depends_on_source(self) -> None:
+        assert _ast_cache.source_key(SOURCE) != _ast_cache.source_key(SOURCE + "\n")
+
+    def test_corrupt_entry_is_a_miss(self, _isolated_literal_cache_dir: Path) -> None:
+        _ast_cache.set_disk_cache_dir(_isolated_literal_cache_dir)
+        key = _ast_cache.source_key(SOURCE)
+        (_isolated_literal_cache_dir / f"{key}.json.z").write_bytes(b"garbage")
+        assert _ast_cache.load(key) is None
+
+    def test_prune_evicts_least_recently_used(self, _isolated_literal_cache_dir: Path) -> None:
+        _ast_cache.set_disk_cache_dir(_isolated_literal_cache_dir)
+        sources = [SOURCE, SOURCE + "\n", SOURCE + "\n\n"]
+        keys = [_ast_cache.source_key(source) for source in sources]
+        paths = [_isolated_literal_cache_dir / f"{key}.json.z" for key in keys]
+        for age, source, path in zip((300, 200, 100), sources, paths, strict=True):
+            extract_literals(source)
+            mtime = path.stat().st_mtime - age
+            os.utime(path, (mtime, mtime))
+
+        # A disk hit marks the oldest entry as recently used.
+        _ast_cache._memory.clear()  # pyright: ignore[reportPrivateUsage]
+        assert _ast_cache.load(keys[0]) is not None
+
+        size = paths[0].stat().st_size
+        _ast_cache.prune_disk_cache(max_bytes=2 * size)
+        assert [path.is_file() for path in paths] == [True, False, True]
+
+    def test_prune_is_noop_while_disabled(self, _isolated_literal_cache_dir: Path) -> None:
+        entry = _isolated_literal_cache_dir / "entry.json.z"
+        entry.write_bytes(b"x")
+        _ast_cache.prune_disk_cache(max_bytes=0)
+        assert entry.is_file()
+
+    def test_encode_decode_preserves_optional_fields(self) -> None:
+        literals = [
+            ExtractedLiteral(value="Zone", kind=LiteralKind.OBJECT_TYPE, line=1, col=0, end_col=6),
+            ExtractedLiteral(
+                value="Smooth",
+                kind=LiteralKind.CHOICE_VALUE,
+                line=2,
+                col=4,
+                end_col=12,
+                obj_type="Material",
+                field_name="roughness",
+            ),
+        ]
+        assert _ast_cache._decode(_ast_cache._encode(literals)) == literals  # pyright: ignore[reportPrivateUsage]
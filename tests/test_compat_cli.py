@@ -9,8 +9,10 @@ import pytest
 
 from idfkit.compat._checker import check_compatibility, resolve_version
 from idfkit.compat._cli import main
+from idfkit.compat._diff import SchemaIndex
 from idfkit.compat._models import CompatSeverity, Diagnostic
 from idfkit.compat._sarif import format_sarif
+from idfkit.schema import EpJSONSchema
 
 # ---------------------------------------------------------------------------
 # Fixtures: small Python files used as test inputs
@@ -34,6 +36,15 @@ doc.add("CompletelyFakeObject_XYZ", "Fake1")
 """
 
 
+@pytest.fixture(autouse=True)
+def _isolated_index_cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep cached schema indices out of the user's real cache directory."""
+    cache_dir = tmp_path_factory.mktemp("compat-index-cache")
+    monkeypatch.setattr("idfkit.compat._checker.default_index_cache_dir", lambda: cache_dir)
+    monkeypatch.setattr("idfkit.compat._checker._index_cache_dir", None)
+    return cache_dir
+
+
 @pytest.fixture
 def simple_script_file(tmp_path: Path) -> Path:
     p = tmp_path / "simple.py"
@@ -215,6 +226,78 @@ class TestCheckCompatibilityGroupFiltering:
         assert len(diags) == len(diags_explicit)
 
 
+class TestAllowedTypesCache:
+    """The group filter is merged once per (targets, include, exclude) combination."""
+
+    def test_repeated_filter_is_memoized(self) -> None:
+        from idfkit.compat._checker import _build_allowed_types  # pyright: ignore[reportPrivateUsage]
+
+        _build_allowed_types.cache_clear()
+        for _ in range(3):
+            check_compatibility(
+                SIMPLE_SCRIPT,
+                "test.py",
+                targets=[(24, 1, 0), (24, 2, 0)],
+                include_groups={"Thermal Zones and Surfaces"},
+            )
+        info = _build_allowed_types.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_allowed_types_are_casefolded(self) -> None:
+        from idfkit.compat._checker import _build_allowed_types  # pyright: ignore[reportPrivateUsage]
+
+        allowed = _build_allowed_types(((24, 1, 0), (24, 2, 0)), frozenset({"Thermal Zones and Surfaces"}), None)
+        assert allowed is not None
+        assert "zone" in allowed
+        assert "material" not in allowed
+        assert _build_allowed_types(((24, 1, 0), (24, 2, 0)), None, None) is None
+
+
+class TestPartialObjectTypes:
+    """Object types present in only some targets are tabulated once per index set."""
+
+    def test_table_lists_reference_and_missing_versions(self) -> None:
+        from idfkit.compat._checker import _partial_object_types  # pyright: ignore[reportPrivateUsage]
+
+        indices = {
+            (1, 0, 0): SchemaIndex(version=(1, 0, 0), object_types=frozenset({"Zone", "Old"}), choices={}),
+            (2, 0, 0): SchemaIndex(version=(2, 0, 0), object_types=frozenset({"Zone", "New"}), choices={}),
+            (3, 0, 0): SchemaIndex(version=(3, 0, 0), object_types=frozenset({"Zone", "New"}), choices={}),
+        }
+        table = _partial_object_types(indices)
+        assert "zone" not in table
+        assert table["old"] == ((1, 0, 0), ((2, 0, 0), (3, 0, 0)))
+        assert table["new"] == ((2, 0, 0), ((1, 0, 0),))
+        assert _partial_object_types(indices) is table
+
+    def test_table_rebuilt_for_different_index_objects(self) -> None:
+        from idfkit.compat._checker import _partial_object_types  # pyright: ignore[reportPrivateUsage]
+
+        def _indices(extra: str) -> dict[tuple[int, int, int], SchemaIndex]:
+            return {
+                (1, 0, 0): SchemaIndex(version=(1, 0, 0), object_types=frozenset({"Zone", extra}), choices={}),
+                (2, 0, 0): SchemaIndex(version=(2, 0, 0), object_types=frozenset({"Zone"}), choices={}),
+            }
+
+        assert set(_partial_object_types(_indices("A"))) == {"a"}
+        assert set(_partial_object_types(_indices("B"))) == {"b"}
+
+    def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from idfkit.compat import _checker  # pyright: ignore[reportPrivateUsage]
+
+        monkeypatch.setattr(_checker, "_partial_types_cache", {})
+        monkeypatch.setattr(_checker, "_PARTIAL_TYPES_MAX_ENTRIES", 2)
+        for major in range(1, 5):
+            indices = {
+                (major, 0, 0): SchemaIndex(version=(major, 0, 0), object_types=frozenset({"Zone"}), choices={}),
+                (major, 1, 0): SchemaIndex(version=(major, 1, 0), object_types=frozenset({"Zone", "New"}), choices={}),
+            }
+            _checker._partial_object_types(indices)  # pyright: ignore[reportPrivateUsage]
+        cache = _checker._partial_types_cache  # pyright: ignore[reportPrivateUsage]
+        assert list(cache) == [((3, 0, 0), (3, 1, 0)), ((4, 0, 0), (4, 1, 0))]
+
+
 class TestResolveVersion:
     """Tests for resolve_version."""
 
@@ -303,6 +386,32 @@ class TestCLI:
             # Should have diagnostic-style lines
             assert "C001" in captured.out or "C002" in captured.out
 
+    def test_cli_persists_literal_cache(self, simple_script_file: Path, _isolated_literal_cache_dir: Path) -> None:
+        """The check subcommand enables the on-disk literal cache."""
+        with pytest.raises(SystemExit):
+            main(["check", str(simple_script_file), "--from", "24.1", "--to", "24.2"])
+        assert list(_isolated_literal_cache_dir.glob("*.json.z"))
+
+    def test_cli_persists_index_cache(
+        self, simple_script_file: Path, _isolated_index_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The check subcommand enables the on-disk schema index cache."""
+        from idfkit.compat import _checker  # pyright: ignore[reportPrivateUsage]
+
+        monkeypatch.setattr(_checker, "_index_cache", {})
+        with pytest.raises(SystemExit):
+            main(["check", str(simple_script_file), "--from", "24.1", "--to", "24.2"])
+        assert list(_isolated_index_cache_dir.glob("index-*-24-1-0-*.json.z"))
+
+    def test_cli_no_cache_leaves_disk_untouched(
+        self, simple_script_file: Path, _isolated_literal_cache_dir: Path, _isolated_index_cache_dir: Path
+    ) -> None:
+        """--no-cache keeps both the literal and schema index caches in memory."""
+        with pytest.raises(SystemExit):
+            main(["check", str(simple_script_file), "--from", "24.1", "--to", "24.2", "--no-cache"])
+        assert not any(_isolated_literal_cache_dir.iterdir())
+        assert not any(_isolated_index_cache_dir.iterdir())
+
     def test_cli_file_not_found(self, capsys: pytest.CaptureFixture[str]) -> None:
         """CLI exits 2 when file does not exist."""
         with pytest.raises(SystemExit) as exc_info:
@@ -347,6 +456,75 @@ class TestCLI:
             assert "to_version" in diag
             assert "suggested_fix" in diag
 
+    def test_cli_multiple_files_parallel_in_order(
+        self,
+        removed_type_script: tuple[Path, str],
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Multi-file runs through the process pool keep diagnostics in input order."""
+        from idfkit.compat import _cli  # pyright: ignore[reportPrivateUsage]
+
+        p, _removed_type = removed_type_script
+        copies: list[str] = []
+        for i in range(3):
+            copy = tmp_path / f"copy_{i}.py"
+            copy.write_text(p.read_text())
+            copies.append(str(copy))
+        unrelated = tmp_path / "unrelated.py"
+        unrelated.write_text("x = 1\n")
+        files = [copies[0], str(unrelated), copies[1], copies[2]]
+
+        monkeypatch.setattr(_cli, "_PARALLEL_MIN_FILES", 2)
+        monkeypatch.setattr(_cli.os, "cpu_count", lambda: 2)
+        with pytest.raises(SystemExit) as exc_info:
+            main(["check", *files, "--from", "8.9", "--to", "25.2", "--json"])
+
+        assert exc_info.value.code == 1
+        data = json.loads(capsys.readouterr().out)
+        filenames = [d["filename"] for d in data["diagnostics"]]
+        assert filenames == sorted(filenames, key=copies.index)
+        assert set(filenames) == set(copies)
+
+    def test_pool_workers_start_with_warm_indices(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The parent builds the target indices before forking, and each worker preloads them."""
+        from idfkit.compat import _checker, _cli  # pyright: ignore[reportPrivateUsage]
+
+        files: list[str] = []
+        for i in range(2):
+            f = tmp_path / f"f{i}.py"
+            f.write_text(SIMPLE_SCRIPT)
+            files.append(str(f))
+        targets = [(24, 1, 0), (24, 2, 0)]
+        seen_initargs: list[tuple[object, ...]] = []
+
+        class _RecordingPool:
+            def __init__(self, *, max_workers: int, initializer: object, initargs: tuple[object, ...]) -> None:
+                seen_initargs.append(initargs)
+
+            def __enter__(self) -> _RecordingPool:
+                return self
+
+            def __exit__(self, *_exc: object) -> None:
+                return None
+
+            def map(self, fn: object, *iterables: object) -> list[list[Diagnostic]]:
+                assert set(targets) <= set(_checker._index_cache)  # pyright: ignore[reportPrivateUsage]
+                return [[] for _ in files]
+
+        monkeypatch.setattr(_checker, "_index_cache", {})
+        monkeypatch.setattr(_cli, "_PARALLEL_MIN_FILES", 2)
+        monkeypatch.setattr(_cli.os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(_cli, "ProcessPoolExecutor", _RecordingPool)
+        assert list(_cli._check_files(files, targets, None, None)) == [[], []]  # pyright: ignore[reportPrivateUsage]
+        assert seen_initargs == [(None, None, targets)]
+
+        # A worker started without the parent's memory (spawn) reloads the indices.
+        monkeypatch.setattr(_checker, "_index_cache", {})
+        _cli._init_check_worker(None, None, targets)  # pyright: ignore[reportPrivateUsage]
+        assert set(targets) <= set(_checker._index_cache)  # pyright: ignore[reportPrivateUsage]
+
 
 # ---------------------------------------------------------------------------
 # SARIF output tests
@@ -413,6 +591,76 @@ class TestSARIFOutput:
         assert "fixes" in result
         assert result["fixes"][0]["description"]["text"] == "Use 'NewType' instead"
 
+    def test_write_sarif_matches_format_sarif(self) -> None:
+        """Streaming SARIF to a file object produces the same document."""
+        import io
+
+        from idfkit.compat import write_sarif
+
+        diags = [
+            Diagnostic(
+                code="C001",
+                message=f"Test {i}",
+                severity=CompatSeverity.WARNING,
+                filename="test.py",
+                line=i,
+                col=0,
+                end_col=5,
+                from_version="24.1.0",
+                to_version="25.1.0",
+            )
+            for i in range(1, 4)
+        ]
+        for subset in ([], diags):
+            buf = io.StringIO()
+            write_sarif(subset, buf)
+            assert buf.getvalue() == format_sarif(subset)
+
+    def test_format_sarif_matches_generic_encoder(self) -> None:
+        """Streamed SARIF is byte-identical to dumping the whole log at once."""
+
+        def _result(d: Diagnostic) -> dict[str, object]:
+            region = {"startLine": d.line, "startColumn": d.col + 1, "endColumn": d.end_col + 1}
+            result: dict[str, object] = {
+                "ruleId": d.code,
+                "level": d.severity.value,
+                "message": {"text": d.message},
+                "locations": [{"physicalLocation": {"artifactLocation": {"uri": d.filename}, "region": region}}],
+                "properties": {"from_version": d.from_version, "to_version": d.to_version},
+            }
+            if d.suggested_fix is not None:
+                result["fixes"] = [{"description": {"text": d.suggested_fix}}]
+            return result
+
+        diags = [
+            Diagnostic(
+                code="C002",
+                message='Choice "Rough" \u00e9\n\\',
+                severity=CompatSeverity.ERROR,
+                filename="dir/test.py",
+                line=3,
+                col=4,
+                end_col=11,
+                from_version="24.1.0",
+                to_version="25.1.0",
+                suggested_fix="Use 'Smooth' \u00fc",
+            ),
+            Diagnostic(
+                code="C001",
+                message="Test",
+                severity=CompatSeverity.WARNING,
+                filename="test.py",
+                line=1,
+                col=0,
+                end_col=5,
+                from_version="24.1.0",
+                to_version="25.1.0",
+            ),
+        ]
+        expected = json.loads(format_sarif([]))
+        expected["runs"][0]["results"] = [_result(d) for d in diags]
+        assert format_sarif(diags) == json.dumps(expected, indent=2)
+
     def test_cli_sarif_output(self, removed_type_script: tuple[Path, str], capsys: pytest.CaptureFixture[str]) -> None:
         """CLI --sarif produces valid SARIF output."""
         p, _removed_type = removed_type_script
@@ -639,6 +887,52 @@ class TestDiagnosticModel:
         assert "warning" in s
         assert "Object type 'Foo' not found" in s
 
+    def test_format_json_matches_generic_encoder(self) -> None:
+        """Streamed JSON is byte-identical to dumping the whole payload at once."""
+        import io
+
+        from idfkit.compat._cli import _write_json  # pyright: ignore[reportPrivateUsage]
+
+        diags = [
+            Diagnostic(
+                code="C002",
+                message='Choice "Rough" \u00e9\n\\',
+                severity=CompatSeverity.ERROR,
+                filename="dir/test.py",
+                line=3,
+                col=4,
+                end_col=11,
+                from_version="24.1.0",
+                to_version="25.1.0",
+                suggested_fix="Use 'Smooth'",
+            ),
+            Diagnostic(
+                code="C001",
+                message="Test",
+                severity=CompatSeverity.WARNING,
+                filename="test.py",
+                line=1,
+                col=0,
+                end_col=5,
+                from_version="24.1.0",
+                to_version="25.1.0",
+            ),
+        ]
+        targets = [(24, 1, 0), (25, 1, 0)]
+        for subset in ([], diags):
+            expected = {
+                "targets": ["24.1.0", "25.1.0"],
+                "diagnostics": [d.to_dict() for d in subset],
+                "summary": {
+                    "total": len(subset),
+                    "errors": sum(d.severity == CompatSeverity.ERROR for d in subset),
+                    "warnings": sum(d.severity == CompatSeverity.WARNING for d in subset),
+                },
+            }
+            buf = io.StringIO()
+            _write_json(subset, targets, buf)
+            assert buf.getvalue() == json.dumps(expected, indent=2)
+
 
 class TestCompatRegressionFixes:
     """Regression tests for review feedback fixes."""
@@ -755,6 +1049,124 @@ class TestResolveTargetsEdgeCases:
             main(["check", str(simple_script_file), "--from", "1.0", "--to", "24.1"])
         assert exc_info.value.code == 2
 
+    def test_all_invalid_specs_reported_together(
+        self, simple_script_file: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Every bad spec is reported in one error rather than stopping at the first."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["check", str(simple_script_file), "--targets", "24.abc,24.1,1.0"])
+        assert exc_info.value.code == 2
+        err = capsys.readouterr().err
+        assert "'24.abc'" in err
+        assert "1.0" in err
+
+    def test_invalid_from_spec_exits_2(self, simple_script_file: Path) -> None:
+        """A malformed --from spec is rejected after parsing with exit 2."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["check", str(simple_script_file), "--from", "24..1", "--to", "24.1"])
+        assert exc_info.value.code == 2
+
+
+# ---------------------------------------------------------------------------
+# On-disk schema index cache
+# ---------------------------------------------------------------------------
+
+
+class TestIndexDiskCache:
+    """Tests for the on-disk SchemaIndex cache behind _get_index."""
+
+    def test_index_is_persisted_and_reloaded(
+        self, _isolated_index_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from idfkit.compat import _checker  # pyright: ignore[reportPrivateUsage]
+
+        _checker.set_index_cache_dir(_isolated_index_cache_dir)
+        monkeypatch.setattr(_checker, "_index_cache", {})
+        built = _checker._get_index((24, 1, 0))  # pyright: ignore[reportPrivateUsage]
+        files = list(_isolated_index_cache_dir.glob("index-*-24-1-0-*.json.z"))
+        assert len(files) == 1
+
+        # A fresh process-level cache must be served from disk without rebuilding.
+        monkeypatch.setattr(_checker, "_index_cache", {})
+
+        def _fail(*_args: object) -> None:
+            raise AssertionError
+
+        monkeypatch.setattr(_checker, "build_schema_index", _fail)
+        reloaded = _checker._get_index((24, 1, 0))  # pyright: ignore[reportPrivateUsage]
+        assert reloaded == built
+        assert reloaded.object_types_cf == built.object_types_cf
+        assert reloaded.choices_cf == built.choices_cf
+        assert reloaded.groups == built.groups
+        # Reloaded choice sets are re-shared with the in-process ones.
+        key = ("Material", "roughness")
+        assert reloaded.choices[key] is built.choices[key]
+
+    def test_corrupt_cache_file_is_rebuilt(
+        self, _isolated_index_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from idfkit.compat import _checker  # pyright: ignore[reportPrivateUsage]
+
+        _checker.set_index_cache_dir(_isolated_index_cache_dir)
+        path = _checker._index_cache_path((24, 1, 0))  # pyright: ignore[reportPrivateUsage]
+        assert path is not None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"not an index")
+
+        monkeypatch.setattr(_checker, "_index_cache", {})
+        index = _checker._get_index((24, 1, 0))  # pyright: ignore[reportPrivateUsage]
+        assert "Zone" in index.object_types
+        assert _checker._load_index_from_disk(path) == index  # pyright: ignore[reportPrivateUsage]
+
+    def test_disabled_by_default(self, _isolated_index_cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Library callers keep indices in memory only."""
+        from idfkit.compat import _checker  # pyright: ignore[reportPrivateUsage]
+
+        monkeypatch.setattr(_checker, "_index_cache", {})
+        assert _checker.get_index_cache_dir() is None
+        assert "Zone" in _checker._get_index((24, 1, 0)).object_types  # pyright: ignore[reportPrivateUsage]
+        assert not list(_isolated_index_cache_dir.iterdir())
+
+    def test_superseded_files_are_removed(
+        self, _isolated_index_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from idfkit.compat import _checker  # pyright: ignore[reportPrivateUsage]
+
+        old_format = _isolated_index_cache_dir / "index-v4-24-1-0-0123456789abcdef.json.z"
+        old_schema = _isolated_index_cache_dir / "index-v5-24-1-0-0000000000000000.json.z"
+        other_version = _isolated_index_cache_dir / "index-v4-24-2-0-0123456789abcdef.json.z"
+        for stale in (old_format, old_schema, other_version):
+            stale.write_bytes(b"stale")
+
+        _checker.set_index_cache_dir(_isolated_index_cache_dir)
+        monkeypatch.setattr(_checker, "_index_cache", {})
+        _checker._get_index((24, 1, 0))  # pyright: ignore[reportPrivateUsage]
+        path = _checker._index_cache_path((24, 1, 0))  # pyright: ignore[reportPrivateUsage]
+        assert path is not None
+        assert sorted(_isolated_index_cache_dir.iterdir()) == sorted([path, other_version])
+
+    def test_concurrent_misses_build_each_version_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from idfkit.compat import _checker  # pyright: ignore[reportPrivateUsage]
+        from idfkit.compat._diff import build_schema_index
+
+        monkeypatch.setattr(_checker, "_index_cache", {})
+
+        def _no_disk_hit(_path: Path) -> None:
+            return None
+
+        monkeypatch.setattr(_checker, "_load_index_from_disk", _no_disk_hit)
+        built: list[tuple[int, int, int]] = []
+
+        def _counting_build(schema: EpJSONSchema) -> SchemaIndex:
+            built.append(schema.version)
+            return build_schema_index(schema)
+
+        monkeypatch.setattr(_checker, "build_schema_index", _counting_build)
+        targets = [(24, 1, 0), (24, 2, 0), (24, 1, 0)]
+        indices = _checker._get_indices(targets)  # pyright: ignore[reportPrivateUsage]
+        assert set(indices) == {(24, 1, 0), (24, 2, 0)}
+        assert sorted(built) == [(24, 1, 0), (24, 2, 0)]
+
 
 # ---------------------------------------------------------------------------
 # _checker.py edge cases
@@ -897,6 +1309,28 @@ class TestCheckerEdgeCases:
         # "Smooth" is present in v1 (via canonical lookup) but absent in v2 -> C002 diagnostic
         assert len(out) == 1
         assert out[0].code == "C002"
+        assert "Material.roughness" in out[0].message
+
+
+class TestChoiceSetMemoization:
+    """Choice sets are resolved once per (object type, field) per check."""
+
+    def test_shared_field_resolved_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from idfkit.compat import _checker  # pyright: ignore[reportPrivateUsage]
+
+        calls: list[tuple[str, str]] = []
+        original = _checker._resolve_choice_sets  # pyright: ignore[reportPrivateUsage]
+
+        def _counting_resolve(
+            key_cf: tuple[str, str], indices: dict[tuple[int, int, int], SchemaIndex]
+        ) -> list[tuple[tuple[int, int, int], frozenset[str]]]:
+            calls.append(key_cf)
+            return original(key_cf, indices)
+
+        monkeypatch.setattr(_checker, "_resolve_choice_sets", _counting_resolve)
+        source = "".join(f'doc.add("Material", "M{i}", roughness="MediumSmooth")\n' for i in range(5))
+        check_compatibility(source, "test.py", targets=[(24, 1, 0), (24, 2, 0)])
+        assert calls == [("material", "roughness")]
 
 
 class TestFilterDiagnosticsAndFormatText:
@@ -67,6 +67,40 @@ class TestBuildSchemaIndex:
         for obj_type in index_24_1.object_types:
             assert obj_type in index_24_1.groups, f"{obj_type} missing from groups"
 
+    def test_casefolded_sidecars(self, index_24_1: SchemaIndex) -> None:
+        assert "zone" in index_24_1.object_types_cf
+        assert len(index_24_1.object_types_cf) == len(index_24_1.object_types)
+        assert "mediumsmooth" in index_24_1.choices_cf[("material", "roughness")]
+
+    def test_casefolded_sidecars_derived_for_direct_construction(self) -> None:
+        idx = SchemaIndex(
+            version=(1, 0, 0),
+            object_types=frozenset({"Material"}),
+            choices={("Material", "roughness"): frozenset({"MediumSmooth"})},
+        )
+        assert idx.object_types_cf == frozenset({"material"})
+        assert idx.object_type_by_cf == {"material": "Material"}
+        assert idx.choices_cf == {("material", "roughness"): frozenset({"mediumsmooth"})}
+        assert idx.by_type == {"Material": {"roughness": frozenset({"MediumSmooth"})}}
+
+    def test_equal_choice_sets_share_one_object(self, index_24_1: SchemaIndex, index_24_2: SchemaIndex) -> None:
+        key = ("Material", "roughness")
+        assert index_24_1.choices[key] == index_24_2.choices[key]
+        assert index_24_1.choices[key] is index_24_2.choices[key]
+        assert index_24_1.choices_cf[("material", "roughness")] is index_24_2.choices_cf[("material", "roughness")]
+
+    def test_intern_index_values_reshares_unpickled_sets(self, index_24_1: SchemaIndex) -> None:
+        import pickle
+
+        from idfkit.compat._diff import intern_index_values
+
+        restored = pickle.loads(pickle.dumps(index_24_1))  # noqa: S301
+        key = ("Material", "roughness")
+        assert restored.choices[key] is not index_24_1.choices[key]
+        intern_index_values(restored)
+        assert restored.choices[key] is index_24_1.choices[key]
+        assert restored.by_type["Material"]["roughness"] is index_24_1.choices[key]
+
 
 class TestDiffSchemas:
     """Tests for diff_schemas."""
@@ -125,6 +159,39 @@ class TestDiffSchemas:
         assert ("Material", "roughness") in diff.added_choices
         assert "NewChoice" in diff.added_choices[("Material", "roughness")]
 
+    def test_synthetic_one_sided_choice_keys(self) -> None:
+        """Choice keys present on only one side are reported in full."""
+        idx_a = SchemaIndex(
+            version=(1, 0, 0),
+            object_types=frozenset({"Material"}),
+            choices={("Material", "old_field"): frozenset({"A", "B"}), ("Material", "same"): frozenset({"X"})},
+        )
+        idx_b = SchemaIndex(
+            version=(2, 0, 0),
+            object_types=frozenset({"Material"}),
+            choices={("Material", "new_field"): frozenset({"C"}), ("Material", "same"): frozenset({"X"})},
+        )
+        diff = diff_schemas(idx_a, idx_b)
+        assert diff.removed_choices == {("Material", "old_field"): frozenset({"A", "B"})}
+        assert diff.added_choices == {("Material", "new_field"): frozenset({"C"})}
+
+    def test_choice_diff_matches_flat_key_reference(self) -> None:
+        """The per-type diff agrees with a straightforward diff over flat choice keys."""
+        idx_old = build_schema_index(get_schema((9, 0, 1)))
+        idx_new = build_schema_index(get_schema((25, 2, 0)))
+        removed: dict[tuple[str, str], frozenset[str]] = {}
+        added: dict[tuple[str, str], frozenset[str]] = {}
+        for key in idx_old.choices.keys() | idx_new.choices.keys():
+            old_vals = idx_old.choices.get(key, frozenset())
+            new_vals = idx_new.choices.get(key, frozenset())
+            if old_vals - new_vals:
+                removed[key] = old_vals - new_vals
+            if new_vals - old_vals:
+                added[key] = new_vals - old_vals
+        diff = diff_schemas(idx_old, idx_new)
+        assert diff.removed_choices == removed
+        assert diff.added_choices == added
+
     def test_diff_across_major_versions(self) -> None:
         """Test diffing between substantially different versions (8.9 vs 25.2)."""
         idx_old = build_schema_index(get_schema((8, 9, 0)))
@@ -160,6 +227,21 @@ class TestExtractEnumValues:
         result = _extract_enum_values(field_schema)
         assert result == {"Choice1", "Choice2"}
 
+    def test_enum_and_anyof_combined(self) -> None:
+        """Direct enum values and anyOf branches are merged."""
+        from idfkit.compat._diff import _extract_enum_values  # pyright: ignore[reportPrivateUsage]
+
+        result = _extract_enum_values({"enum": ["A"], "anyOf": [{"type": "number"}, {"enum": ["B"]}]})
+        assert result == frozenset({"A", "B"})
+
+    def test_no_enum_keys_returns_shared_empty_set(self) -> None:
+        """Fields without enum/anyOf share one empty frozenset."""
+        from idfkit.compat._diff import _extract_enum_values  # pyright: ignore[reportPrivateUsage]
+
+        first = _extract_enum_values({"type": "number"})
+        assert first == frozenset()
+        assert _extract_enum_values({}) is first
+
 
 class TestBuildSchemaIndexEdgeCases:
     """Edge-case tests for build_schema_index."""
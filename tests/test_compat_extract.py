@@ -190,6 +190,34 @@ zones = model["Zone"]
         assert len(obj_types) == 1
         assert obj_types[0].value == "Zone"
 
+    def test_import_inside_type_checking_block(self) -> None:
+        source = """from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from idfkit import IDFDocument
+zones = model["Zone"]
+"""
+        literals = extract_literals(source)
+        assert [lit.value for lit in literals] == ["Zone"]
+
+    def test_import_inside_try_block(self) -> None:
+        source = """try:
+    import idfkit
+except ImportError:
+    idfkit = None
+zones = model["Zone"]
+"""
+        literals = extract_literals(source)
+        assert [lit.value for lit in literals] == ["Zone"]
+
+    def test_import_inside_function_not_detected(self) -> None:
+        """Only module-level imports enable subscript extraction."""
+        source = """def load():
+    import idfkit
+zones = model["Zone"]
+"""
+        assert extract_literals(source) == []
+
     def test_non_idfkit_import_not_detected(self) -> None:
         """A regular ``import os`` does not count as an idfkit import."""
         source = """import os
@@ -249,3 +277,51 @@ class TestExtractAddEdgeCases:
         source = "doc.add()\n"
         literals = extract_literals(source)
         assert len(literals) == 0
+
+    def test_repeated_names_share_one_string_object(self) -> None:
+        """Object types and field names are interned across literals."""
+        source = "".join(f'doc.add("Material", "M{i}", {{"roughness": "Smooth"}})\n' for i in range(3))
+        literals = extract_literals(source)
+        obj_types = [lit.value for lit in literals if lit.kind == LiteralKind.OBJECT_TYPE]
+        fields = [lit.field_name for lit in literals if lit.kind == LiteralKind.CHOICE_VALUE]
+        assert all(v is obj_types[0] for v in obj_types)
+        assert all(f is fields[0] for f in fields)
+
+
+class TestPrefilter:
+    """Tests for the regex pre-filter that skips irrelevant sources."""
+
+    def test_unrelated_source_is_not_parsed(self) -> None:
+        """Sources without idfkit or an ``add`` token return [] even if unparsable."""
+        from idfkit.compat._extract import may_contain_literals
+
+        source = "def broken(:\n    total = addition(1)\n"
+        assert not may_contain_literals(source)
+        assert not may_contain_literals(source.encode())
+        assert extract_literals(source) == []
+
+    def test_add_token_variants_pass(self) -> None:
+        """Any spelling of an ``add`` attribute access passes the filter."""
+        from idfkit.compat._extract import may_contain_literals
+
+        for source in ('doc.add("Zone")', 'doc . add ("Zone")', 'doc.\\\nadd("Zone")', "import idfkit"):
+            assert may_contain_literals(source)
+            assert may_contain_literals(source.encode())
+
+
+class TestVisitorReuse:
+    """The per-thread visitor is reset between files."""
+
+    def test_results_do_not_leak_between_files(self) -> None:
+        first = extract_literals('import idfkit\ndoc["Zone"]\n')
+        second = extract_literals('doc["Zone"]\ndoc.add("Material")\n')
+        assert [lit.value for lit in first] == ["Zone"]
+        # No idfkit import in the second file, so the subscript is not reported.
+        assert [lit.value for lit in second] == ["Material"]
+        assert first is not second
+
+    def test_nested_calls_inside_add_arguments_are_visited(self) -> None:
+        """Pruning leaf nodes must not skip ``add`` calls or subscripts nested in arguments."""
+        source = 'import idfkit\ndoc.add("Construction", "C", {"layer": doc.add("Material", roughness=doc["Zone"])})\n'
+        values = sorted(lit.value for lit in extract_literals(source))
+        assert values == ["Construction", "Material", "Zone"]
@@ -244,6 +244,11 @@ class TestIDFDocumentSchedules:
         # Cache should be invalidated
         assert "S2" in empty_doc.schedules_dict
 
+    def test_addidfobject_invalidates_schedules_cache(self, empty_doc: IDFDocument) -> None:
+        _ = empty_doc.schedules_dict  # populates cache
+        empty_doc.addidfobject(IDFObject(obj_type="Schedule:Constant", name="S3"))
+        assert "S3" in empty_doc.schedules_dict
+
     def test_get_used_schedules(self, empty_doc: IDFDocument) -> None:
         empty_doc.add("Schedule:Constant", "UsedSchedule", {"hourly_value": 1.0})
         empty_doc.add("Schedule:Constant", "UnusedSchedule", {"hourly_value": 0.5})
@@ -5,6 +5,8 @@ from __future__ import annotations
 import gzip
 import io
 import json
+import logging
+import os
 import tarfile
 from pathlib import Path
 from typing import Any
@@ -17,9 +19,12 @@ from idfkit.download import (
     _GITHUB_API_BASE,
     _SCHEMA_FILENAME,
     _SCHEMA_FILENAME_GZ,
-    _extract_schema_from_tarball,
+    _ChunkStream,
+    _download_ranges,
+    _download_schema_from_tarball,
     _find_linux_tarball_url,
     _get_release_assets,
+    _scan_tarball_for_schema,
     download_all_schemas,
     download_schema,
 )
@@ -52,7 +57,7 @@ def _make_assets(*, has_linux: bool = True) -> list[dict[str, Any]]:
 def _mock_urlopen_response(data: bytes) -> MagicMock:
     """Create a MagicMock that behaves like a urlopen context manager response."""
     mock_resp = MagicMock()
-    mock_resp.read.return_value = data
+    mock_resp.read.side_effect = io.BytesIO(data).read
     mock_resp.__enter__ = lambda s: s
     mock_resp.__exit__ = MagicMock(return_value=False)
     return mock_resp
@@ -63,12 +68,18 @@ def _mock_urlopen_response(data: bytes) -> MagicMock:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture
+def release_cache_root(tmp_path: Path) -> Path:
+    """An empty schema root, so no real release cache can answer a 304."""
+    return tmp_path / "schemas"
+
+
 @patch("idfkit.download.urlopen")
-def test_get_release_assets(mock_urlopen: MagicMock) -> None:
+def test_get_release_assets(mock_urlopen: MagicMock, release_cache_root: Path) -> None:
     payload = {"assets": [{"name": "file.tar.gz"}]}
     mock_urlopen.return_value = _mock_urlopen_response(json.dumps(payload).encode())
 
-    result = _get_release_assets((24, 1, 0))
+    result = _get_release_assets((24, 1, 0), release_cache_root)
     assert result == [{"name": "file.tar.gz"}]
 
     # Verify the constructed URL contains the expected version tag (v24.1.0)
@@ -78,13 +89,64 @@ def test_get_release_assets(mock_urlopen: MagicMock) -> None:
 
 
 @patch("idfkit.download.urlopen")
-def test_get_release_assets_empty(mock_urlopen: MagicMock) -> None:
+def test_get_release_assets_empty(mock_urlopen: MagicMock, release_cache_root: Path) -> None:
     mock_urlopen.return_value = _mock_urlopen_response(json.dumps({}).encode())
 
-    result = _get_release_assets((24, 1, 0))
+    result = _get_release_assets((24, 1, 0), release_cache_root)
     assert result == []
 
 
+@patch("idfkit.download.urlopen")
+def test_get_release_assets_caches_etag(mock_urlopen: MagicMock, release_cache_root: Path) -> None:
+    payload = {"assets": [{"name": "file.tar.gz"}]}
+    resp = _mock_urlopen_response(json.dumps(payload).encode())
+    resp.headers = {"ETag": '"abc123"'}
+    mock_urlopen.return_value = resp
+
+    assert _get_release_assets((24, 1, 0), release_cache_root) == payload["assets"]
+
+    cached = json.loads((release_cache_root / "releases" / "v24.1.0.json").read_text())
+    assert cached == {"etag": '"abc123"', "assets": payload["assets"]}
+    assert mock_urlopen.call_args[0][0].get_header("If-none-match") is None
+
+
+@patch("idfkit.download.urlopen")
+def test_get_release_assets_not_modified_uses_cache(mock_urlopen: MagicMock, release_cache_root: Path) -> None:
+    cache = release_cache_root / "releases" / "v24.1.0.json"
+    cache.parent.mkdir(parents=True)
+    cache.write_text(json.dumps({"etag": '"abc123"', "assets": [{"name": "cached.tar.gz"}]}))
+    mock_urlopen.side_effect = HTTPError("url", 304, "Not Modified", {}, None)  # type: ignore[arg-type]
+
+    assert _get_release_assets((24, 1, 0), release_cache_root) == [{"name": "cached.tar.gz"}]
+
+    assert mock_urlopen.call_args[0][0].get_header("If-none-match") == '"abc123"'
+
+
+@patch("idfkit.download.urlopen")
+def test_get_release_assets_not_modified_without_cache_raises(
+    mock_urlopen: MagicMock, release_cache_root: Path
+) -> None:
+    mock_urlopen.side_effect = HTTPError("url", 304, "Not Modified", {}, None)  # type: ignore[arg-type]
+    with pytest.raises(HTTPError):
+        _get_release_assets((24, 1, 0), release_cache_root)
+
+
+@patch("idfkit.download.urlopen")
+def test_get_release_assets_unwritable_cache_is_logged(
+    mock_urlopen: MagicMock, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    resp = _mock_urlopen_response(json.dumps({"assets": []}).encode())
+    resp.headers = {"ETag": '"abc123"'}
+    mock_urlopen.return_value = resp
+    blocker = tmp_path / "schemas"
+    blocker.write_text("not a directory")
+
+    with caplog.at_level(logging.DEBUG, logger="idfkit.download"):
+        assert _get_release_assets((24, 1, 0), blocker) == []
+
+    assert "Could not cache release info for v24.1.0" in caplog.text
+
+
 # ---------------------------------------------------------------------------
 # _find_linux_tarball_url
 # ---------------------------------------------------------------------------
@@ -105,24 +167,114 @@ def test_find_linux_tarball_url_empty() -> None:
 
 
 # ---------------------------------------------------------------------------
-# _extract_schema_from_tarball
+# _download_schema_from_tarball
+# ---------------------------------------------------------------------------
+
+
+def _ranged_urlopen(payload: bytes, requested: list[str]) -> Any:
+    """Build a fake ``urlopen`` that serves *payload* honoring ``Range`` headers."""
+
+    def _urlopen(req: Any, timeout: float = 0) -> MagicMock:
+        spec: str = req.get_header("Range")
+        requested.append(spec)
+        lo_s, hi_s = spec.removeprefix("bytes=").split("-")
+        lo, hi = int(lo_s), int(hi_s)
+        resp = _mock_urlopen_response(payload[lo : hi + 1])
+        resp.status = 206
+        resp.headers = {"Content-Range": f"bytes {lo}-{hi}/{len(payload)}"}
+        return resp
+
+    return _urlopen
+
+
+def test_download_schema_from_tarball_parallel_ranges(monkeypatch: pytest.MonkeyPatch) -> None:
+    content = b'{"epJSON_schema_version": "24.1.0"}' * 200
+    payload = _make_tarball_bytes(content)
+    requested: list[str] = []
+    monkeypatch.setattr("idfkit.download._MIN_CHUNK_SIZE", 64)
+    monkeypatch.setattr("idfkit.download.urlopen", _ranged_urlopen(payload, requested))
+
+    assert _download_schema_from_tarball("https://example.com/linux.tar.gz") == content
+    # One probe plus one request per chunk, capped at the worker count.
+    assert requested[0] == "bytes=0-0"
+    assert len(requested) == 1 + min(8, len(payload) // 64)
+
+
+@patch("idfkit.download.urlopen")
+def test_download_schema_from_tarball_streams_without_range_support(mock_urlopen: MagicMock) -> None:
+    content = b'{"epJSON_schema_version": "24.1.0"}'
+    resp = _mock_urlopen_response(_make_tarball_bytes(content))
+    resp.status = 200
+    mock_urlopen.return_value = resp
+
+    assert _download_schema_from_tarball("https://example.com/linux.tar.gz") == content
+    assert mock_urlopen.call_count == 1
+
+
+def test_download_ranges_yields_chunks_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = bytes(range(256)) * 16
+    monkeypatch.setattr("idfkit.download._MIN_CHUNK_SIZE", 512)
+    monkeypatch.setattr("idfkit.download.urlopen", _ranged_urlopen(payload, []))
+
+    chunks = list(_download_ranges("https://example.com/linux.tar.gz", len(payload)))
+    assert len(chunks) == 8
+    assert b"".join(chunks) == payload
+    reader = io.BufferedReader(_ChunkStream(iter(chunks)), buffer_size=100)
+    assert reader.read() == payload
+
+
+def test_download_schema_from_tarball_rejects_ignored_range(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = b"x" * 4096
+    calls: list[str] = []
+    serve = _ranged_urlopen(payload, calls)
+
+    def _urlopen(req: Any, timeout: float = 0) -> MagicMock:
+        resp = serve(req, timeout)
+        if len(calls) > 1:
+            resp.status = 200
+        return resp
+
+    monkeypatch.setattr("idfkit.download._MIN_CHUNK_SIZE", 1024)
+    monkeypatch.setattr("idfkit.download.urlopen", _urlopen)
+    with pytest.raises(URLError, match="did not honor byte range"):
+        _download_schema_from_tarball("https://example.com/linux.tar.gz")
+
+
+# ---------------------------------------------------------------------------
+# _scan_tarball_for_schema
 # ---------------------------------------------------------------------------
 
 
-def test_extract_schema_from_tarball_success() -> None:
+def test_scan_tarball_for_schema_success() -> None:
     content = b'{"epJSON_schema_version": "24.1.0"}'
     tarball = _make_tarball_bytes(content)
-    result = _extract_schema_from_tarball(tarball)
+    result = _scan_tarball_for_schema(io.BytesIO(tarball))
     assert result == content
 
 
-def test_extract_schema_from_tarball_no_match() -> None:
+def test_scan_tarball_for_schema_no_match() -> None:
     tarball = _make_tarball_bytes(b"data", member_name="other/file.txt")
-    result = _extract_schema_from_tarball(tarball)
+    result = _scan_tarball_for_schema(io.BytesIO(tarball))
     assert result is None
 
 
-def test_extract_schema_from_tarball_directory_member() -> None:
+def test_scan_tarball_for_schema_stops_at_first_match() -> None:
+    """Members after the schema are never read from the stream."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name, data in [
+            ("EnergyPlus/Energy+.schema.epJSON", b"schema"),
+            ("EnergyPlus/big.bin", os.urandom(1 << 20)),
+        ]:
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    stream = io.BytesIO(buf.getvalue())
+    assert _scan_tarball_for_schema(stream) == b"schema"
+    assert stream.tell() < len(buf.getvalue())
+
+
+def test_scan_tarball_for_schema_directory_member() -> None:
     """A directory member ending with the schema filename but not extractable returns None."""
     buf = io.BytesIO()
     with tarfile.open(fileobj=buf, mode="w:gz") as tar:
@@ -130,7 +282,7 @@ def test_extract_schema_from_tarball_directory_member() -> None:
         info = tarfile.TarInfo(name="EnergyPlus/Energy+.schema.epJSON")
         info.type = tarfile.DIRTYPE
         tar.addfile(info)
-    result = _extract_schema_from_tarball(buf.getvalue())
+    result = _scan_tarball_for_schema(io.BytesIO(buf.getvalue()))
     assert result is None
 
 
@@ -262,6 +414,8 @@ def test_download_schema_success_uncompressed(mock_assets: MagicMock, mock_urlop
     assert result.name == _SCHEMA_FILENAME
     assert result.exists()
     assert result.read_bytes() == schema_content
+    # The release cache lives under the caller's schema directory.
+    mock_assets.assert_called_once_with((24, 1, 0), tmp_path)
 
 
 @patch("idfkit.download.urlopen")
@@ -279,6 +433,7 @@ def test_download_schema_default_target_dir(mock_assets: MagicMock, mock_urlopen
 
     assert fake_home / ".idfkit" / "schemas" / "V24-1-0" / _SCHEMA_FILENAME_GZ == result
     assert result.exists()
+    mock_assets.assert_called_once_with((24, 1, 0), fake_home / ".idfkit" / "schemas")
 
 
 # ---------------------------------------------------------------------------
@@ -10,6 +10,7 @@ from idfkit import IDFDocument, new_document
 from idfkit.geometry import (
     Polygon3D,
     Vector3D,
+    _flat_vertex_keys,  # pyright: ignore[reportPrivateUsage]
     _inset_polygon,  # pyright: ignore[reportPrivateUsage]
     _orientation_to_azimuth,  # pyright: ignore[reportPrivateUsage]
     _point_in_polygon_2d,  # pyright: ignore[reportPrivateUsage]
@@ -17,6 +18,7 @@ from idfkit.geometry import (
     _wall_matches,  # pyright: ignore[reportPrivateUsage]
     calculate_surface_area,
     calculate_surface_azimuth,
+    calculate_surface_azimuths,
     calculate_surface_tilt,
     calculate_zone_ceiling_area,
     calculate_zone_floor_area,
@@ -25,6 +27,7 @@ from idfkit.geometry import (
     get_surface_coords,
     get_zone_origin,
     get_zone_rotation,
+    group_surfaces_by_zone,
     intersect_match,
     is_convex_2d,
     line_intersect_2d,
@@ -35,6 +38,7 @@ from idfkit.geometry import (
     rotate_building,
     set_surface_coords,
     set_wwr,
+    transform_surface_vertices,
     translate_building,
     translate_to_world,
 )
@@ -279,6 +283,50 @@ class TestPolygon3D:
         assert _close(rotated.vertices[0].x, 0.0, 1e-10)
         assert _close(rotated.vertices[0].y, 1.0)
 
+    def test_rotate_z_whole_turn_is_copy(self, unit_square: Polygon3D) -> None:
+        rotated = unit_square.rotate_z(360.0)
+        assert rotated is not unit_square
+        assert rotated.vertices == unit_square.vertices
+
+    def test_rotate_z_matches_vector_rotation(self) -> None:
+        poly = Polygon3D([Vector3D(1.3, -2.7, 0.1), Vector3D(7.9, 0.4, 2.2), Vector3D(-3.1, 5.5, 3.3)])
+        anchor = Vector3D(0.7, 1.9, 0.3)
+        rotated = poly.rotate_z(33.3, anchor=anchor)
+        assert rotated.vertices == [(v - anchor).rotate_z(33.3) + anchor for v in poly.vertices]
+
+    def test_orientation_tracks_in_place_vertex_edits(self, unit_square: Polygon3D) -> None:
+        assert unit_square.normal == Vector3D(0.0, 0.0, 1.0)
+        assert unit_square.tilt == 0.0
+        unit_square.vertices.reverse()
+        assert unit_square.normal == Vector3D(0.0, 0.0, -1.0)
+        assert unit_square.tilt == 180.0
+        assert unit_square.is_horizontal
+
+        # Lifting one vertex of a floor triangle stands it up as a south-facing wall.
+        tri = Polygon3D([Vector3D(0, 0, 0), Vector3D(1, 0, 0), Vector3D(0, 1, 0)])
+        assert tri.is_horizontal
+        tri.vertices[2] = Vector3D(0, 0, 1)
+        assert tri.normal == Vector3D(0.0, -1.0, 0.0)
+        assert tri.is_vertical
+        assert tri.tilt == 90.0
+        assert tri.azimuth == 180.0
+
+    def test_degenerate_polygon_orientation(self) -> None:
+        """A collinear polygon has a zero normal and classifies as vertical, tilt 90."""
+        line = Polygon3D([Vector3D(0, 0, 0), Vector3D(1, 1, 1), Vector3D(2, 2, 2)])
+        assert line.normal == Vector3D(0, 0, 0)
+        assert line.tilt == 90.0
+        assert line.is_vertical
+        assert not line.is_horizontal
+
+    def test_affine_z_matches_rotate_then_translate(self) -> None:
+        poly = Polygon3D([Vector3D(1.3, -2.7, 0.1), Vector3D(7.9, 0.4, 2.2), Vector3D(-3.1, 5.5, 3.3)])
+        anchor = poly.centroid
+        offset = Vector3D(4.2, -1.1, 2.5)
+        rad = math.radians(-71.0)
+        moved = poly.affine_z(math.cos(rad), math.sin(rad), offset, anchor=anchor)
+        assert moved.vertices == poly.rotate_z(-71.0, anchor=anchor).translate(offset).vertices
+
     def test_as_tuple_list(self, unit_square: Polygon3D) -> None:
         tuples = unit_square.as_tuple_list()
         assert tuples == [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]
@@ -315,6 +363,41 @@ class TestSurfaceGeometryUtils:
         assert poly.num_vertices == 4
         assert _close(poly.area, 30.0)
 
+    def test_get_surface_coords_cache_invalidated_on_mutation(self) -> None:
+        """Cached coordinates are reused until the surface is modified."""
+        doc = new_document(version=(24, 1, 0))
+        surface = doc.add(
+            "BuildingSurface:Detailed",
+            "Wall",
+            {
+                "surface_type": "Floor",
+                "outside_boundary_condition": "Ground",
+                "vertices": [
+                    {"vertex_x_coordinate": 0.0, "vertex_y_coordinate": 0.0, "vertex_z_coordinate": 0.0},
+                    {"vertex_x_coordinate": 1.0, "vertex_y_coordinate": 0.0, "vertex_z_coordinate": 0.0},
+                    {"vertex_x_coordinate": 1.0, "vertex_y_coordinate": 1.0, "vertex_z_coordinate": 0.0},
+                ],
+            },
+            validate=False,
+        )
+        first = get_surface_coords(surface)
+        assert first is not None
+        first.vertices.clear()  # callers get their own copy
+        again = get_surface_coords(surface)
+        assert again is not None
+        assert again.num_vertices == 3
+
+        set_surface_coords(surface, Polygon3D.from_tuples([(0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0)]))
+        updated = get_surface_coords(surface)
+        assert updated is not None
+        assert updated.num_vertices == 4
+        assert _close(updated.area, 4.0)
+
+        surface.vertices[0].vertex_x_coordinate = -2.0
+        moved = get_surface_coords(surface)
+        assert moved is not None
+        assert moved.vertices[0].x == -2.0
+
     def test_get_surface_coords_autodetect_vertices(self) -> None:
         """Test that vertices are autodetected when number_of_vertices is missing."""
         surface = IDFObject(
@@ -585,6 +668,33 @@ class TestTranslateToWorld:
         translate_to_world(simple_doc)
         assert wall.vertices[0].vertex_x_coordinate == orig_x
 
+    def test_identity_zone_surfaces_untouched(self) -> None:
+        """Zones with zero origin and rotation leave their surfaces unmodified."""
+        doc = new_document(version=(24, 1, 0))
+        rules = doc["GlobalGeometryRules"].first()
+        assert rules is not None
+        rules.coordinate_system = "Relative"
+        doc.add("Zone", "Core", {})
+        wall = doc.add(
+            "BuildingSurface:Detailed",
+            "CoreWall",
+            {
+                "surface_type": "Wall",
+                "zone_name": "Core",
+                "outside_boundary_condition": "Outdoors",
+                "vertices": [
+                    {"vertex_x_coordinate": 0.0, "vertex_y_coordinate": 0.0, "vertex_z_coordinate": 3.0},
+                    {"vertex_x_coordinate": 0.0, "vertex_y_coordinate": 0.0, "vertex_z_coordinate": 0.0},
+                    {"vertex_x_coordinate": 5.0, "vertex_y_coordinate": 0.0, "vertex_z_coordinate": 0.0},
+                ],
+            },
+            validate=False,
+        )
+        version = wall.mutation_version
+        translate_to_world(doc)
+        assert wall.mutation_version == version
+        assert rules.coordinate_system == "World"
+
     def test_relative_coordinates_with_zone_origin(self) -> None:
         """Translate relative coordinates with zone origin offset."""
         doc = new_document(version=(24, 1, 0))
@@ -1825,6 +1935,35 @@ class TestSurfaceTiltAzimuth:
         surface = IDFObject(obj_type="BuildingSurface:Detailed", name="Empty", data={})
         assert calculate_surface_azimuth(surface) == 0.0
 
+    def test_calculate_surface_azimuths_matches_per_surface(self) -> None:
+        doc = new_document(version=(24, 1, 0))
+        rings = {
+            "South": [(0, 0, 3), (0, 0, 0), (10, 0, 0), (10, 0, 3)],
+            "Skewed": [(0, 0, 0), (3.3, 1.7, 0), (3.3, 1.7, 2.5), (0, 0, 2.5)],
+            "Floor": [(0, 0, 0), (0, 5, 0), (5, 5, 0), (5, 0, 0)],
+            "Line": [(0, 0, 0), (1, 0, 0)],
+        }
+        for name, ring in rings.items():
+            doc.add(
+                "BuildingSurface:Detailed",
+                name,
+                {
+                    "surface_type": "Wall",
+                    "outside_boundary_condition": "Outdoors",
+                    "vertices": [
+                        {"vertex_x_coordinate": x, "vertex_y_coordinate": y, "vertex_z_coordinate": z}
+                        for x, y, z in ring
+                    ],
+                },
+                validate=False,
+            )
+        azimuths = calculate_surface_azimuths(doc)
+        assert azimuths == {
+            srf.name: calculate_surface_azimuth(srf) for srf in doc.get_collection("BuildingSurface:Detailed")
+        }
+        assert azimuths["South"] == 180.0
+        assert azimuths["Line"] == 0.0
+
 
 # ---------------------------------------------------------------------------
 # Zone floor area with different zone name
@@ -1857,6 +1996,89 @@ class TestZoneFloorAreaWrongZone:
         # Zone B has no surfaces, but zone A's floor exists
         assert calculate_zone_floor_area(doc, "B") == 0.0
 
+    def test_floor_area_follows_zone_reassignment(self) -> None:
+        """Zone lookups track zone_name edits and ignore other fields naming the zone."""
+        doc = new_document(version=(24, 1, 0))
+        doc.add("Zone", "A", {})
+        doc.add("Zone", "B", {})
+        floor = doc.add(
+            "BuildingSurface:Detailed",
+            "FloorA",
+            {
+                "surface_type": "Floor",
+                "zone_name": "A",
+                "outside_boundary_condition": "Zone",
+                "outside_boundary_condition_object": "B",
+                "vertices": [
+                    {"vertex_x_coordinate": 0, "vertex_y_coordinate": 0, "vertex_z_coordinate": 0},
+                    {"vertex_x_coordinate": 10, "vertex_y_coordinate": 0, "vertex_z_coordinate": 0},
+                    {"vertex_x_coordinate": 10, "vertex_y_coordinate": 10, "vertex_z_coordinate": 0},
+                    {"vertex_x_coordinate": 0, "vertex_y_coordinate": 10, "vertex_z_coordinate": 0},
+                ],
+            },
+            validate=False,
+        )
+        assert calculate_zone_floor_area(doc, "a") == pytest.approx(100.0)
+        assert calculate_zone_floor_area(doc, "B") == 0.0
+        floor.zone_name = "B"
+        assert calculate_zone_floor_area(doc, "A") == 0.0
+        assert calculate_zone_floor_area(doc, "B") == pytest.approx(100.0)
+
+    def test_zone_totals_survive_zone_remove_and_readd(self) -> None:
+        """Removing and re-adding the Zone object does not detach its surfaces."""
+        doc = new_document(version=(24, 1, 0))
+        doc.add("Zone", "Office", {})
+        square = [
+            {"vertex_x_coordinate": 0, "vertex_y_coordinate": 0, "vertex_z_coordinate": 0},
+            {"vertex_x_coordinate": 5, "vertex_y_coordinate": 0, "vertex_z_coordinate": 0},
+            {"vertex_x_coordinate": 5, "vertex_y_coordinate": 4, "vertex_z_coordinate": 0},
+            {"vertex_x_coordinate": 0, "vertex_y_coordinate": 4, "vertex_z_coordinate": 0},
+        ]
+        doc.add(
+            "BuildingSurface:Detailed",
+            "Floor",
+            {"surface_type": "Floor", "zone_name": "Office", "vertices": square},
+            validate=False,
+        )
+        assert calculate_zone_floor_area(doc, "Office") == pytest.approx(20.0)
+
+        doc.removeidfobject(doc["Zone"]["Office"])
+        assert calculate_zone_floor_area(doc, "Office") == pytest.approx(20.0)
+        doc.add("Zone", "Office", {})
+        assert calculate_zone_floor_area(doc, "Office") == pytest.approx(20.0)
+
+    def test_precomputed_surface_index(self) -> None:
+        """Zone totals read from group_surfaces_by_zone match the scanning path."""
+        doc = new_document(version=(24, 1, 0))
+        for zone, x0 in (("A", 0), ("B", 10)):
+            doc.add("Zone", zone, {})
+            for name, stype, z in (("Floor", "Floor", 0), ("Roof", "Roof", 3)):
+                doc.add(
+                    "BuildingSurface:Detailed",
+                    f"{zone}_{name}",
+                    {
+                        "surface_type": stype,
+                        "zone_name": zone.lower(),
+                        "vertices": [
+                            {"vertex_x_coordinate": x0, "vertex_y_coordinate": 0, "vertex_z_coordinate": z},
+                            {"vertex_x_coordinate": x0 + 4, "vertex_y_coordinate": 0, "vertex_z_coordinate": z},
+                            {"vertex_x_coordinate": x0 + 4, "vertex_y_coordinate": 5, "vertex_z_coordinate": z},
+                        ],
+                    },
+                    validate=False,
+                )
+        index = group_surfaces_by_zone(doc)
+        assert sorted(index) == ["A", "B"]
+        assert [s.name for s in index["A"]] == ["A_Floor", "A_Roof"]
+        for zone in ("A", "B", "Missing"):
+            for fn in (
+                calculate_zone_floor_area,
+                calculate_zone_ceiling_area,
+                calculate_zone_height,
+                calculate_zone_volume,
+            ):
+                assert fn(doc, zone, surfaces_by_zone=index) == fn(doc, zone)
+
 
 # ---------------------------------------------------------------------------
 # Zone height with surface in wrong zone
@@ -2015,6 +2237,104 @@ class TestTranslateRotateBuildingWithSurfaces:
         # After 90-degree rotation: vertex 3 was (10, 0, 0), should be (0, 10, 0)
         assert wall.vertices[2].vertex_y_coordinate == pytest.approx(10.0)
 
+    def test_rotate_building_matches_polygon_rotate_z(self) -> None:
+        """rotate_building gives exactly the same coordinates as Polygon3D.rotate_z."""
+        doc = new_document(version=(24, 1, 0))
+        wall = doc.add(
+            "BuildingSurface:Detailed",
+            "W1",
+            {
+                "surface_type": "Wall",
+                "outside_boundary_condition": "Outdoors",
+                "number_of_vertices": 3,
+                "vertices": [
+                    {"vertex_x_coordinate": 1.3, "vertex_y_coordinate": -2.7, "vertex_z_coordinate": 0.1},
+                    {"vertex_x_coordinate": 7.9, "vertex_y_coordinate": 0.4, "vertex_z_coordinate": 2.2},
+                    {"vertex_x_coordinate": -3.1, "vertex_y_coordinate": 5.5, "vertex_z_coordinate": 3.3},
+                ],
+            },
+            validate=False,
+        )
+        before = get_surface_coords(wall)
+        assert before is not None
+        anchor = Vector3D(0.7, 1.9, 0.3)
+        rotate_building(doc, 33.3, anchor=anchor)
+        after = get_surface_coords(wall)
+        assert after is not None
+        assert after.as_tuple_list() == before.rotate_z(33.3, anchor=anchor).as_tuple_list()
+
+    def test_identity_transforms_leave_surfaces_untouched(self) -> None:
+        """Zero offsets and whole-turn rotations do not rewrite any surface."""
+        doc = new_document(version=(24, 1, 0))
+        wall = doc.add(
+            "BuildingSurface:Detailed",
+            "W1",
+            {
+                "surface_type": "Wall",
+                "outside_boundary_condition": "Outdoors",
+                "vertices": [
+                    {"vertex_x_coordinate": 0.0, "vertex_y_coordinate": 0.0, "vertex_z_coordinate": 0.0},
+                    {"vertex_x_coordinate": 1.0, "vertex_y_coordinate": 0.0, "vertex_z_coordinate": 0.0},
+                    {"vertex_x_coordinate": 1.0, "vertex_y_coordinate": 0.0, "vertex_z_coordinate": 1.0},
+                ],
+            },
+            validate=False,
+        )
+        version = wall.mutation_version
+        translate_building(doc, Vector3D.origin())
+        rotate_building(doc, 0.0)
+        rotate_building(doc, -720.0, anchor=Vector3D(5, 5, 0))
+        assert wall.mutation_version == version
+
+    def test_transform_surface_vertices_covers_flat_and_wrapper_surfaces(self) -> None:
+        """transform_surface_vertices rewrites both wrapper and flat-field vertex storage."""
+        doc = new_document(version=(24, 1, 0))
+        wall = doc.add(
+            "BuildingSurface:Detailed",
+            "W1",
+            {
+                "surface_type": "Wall",
+                "outside_boundary_condition": "Outdoors",
+                "number_of_vertices": 3,
+                "vertices": [
+                    {"vertex_x_coordinate": 0.0, "vertex_y_coordinate": 0.0, "vertex_z_coordinate": 0.0},
+                    {"vertex_x_coordinate": 1.0, "vertex_y_coordinate": 0.0, "vertex_z_coordinate": 0.0},
+                    {"vertex_x_coordinate": 1.0, "vertex_y_coordinate": 0.0, "vertex_z_coordinate": 1.0},
+                ],
+            },
+            validate=False,
+        )
+        win = doc.add(
+            "FenestrationSurface:Detailed",
+            "Win1",
+            surface_type="Window",
+            building_surface_name="W1",
+            number_of_vertices=3,
+            vertex_1_x_coordinate=0.2,
+            vertex_1_y_coordinate=0.0,
+            vertex_1_z_coordinate=0.2,
+            vertex_2_x_coordinate=0.8,
+            vertex_2_y_coordinate=0.0,
+            vertex_2_z_coordinate=0.2,
+            vertex_3_x_coordinate=0.8,
+            vertex_3_y_coordinate=0.0,
+            vertex_3_z_coordinate=0.8,
+            validate=False,
+        )
+        transform_surface_vertices(doc, lambda pts: [(x, y + 5.0, z) for x, y, z in pts[:3]])
+        wall_coords = get_surface_coords(wall)
+        assert wall_coords is not None
+        assert [v.y for v in wall_coords.vertices] == [5.0, 5.0, 5.0]
+        assert win.data["vertex_3_y_coordinate"] == 5.0
+        assert "vertices" not in win.data
+
+    def test_flat_vertex_keys_extend_past_precomputed_table(self) -> None:
+        """Flat field names are generated on demand beyond the precomputed 120 vertices."""
+        keys = _flat_vertex_keys(122)
+        assert len(keys) == 122
+        assert keys[0] == ("vertex_1_x_coordinate", "vertex_1_y_coordinate", "vertex_1_z_coordinate")
+        assert keys[121] == ("vertex_122_x_coordinate", "vertex_122_y_coordinate", "vertex_122_z_coordinate")
+
 
 # ---------------------------------------------------------------------------
 # _wall_matches azimuth > 180 difference wraps around
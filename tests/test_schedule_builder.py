@@ -9,6 +9,7 @@ import pytest
 from idfkit import new_document
 from idfkit.schedules import values
 from idfkit.schedules.builder import (
+    _format_value,  # pyright: ignore[reportPrivateUsage]
     create_compact_schedule_from_values,
     create_constant_schedule,
     create_schedule_type_limits,
@@ -62,6 +63,12 @@ class TestCreateConstantSchedule:
         assert all(abs(v - 0.5) < _TOL for v in hourly)
 
 
+class TestFormatValue:
+    @pytest.mark.parametrize("value", [0.0, -0.0, 1.0, 1, -100.0, 100.0, 101.0, 0.5, 1e20, float("inf"), float("nan")])
+    def test_matches_general_format(self, value: float) -> None:
+        assert _format_value(value) == f"{value:.15g}"
+
+
 class TestCreateCompactScheduleFromValues:
     def test_constant_8760(self) -> None:
         """All same value produces a compact schedule with minimal fields."""
@@ -76,6 +83,12 @@ class TestCreateCompactScheduleFromValues:
         assert items[2].field == "Until: 24:00"
         assert items[3].field == "0.75"
 
+    def test_constant_nan_is_not_merged(self) -> None:
+        """NaN never equals itself, so a NaN year is not taken as constant."""
+        doc = new_document()
+        obj = create_compact_schedule_from_values(doc, "NaN", [float("nan")] * 8760, year=2023)
+        assert len(obj["data"]) > 4
+
     def test_binary_on_off(self) -> None:
         """Daytime on / nighttime off pattern compresses Until blocks."""
         doc = new_document()
@@ -111,6 +124,54 @@ class TestCreateCompactScheduleFromValues:
         assert items[0].field == "Through: 1/31"
         assert items[4].field == "Through: 12/31"
 
+    def test_days_within_tolerance_are_merged(self) -> None:
+        """Days differing by less than the tolerance share the first day's block."""
+        doc = new_document()
+        vals = [1.0] * 24 + [1.0 + 1e-9] * 24 * 364
+        obj = create_compact_schedule_from_values(doc, "Near", vals, year=2023)
+        assert [item.field for item in obj["data"]] == ["Through: 12/31", "For: AllDays", "Until: 24:00", "1"]
+
+        obj = create_compact_schedule_from_values(doc, "Far", vals, year=2023, tolerance=1e-12)
+        assert obj["data"][0].field == "Through: 1/1"
+
+    def test_repeated_profiles_in_separate_blocks(self) -> None:
+        """Non-adjacent blocks with the same profile emit the same Until fields."""
+        doc = new_document()
+        on = [0.0] * 8 + [1.0] * 10 + [0.0] * 6
+        off = [0.0] * 24
+        vals = (on * 5 + off * 2) * 52 + on
+        obj = create_compact_schedule_from_values(doc, "Weekly", vals, year=2023)
+        fields = [item.field for item in obj["data"]]
+        assert fields[:14] == [
+            "Through: 1/5",
+            "For: AllDays",
+            "Until: 08:00",
+            "0",
+            "Until: 18:00",
+            "1",
+            "Until: 24:00",
+            "0",
+            "Through: 1/7",
+            "For: AllDays",
+            "Until: 24:00",
+            "0",
+            "Through: 1/12",
+            "For: AllDays",
+        ]
+        # Day 365 is a lone "on" day after the last "off" pair.
+        assert fields[-8:] == ["Through: 12/31", "For: AllDays", *fields[2:8]]
+
+    def test_infinite_values_do_not_break_grouping(self) -> None:
+        """Days holding infinities are compared hour by hour (inf - inf is NaN, so they never merge)."""
+        doc = new_document()
+        inf = float("inf")
+        vals = [inf, -inf] + [0.0] * 22 + [inf, -inf] + [1e-9] * 22 + [0.0] * 24 * 363
+        obj = create_compact_schedule_from_values(doc, "Inf", vals, year=2023)
+        fields = [item.field for item in obj["data"]]
+        assert fields[:4] == ["Through: 1/1", "For: AllDays", "Until: 01:00", "inf"]
+        assert fields[8:10] == ["Through: 1/2", "For: AllDays"]
+        assert fields[-4:] == ["Through: 12/31", "For: AllDays", "Until: 24:00", "0"]
+
     def test_unique_daily_profiles(self) -> None:
         """Each day having a unique profile produces 365 Through blocks.
 